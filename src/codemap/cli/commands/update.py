@@ -1,6 +1,8 @@
 """CLI update command for ContextCurator."""
 
+import contextlib
 import json
+import sqlite3
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
@@ -12,6 +14,7 @@ from filelock import FileLock, Timeout
 from codemap.engine.change_detector import ChangeDetector
 from codemap.engine.graph_updater import GraphUpdater
 from codemap.graph import GraphManager
+from codemap.mapper.cache import ParseCache
 from codemap.mapper.engine import ParserEngine
 from codemap.mapper.reader import ContentReader
 
@@ -41,6 +44,32 @@ def _load_metadata(codemap_path: Path) -> dict[str, Any]:
     return {}
 
 
+def _open_parse_cache(cache_path: Path) -> ParseCache | None:
+    """Open the parse cache, recovering from an unusable database file.
+
+    A corrupt cache file is deleted and recreated. If the database still
+    cannot be opened (e.g. it is locked by another process), a warning is
+    printed and None is returned so the update runs without a cache.
+
+    Args:
+        cache_path: Path to parse_cache.sqlite.
+
+    Returns:
+        Open ParseCache, or None if the cache is unavailable.
+    """
+    try:
+        return ParseCache(cache_path)
+    except sqlite3.DatabaseError:
+        pass
+    try:
+        for stale in (cache_path, Path(f"{cache_path}-wal"), Path(f"{cache_path}-shm")):
+            stale.unlink(missing_ok=True)
+        return ParseCache(cache_path)
+    except (OSError, sqlite3.DatabaseError) as e:
+        typer.echo(f"Warning: parse cache unavailable, updating without it. {e}", err=True)
+        return None
+
+
 def _save_metadata(codemap_path: Path, project_root: Path, graph_manager: GraphManager) -> None:
     """Save updated build metadata to metadata.json.
 
@@ -122,9 +151,18 @@ def update_command(
             graph_manager.build_metadata.update(metadata)
 
             detector = ChangeDetector(graph_manager)
-            updater = GraphUpdater(graph_manager, detector, ParserEngine(), ContentReader())
-
-            changes = updater.update(Path.cwd())
+            parse_cache = _open_parse_cache(codemap_path / "parse_cache.sqlite")
+            with parse_cache if parse_cache is not None else contextlib.nullcontext():
+                updater = GraphUpdater(
+                    graph_manager,
+                    detector,
+                    ParserEngine(),
+                    ContentReader(),
+                    parse_cache=parse_cache,
+                    # One update per process: cached trees would never be reused
+                    tree_cache_size=0,
+                )
+                changes = updater.update(Path.cwd())
 
             graph_manager.save(codemap_path / "graph.json")
 
@@ -20,13 +20,18 @@ Typical Usage:
 """
 
 import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from codemap.graph import GraphManager
 from codemap.mapper.engine import ParserEngine
 from codemap.mapper.reader import ContentReader, ContentReadError
 from codemap.scout.walker import FileWalker
 
+if TYPE_CHECKING:
+    from codemap.mapper.models import CodeNode
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,9 +109,9 @@ class MapBuilder:
 
         Orchestrates the complete workflow:
         1. Walk directory with FileWalker to discover files
-        2. Add file nodes to graph via GraphManager.add_file()
+        2. Add file nodes to graph via GraphManager.add_files_bulk()
         3. Read and parse each file with ParserEngine
-        4. Add code nodes via GraphManager.add_node()
+        4. Add code nodes via GraphManager.add_nodes_bulk()
         5. Resolve import dependencies and add IMPORTS edges
 
         Each call to build() reinitializes the internal GraphManager to ensure
@@ -150,8 +155,7 @@ class MapBuilder:
         entries = self._walker.walk(root)
 
         # Step 2: Add file nodes to graph
-        for entry in entries:
-            self._graph.add_file(entry)
+        self._graph.add_files_bulk(entries)
 
         # Step 3-5: Process each file
         for entry in entries:
@@ -178,6 +182,7 @@ class MapBuilder:
 
             # Track imports for this file
             imports: list[str] = []
+            symbols: list[CodeNode] = []
 
             # Add code nodes and collect imports
             for node in code_nodes:
@@ -185,8 +190,10 @@ class MapBuilder:
                     # Collect import module names for dependency resolution
                     imports.append(node.name)
                 else:
-                    # Add function/class nodes with CONTAINS edge
-                    self._graph.add_node(file_id, node)
+                    symbols.append(node)
+
+            # Add function/class nodes with CONTAINS edges in one pass
+            self._graph.add_nodes_bulk(file_id, symbols)
 
             # Step 5: Resolve imports and add IMPORTS edges
             for module_name in imports:
@@ -248,33 +255,36 @@ class MapBuilder:
         """
         # Normalize source_file to string for graph node ID (relative path)
         source_file_id = str(source_file)
+        nodes = self._graph.graph.nodes
+
+        # Candidate IDs are built as strings (joined with os.sep to match
+        # str(Path) node IDs) instead of constructing Path objects per import
+        parent = str(source_file.parent)
+        dir_prefix = "" if parent == "." else f"{parent}{os.sep}"
+        dotted = import_name.replace(".", os.sep)
 
         # Strategy 1: Simple name in same directory (e.g., "utils" -> "utils.py")
-        same_dir_path = source_file.parent / f"{import_name}.py"
-        same_dir_id = str(same_dir_path)
-        if same_dir_id in self._graph.graph.nodes:
+        same_dir_id = f"{dir_prefix}{import_name}.py"
+        if same_dir_id in nodes:
             self._graph.add_dependency(source_file_id, same_dir_id)
             return
 
         # Strategy 2: Dotted name as path (e.g., "a.b.c" -> "a/b/c.py")
-        dotted_path = Path(import_name.replace(".", "/")).with_suffix(".py")
-        dotted_id = str(dotted_path)
-        if dotted_id in self._graph.graph.nodes:
+        dotted_id = f"{dotted}.py"
+        if dotted_id in nodes:
             self._graph.add_dependency(source_file_id, dotted_id)
             return
 
         # Strategy 3: Package import with __init__.py (e.g., "pkg" -> "pkg/__init__.py")
         # Try same directory first
-        package_init_same_dir = source_file.parent / import_name / "__init__.py"
-        package_same_dir_id = str(package_init_same_dir)
-        if package_same_dir_id in self._graph.graph.nodes:
+        package_same_dir_id = f"{dir_prefix}{import_name}{os.sep}__init__.py"
+        if package_same_dir_id in nodes:
             self._graph.add_dependency(source_file_id, package_same_dir_id)
             return
 
         # Try from root for dotted package names
-        package_init_root = Path(import_name.replace(".", "/")) / "__init__.py"
-        package_root_id = str(package_init_root)
-        if package_root_id in self._graph.graph.nodes:
+        package_root_id = f"{dotted}{os.sep}__init__.py"
+        if package_root_id in nodes:
             self._graph.add_dependency(source_file_id, package_root_id)
             return
 
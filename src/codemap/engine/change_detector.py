@@ -27,12 +27,17 @@ class ChangeSet:
         added: New files not in previous build.
         deleted: Files that no longer exist.
         base_commit: Git commit hash of the comparison base.
+        current_hashes: SHA-256 hashes of all scanned files, keyed by
+            relative path, when detection hashed them (hash strategy);
+            None for Git-based detection. Lets the metadata update reuse
+            them instead of hashing the files again.
     """
 
     modified: list[Path] = field(default_factory=list)
     added: list[Path] = field(default_factory=list)
     deleted: list[Path] = field(default_factory=list)
     base_commit: str | None = None
+    current_hashes: dict[str, str] | None = field(default=None, compare=False, repr=False)
 
     @property
     def is_empty(self) -> bool:
@@ -158,17 +163,18 @@ class ChangeDetector:
             file_pattern: Glob pattern for files to scan (default: "*.py").
 
         Returns:
-            ChangeSet with added/modified/deleted files based on hash comparison.
+            ChangeSet with added/modified/deleted files based on hash comparison,
+            carrying the computed hashes in current_hashes.
         """
-        changes = ChangeSet()
-        current_files: set[str] = set()
+        current_hashes: dict[str, str] = {}
+        changes = ChangeSet(current_hashes=current_hashes)
 
         # Walk directory and compare hashes
         for file_path in root.rglob(file_pattern):
             rel_path = str(file_path.relative_to(root))
-            current_files.add(rel_path)
 
             current_hash = self._hash_file(file_path)
+            current_hashes[rel_path] = current_hash
             stored_hash = stored_hashes.get(rel_path)
 
             if stored_hash is None:
@@ -178,7 +184,7 @@ class ChangeDetector:
 
         # Find deleted files
         for stored_path in stored_hashes:
-            if stored_path not in current_files:
+            if stored_path not in current_hashes:
                 changes.deleted.append(Path(stored_path))
 
         return changes
@@ -116,7 +116,7 @@ class CuratorAgent:
                     return str(action_data["plan"])
 
                 if action_data["action"] == "tool_call":
-                    tool_result = self._execute_tool(
+                    tool_result = await self._execute_tool(
                         str(action_data["tool"]),
                         action_data.get("args", {}),
                     )
@@ -202,9 +202,12 @@ class CuratorAgent:
 
         return data
 
-    def _execute_tool(self, tool_name: str, args: dict[str, Any]) -> str:
+    async def _execute_tool(self, tool_name: str, args: dict[str, Any]) -> str:
         """Führt Tool aus und gibt Result zurück.
 
+        show_code liest Quelldateien in einem Worker-Thread, damit der
+        Event-Loop nicht blockiert.
+
         Args:
             tool_name: Name des auszuführenden Tools.
             args: Argumente für das Tool.
@@ -246,7 +249,7 @@ class CuratorAgent:
             if not file_path or not symbol_name:
                 msg = "show_code requires 'file_path' and 'symbol_name'"
                 raise ValueError(msg)
-            return self._tools.show_code(str(file_path), str(symbol_name))
+            return await self._tools.ashow_code(str(file_path), str(symbol_name))
 
         msg = f"Unknown tool: {tool_name}"
         raise ValueError(msg)
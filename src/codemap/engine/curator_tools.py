@@ -10,6 +10,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from codemap.engine.map_renderer import MapRenderer
 
 
@@ -18,6 +20,11 @@ class CuratorTools:
 
     Stellt 5 Zoom-Level-Tools bereit, die MapRenderer-Methoden wrappen
     und LLM-freundliche Schnittstellen bieten.
+
+    Ergebnisse von Level 3 und 4 werden bis clear_cache() zwischengespeichert,
+    da der Agent dieselben Symbole oft mehrfach abfragt. Level 0-2 cached
+    bereits der MapRenderer anhand der Graph-Version; clear_cache() leert
+    auch diesen Cache.
     """
 
     def __init__(self, map_renderer: MapRenderer) -> None:
@@ -27,6 +34,30 @@ class CuratorTools:
             map_renderer: MapRenderer-Instanz für Graph-Rendering.
         """
         self._renderer = map_renderer
+        # Gerenderte Symbol-/Code-Ansichten, Schlüssel (tool, *args)
+        self._cache: dict[tuple[str, ...], str] = {}
+
+    def clear_cache(self) -> None:
+        """Verwirft zwischengespeicherte Ansichten aller Zoom-Level.
+
+        Wird zu Beginn jeder Curate-Session aufgerufen, damit geänderte
+        Quelldateien oder Graph-Attribute sichtbar werden. Leert dazu auch
+        den Seiten-Cache des MapRenderer, da direkt geschriebene Attribute
+        die Graph-Version nicht erhöhen.
+        """
+        self._cache.clear()
+        self._renderer.clear_cache()
+
+    def _cached(self, key: tuple[str, ...], render: Callable[[], str]) -> str:
+        """Liefert eine gecachte Ansicht oder rendert und speichert sie.
+
+        Fehlgeschlagene Aufrufe (ValueError) werden nicht gecacht.
+        """
+        result = self._cache.get(key)
+        if result is None:
+            result = render()
+            self._cache[key] = result
+        return result
 
     def get_project_overview(self) -> str:
         """Zeigt die Projektübersicht (Level 0).
@@ -108,7 +139,10 @@ class CuratorTools:
             ValueError: Wenn Symbol nicht gefunden.
         """
         try:
-            return self._renderer.render_symbol(file_path, symbol_name)
+            return self._cached(
+                ("symbol", file_path, symbol_name),
+                lambda: self._renderer.render_symbol(file_path, symbol_name),
+            )
         except ValueError:
             raise ValueError(
                 f"Symbol '{file_path}::{symbol_name}' nicht gefunden"
@@ -131,4 +165,30 @@ class CuratorTools:
             ValueError: Wenn root_path nicht gesetzt, Datei nicht gefunden,
                 Symbol nicht gefunden oder ungültiger Zeilenbereich.
         """
-        return self._renderer.render_code(file_path, symbol_name)
+        return self._cached(
+            ("code", file_path, symbol_name),
+            lambda: self._renderer.render_code(file_path, symbol_name),
+        )
+
+    async def ashow_code(self, file_path: str, symbol_name: str) -> str:
+        """Zeigt den Quellcode (Level 4), ohne den Event-Loop zu blockieren.
+
+        Wie show_code(), liest die Quelldatei aber in einem Worker-Thread.
+        Teilt sich den Cache mit show_code().
+
+        Args:
+            file_path: Pfad zur Datei, z.B. 'src/auth/session.py'.
+            symbol_name: Name des Symbols, z.B. 'validate_token'.
+
+        Returns:
+            Markdown-String mit Quellcode und Zeilennummern.
+
+        Raises:
+            ValueError: Wie bei show_code().
+        """
+        key = ("code", file_path, symbol_name)
+        result = self._cache.get(key)
+        if result is None:
+            result = await self._renderer.arender_code(file_path, symbol_name)
+            self._cache[key] = result
+        return result
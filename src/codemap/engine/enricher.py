@@ -13,10 +13,17 @@ The enricher supports two modes:
 """
 
 import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
+import os
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
 import openai
 import orjson
@@ -27,6 +34,77 @@ from codemap.mapper.reader import ContentReader, ContentReadError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for concurrent source-file reads in code-content mode
+_MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Locate the JSON array in LLM responses (clean or wrapped in markdown/text)
+_JSON_ARRAY_START_RE = re.compile(r"\s*\[")
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+# Maximum number of LLM responses kept in the exact-match prompt cache
+_RESPONSE_CACHE_SIZE = 1024
+
+# Rough token estimate per source line in code-content mode (~40 chars/line,
+# matching the size // 4 chars-per-token heuristic used for file nodes)
+_TOKENS_PER_CODE_LINE = 10
+
+# (node_id, attrs, pre-rendered metadata prompt block) awaiting enrichment
+_PendingNode = tuple[str, dict[str, Any], str]
+
+# File extension to Markdown code-fence language
+_LANG_MAP: dict[str, str] = {"py": "python", "js": "javascript", "ts": "typescript"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _lang_for_path(file_part: str) -> str:
+    """Return the code-fence language for a file path.
+
+    Cached per path so nodes from the same file share one lookup instead of
+    building a Path object per node.
+
+    Args:
+        file_part: File path portion of a node ID (e.g. "src/main.py").
+
+    Returns:
+        Language name for known extensions, otherwise the raw extension
+        (empty string if the path has no extension).
+    """
+    name = file_part.rpartition("/")[2]
+    i = name.rfind(".")
+    ext = name[i + 1 :] if i > 0 else ""
+    return _LANG_MAP.get(ext, ext)
+
+
+def _parse_node_id(node_id: str) -> tuple[str, str] | None:
+    """Split a code node ID into file path and symbol name.
+
+    Uses str.partition so the "::" check and the split happen in a single
+    scan without allocating an intermediate list.
+
+    Args:
+        node_id: Node identifier in format "path/file.py::symbol_name".
+
+    Returns:
+        Tuple of (file_path, symbol_name), or None if node_id has no "::".
+    """
+    file_path, sep, symbol = node_id.partition("::")
+    if not sep:
+        return None
+    return file_path, symbol
+
+
+def _response_key(system_prompt: str, user_prompt: str) -> str:
+    """Return the response cache key for a prompt pair.
+
+    Args:
+        system_prompt: System prompt for the LLM.
+        user_prompt: User prompt for the LLM.
+
+    Returns:
+        Hex-encoded 16-byte BLAKE2b digest of both prompts.
+    """
+    return hashlib.blake2b(f"{system_prompt}\x00{user_prompt}".encode(), digest_size=16).hexdigest()
+
 
 class GraphEnricher:
     """Enrich code graph with semantic summaries and risk analysis using LLMs.
@@ -38,10 +116,13 @@ class GraphEnricher:
 
     Architecture:
         - Processes code nodes in batches to optimize LLM API usage
-        - Uses asyncio.gather for parallel batch processing
+        - Runs batches concurrently and consumes them via asyncio.as_completed,
+          so each finished batch is released immediately
         - Implements batch-level error isolation (one batch failure doesn't affect others)
         - Updates graph nodes with summary and risks attributes
         - Supports code-content extraction for accurate LLM analysis
+        - Reads source files on a bounded thread pool so file I/O never blocks
+          the event loop and never exceeds a fixed number of open files
 
     The class enriches only nodes with type "function" or "class" that don't
     already have a "summary" attribute, ensuring idempotent behavior.
@@ -54,6 +135,11 @@ class GraphEnricher:
         _content_reader: ContentReader for reading source files (auto-created
             when root_path is set).
         _max_code_lines: Maximum lines per code snippet before truncation.
+        _max_prompt_tokens: Estimated token budget per batch prompt.
+        _io_pool: Bounded thread pool for source file reads (None in
+            metadata-only mode).
+        _response_cache: LRU map from prompt hash to LLM response, so
+            identical prompts (re-runs, retries) skip the provider call.
 
     Example:
         Metadata-only mode (backwards compatible)::
@@ -67,6 +153,11 @@ class GraphEnricher:
                 graph_manager, llm_provider, root_path=Path("/my/project")
             )
             await enricher.enrich_nodes(batch_size=10)
+
+        Releasing the file-read pool deterministically::
+
+            async with GraphEnricher(manager, provider, root_path=root) as enricher:
+                await enricher.enrich_nodes()
     """
 
     def __init__(
@@ -77,6 +168,7 @@ class GraphEnricher:
         root_path: Path | None = None,
         content_reader: ContentReader | None = None,
         max_code_lines: int = 100,
+        max_prompt_tokens: int = 8000,
     ) -> None:
         """Initialize GraphEnricher with dependencies.
 
@@ -91,6 +183,12 @@ class GraphEnricher:
             content_reader: File reader for source code. Auto-created when
                 root_path is given but content_reader is None.
             max_code_lines: Maximum lines per code snippet before truncation.
+            max_prompt_tokens: Estimated token budget per batch. Batches are
+                closed early once adding another node would exceed it, so
+                large classes don't overflow the model's context window.
+
+        Raises:
+            ValueError: If max_prompt_tokens is less than or equal to 0.
 
         Example:
             >>> from codemap.graph import GraphManager
@@ -108,11 +206,48 @@ class GraphEnricher:
         self._root_path = root_path
         self._max_code_lines = max_code_lines
 
+        if max_prompt_tokens <= 0:
+            raise ValueError("max_prompt_tokens must be positive")
+        self._max_prompt_tokens = max_prompt_tokens
+
         if root_path is not None and content_reader is None:
             self._content_reader: ContentReader | None = ContentReader()
         else:
             self._content_reader = content_reader
 
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+
+        self._closed = False
+        self._io_pool: ThreadPoolExecutor | None = None
+        if root_path is not None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=_MAX_IO_WORKERS, thread_name_prefix="enricher-io"
+            )
+
+    async def __aenter__(self) -> Self:
+        """Enter async context; returns the enricher itself."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Exit async context and release the file-read pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the file-read thread pool.
+
+        Safe to call multiple times. After closing, enrich_nodes() raises
+        RuntimeError on this instance.
+        """
+        self._closed = True
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+
     def _extract_code_snippet(self, node_id: str, start_line: int, end_line: int) -> str | None:
         """Extract code snippet from source file for a given node.
 
@@ -132,7 +267,8 @@ class GraphEnricher:
         if self._root_path is None or self._content_reader is None:
             return None
 
-        if "::" not in node_id:
+        parsed = _parse_node_id(node_id)
+        if parsed is None:
             return None
 
         if start_line > end_line:
@@ -142,7 +278,7 @@ class GraphEnricher:
             )
             return None
 
-        file_path = node_id.split("::")[0]
+        file_path = parsed[0]
         abs_path = self._root_path / file_path
 
         try:
@@ -174,20 +310,23 @@ class GraphEnricher:
 
         This method processes all unenriched code nodes (functions and classes)
         in the graph, splitting them into batches for efficient LLM processing.
-        Each batch is processed in parallel using asyncio.gather.
+        Batches run concurrently and are consumed as they complete.
 
         The method is idempotent: nodes with existing "summary" attributes are
         skipped, allowing safe re-execution without duplicating work.
 
         Process:
             1. Collect all unenriched nodes (type="function" or "class", no "summary")
-            2. Split nodes into batches of size batch_size
-            3. Process batches in parallel with asyncio.gather
+               and pre-render their metadata prompt blocks
+            2. Split nodes into batches of at most batch_size nodes and
+               max_prompt_tokens estimated tokens
+            3. Process batches concurrently, awaiting them via asyncio.as_completed
             4. Each batch calls LLM and updates graph attributes
 
         Args:
-            batch_size: Number of nodes to process per batch (default: 10).
-                Larger batches reduce API calls but may hit token limits.
+            batch_size: Maximum number of nodes per batch (default: 10).
+                Batches may be smaller when the max_prompt_tokens budget
+                is reached first.
 
         Returns:
             None. Updates graph nodes in-place with "summary" and "risks" attributes.
@@ -198,30 +337,149 @@ class GraphEnricher:
 
         Raises:
             ValueError: If batch_size is less than or equal to 0.
+            RuntimeError: If the enricher has been closed.
         """
         if batch_size <= 0:
             raise ValueError("batch_size must be positive")
-
-        # Step 1: Collect unenriched nodes
-        nodes = []
-        for node_id, attrs in self._graph_manager.graph.nodes(data=True):
-            if attrs.get("type") in ["function", "class"] and "summary" not in attrs:
-                nodes.append((node_id, attrs))
+        if self._closed:
+            raise RuntimeError("GraphEnricher is closed")
+
+        # Step 1: Collect unenriched nodes, rendering each node's metadata
+        # prompt block once here instead of inside the concurrent batch path
+        nodes: list[_PendingNode] = [
+            (
+                node_id,
+                attrs,
+                f"{node_id}\n- type: {attrs.get('type')}\n- name: {attrs.get('name')}\n"
+                f"- lines: {attrs.get('start_line')}-{attrs.get('end_line')}",
+            )
+            for node_id, attrs in self._graph_manager.graph.nodes(data=True)
+            if attrs.get("type") in ("function", "class") and "summary" not in attrs
+        ]
 
         if not nodes:
             logger.info("No nodes to enrich")
             return
 
         # Step 2: Create batches
-        batches = [nodes[i : i + batch_size] for i in range(0, len(nodes), batch_size)]
+        batches = self._create_batches(nodes, batch_size)
 
         logger.info(f"Enriching {len(nodes)} nodes in {len(batches)} batches")
 
-        # Step 3: Process batches in parallel
-        tasks = [self._enrich_batch(batch) for batch in batches]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Step 3: Process batches concurrently; consume results as they finish
+        # so completed batch state is freed without waiting for the slowest one
+        try:
+            for finished in asyncio.as_completed([self._run_batch(batch) for batch in batches]):
+                await finished
+        finally:
+            # Summaries are written on the graph directly; invalidate caches
+            # keyed on the version even if a batch failed midway
+            self._graph_manager.mark_modified()
+
+    async def _run_batch(self, batch: list[_PendingNode]) -> None:
+        """Run a single batch, isolating its failure from the other batches.
+
+        _enrich_batch already logs unexpected exceptions before re-raising, so
+        they are suppressed here to keep the remaining batches running.
+
+        Args:
+            batch: Pending nodes to enrich.
+        """
+        with contextlib.suppress(Exception):
+            await self._enrich_batch(batch)
+
+    async def _send_cached(self, system_prompt: str, user_prompt: str) -> str:
+        """Send prompts to the LLM, reusing responses for identical prompts.
+
+        The cache key is a BLAKE2b digest of both prompts. Only successful
+        responses are cached; provider errors propagate unchanged. Callers
+        drop responses they could not use via _discard_cached(). The cache
+        is bounded to the most recently used _RESPONSE_CACHE_SIZE entries.
+
+        Args:
+            system_prompt: System prompt for the LLM.
+            user_prompt: User prompt for the LLM.
+
+        Returns:
+            The (possibly cached) LLM response.
+        """
+        key = _response_key(system_prompt, user_prompt)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
+
+        response = await self._llm_provider.send(system_prompt, user_prompt)
+        self._response_cache[key] = response
+        if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return response
+
+    def _discard_cached(self, system_prompt: str, user_prompt: str) -> None:
+        """Drop a cached response so the next identical prompt reaches the LLM.
+
+        Args:
+            system_prompt: System prompt of the discarded response.
+            user_prompt: User prompt of the discarded response.
+        """
+        self._response_cache.pop(_response_key(system_prompt, user_prompt), None)
+
+    def _estimate_tokens(self, node: _PendingNode) -> int:
+        """Estimate the prompt tokens a node contributes to its batch.
+
+        Uses the cheap len(text) // 4 heuristic on the pre-rendered metadata
+        block. In code-content mode, adds an estimate for the snippet based
+        on the node's line span (capped at max_code_lines).
+
+        Args:
+            node: Pending node tuple (node_id, attrs, metadata_block).
+
+        Returns:
+            Estimated token count (at least 1).
+        """
+        _, attrs, block = node
+        tokens = len(block) // 4 + 1
+        if self._root_path is not None:
+            start_line = attrs.get("start_line")
+            end_line = attrs.get("end_line")
+            if start_line is not None and end_line is not None:
+                line_count = min(max(end_line - start_line + 1, 0), self._max_code_lines)
+                tokens += line_count * _TOKENS_PER_CODE_LINE
+        return tokens
+
+    def _create_batches(
+        self, nodes: list[_PendingNode], batch_size: int
+    ) -> list[list[_PendingNode]]:
+        """Greedily pack nodes into batches bounded by count and token budget.
+
+        A batch is closed when it holds batch_size nodes or when adding the
+        next node would exceed max_prompt_tokens. A single node larger than
+        the budget still gets its own batch.
+
+        Args:
+            nodes: Pending nodes in graph order.
+            batch_size: Maximum number of nodes per batch.
 
-    async def _enrich_batch(self, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        Returns:
+            List of non-empty batches preserving node order.
+        """
+        batches: list[list[_PendingNode]] = []
+        current: list[_PendingNode] = []
+        current_tokens = 0
+        for node in nodes:
+            tokens = self._estimate_tokens(node)
+            if current and (
+                len(current) >= batch_size or current_tokens + tokens > self._max_prompt_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(node)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _enrich_batch(self, batch: list[_PendingNode]) -> None:
         """Enrich a single batch of code nodes with LLM analysis.
 
         This private helper method processes one batch by:
@@ -249,7 +507,9 @@ class GraphEnricher:
           programming bugs during development/testing.
 
         Args:
-            batch: List of tuples (node_id, attributes_dict) to process.
+            batch: List of tuples (node_id, attributes_dict, metadata_block)
+                to process. metadata_block is the node's pre-rendered
+                type/name/lines prompt section.
 
         Returns:
             None. Updates graph nodes in-place or logs warnings on failure.
@@ -265,24 +525,29 @@ class GraphEnricher:
             )
 
             user_prompt_lines = ["Analyze these code elements:", ""]
-            for idx, (node_id, attrs) in enumerate(batch, start=1):
-                start_line = attrs.get("start_line")
-                end_line = attrs.get("end_line")
+            if self._root_path is None:
+                # Metadata-only fast path: blocks are pre-rendered, just number them
+                user_prompt_lines.extend(
+                    f"### {idx}. {block}\n" for idx, (_, _, block) in enumerate(batch, start=1)
+                )
+            else:
+                for idx, (node_id, attrs, block) in enumerate(batch, start=1):
+                    start_line = attrs.get("start_line")
+                    end_line = attrs.get("end_line")
+
+                    user_prompt_lines.append(f"### {idx}. {block}")
 
-                user_prompt_lines.append(f"### {idx}. {node_id}")
-                user_prompt_lines.append(f"- type: {attrs.get('type')}")
-                user_prompt_lines.append(f"- name: {attrs.get('name')}")
-                user_prompt_lines.append(f"- lines: {start_line}-{end_line}")
-
-                if self._root_path is not None:
                     code = None
                     if start_line is not None and end_line is not None:
-                        code = self._extract_code_snippet(node_id, start_line, end_line)
+                        code = await asyncio.get_running_loop().run_in_executor(
+                            self._io_pool,
+                            self._extract_code_snippet,
+                            node_id,
+                            start_line,
+                            end_line,
+                        )
                     if code:
-                        file_path_part = node_id.split("::")[0] if "::" in node_id else node_id
-                        ext = Path(file_path_part).suffix.lstrip(".")
-                        lang_map = {"py": "python", "js": "javascript", "ts": "typescript"}
-                        lang = lang_map.get(ext, ext)
+                        lang = _lang_for_path(node_id.partition("::")[0])
                         user_prompt_lines.append("- code:")
                         user_prompt_lines.append(f"```{lang}")
                         user_prompt_lines.append(code)
@@ -290,7 +555,7 @@ class GraphEnricher:
                     else:
                         user_prompt_lines.append("- code: (not available)")
 
-                user_prompt_lines.append("")
+                    user_prompt_lines.append("")
 
             user_prompt_lines.append(
                 'Return JSON array: [{"node_id": "...", "summary": "...", "risks": ["..."]}]'
@@ -298,47 +563,69 @@ class GraphEnricher:
             user_prompt = "\n".join(user_prompt_lines)
 
             # Step 2: Call LLM
-            response = await self._llm_provider.send(system_prompt, user_prompt)
+            response = await self._send_cached(system_prompt, user_prompt)
+            applied = 0
 
             # Step 3: Parse JSON response
-            # Strategy: Try direct parsing first for clean responses, then fall back
-            # to regex extraction for responses with markdown code blocks or extra text.
+            # Strategy: Parse directly when the response starts with a JSON array
+            # (clean responses), otherwise go straight to regex extraction for
+            # responses with markdown code blocks or extra text.
             try:
-                # First attempt: Direct parse (works for clean JSON responses)
-                try:
-                    results = orjson.loads(response)
-                except orjson.JSONDecodeError as direct_parse_error:
+                if _JSON_ARRAY_START_RE.match(response):
+                    # Fast path: Direct parse (works for clean JSON responses)
+                    try:
+                        results = orjson.loads(response)
+                    except orjson.JSONDecodeError as direct_parse_error:
+                        # Array followed by trailing text: isolate it via regex
+                        json_match = _JSON_ARRAY_RE.search(response)
+                        if json_match is None:
+                            raise direct_parse_error
+                        results = orjson.loads(json_match.group(0))
+                else:
                     # Fallback: Use regex to isolate JSON array from markdown code blocks
                     # (e.g., ```json [...] ```) or responses with surrounding text.
-                    json_match = re.search(r"\[.*\]", response, re.DOTALL)
-                    if json_match:
-                        json_str = json_match.group(0)
-                        results = orjson.loads(json_str)
+                    json_match = _JSON_ARRAY_RE.search(response)
+                    if json_match is None:
+                        # No JSON array found in response, report as parse error
+                        results = orjson.loads(response)
                     else:
-                        # No JSON array found in response, re-raise original error
-                        raise direct_parse_error
+                        results = orjson.loads(json_match.group(0))
+
+                if type(results) is not list:
+                    logger.warning("Expected JSON array in LLM response for batch")
+                    return
 
                 # Step 4: Update graph attributes
+                graph_nodes = self._graph_manager.graph.nodes
                 for result in results:
-                    if not isinstance(result, dict):
+                    # Non-dict elements raise TypeError on subscripting and are skipped
+                    try:
+                        result_node_id = result["node_id"]
+                    except TypeError:
                         continue
+                    except KeyError:
+                        result_node_id = None
 
-                    result_node_id = result.get("node_id")
                     if not result_node_id:
                         logger.warning("Result missing node_id field")
                         continue
 
-                    if result_node_id not in self._graph_manager.graph.nodes:
+                    if result_node_id not in graph_nodes:
                         logger.warning(f"Node ID {result_node_id} not found in graph")
                         continue
 
                     # Update node attributes
-                    node = self._graph_manager.graph.nodes[result_node_id]
+                    node = graph_nodes[result_node_id]
                     node["summary"] = result.get("summary", "")
                     node["risks"] = result.get("risks", [])
+                    applied += 1
 
             except orjson.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON response for batch: {e}")
+            finally:
+                # A response that updated no node would be replayed on retry
+                if applied == 0:
+                    self._discard_cached(system_prompt, user_prompt)
 
         except ValueError as e:
             # Expected: LLM returns empty/null response
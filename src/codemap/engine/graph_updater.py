@@ -5,17 +5,47 @@ changes to an existing code graph without full rebuild.
 """
 
 import logging
+import os
 import time
+from collections.abc import Container, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from codemap.engine.change_detector import ChangeDetector, ChangeSet
 from codemap.graph import GraphManager
+from codemap.mapper.cache import ParseCache
 from codemap.mapper.engine import ParserEngine
+from codemap.mapper.models import CodeNode
 from codemap.mapper.reader import ContentReader, ContentReadError
-from codemap.scout.models import FileEntry
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for file hashing; hashlib releases the GIL while digesting
+_HASH_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="graph-hash")
+
+# Maximum number of paths listed in a consolidated failure warning
+_MAX_LOGGED_PATHS = 10
+
+# Syntax trees kept for incremental reparsing across update() calls
+_DEFAULT_TREE_CACHE_SIZE = 512
+
+
+def _warn_failures(message: str, failures: list[str]) -> None:
+    """Log one warning summarizing per-file failures of an update step.
+
+    Args:
+        message: Format string taking the failure count and the listing.
+        failures: Failure descriptions; only the first _MAX_LOGGED_PATHS
+            are listed.
+    """
+    if not failures:
+        return
+    listing = ", ".join(failures[:_MAX_LOGGED_PATHS])
+    if len(failures) > _MAX_LOGGED_PATHS:
+        listing += ", ..."
+    logger.warning(message, len(failures), listing)
+
 
 class GraphUpdater:
     """Apply incremental changes to an existing graph.
@@ -39,6 +69,9 @@ class GraphUpdater:
         change_detector: ChangeDetector,
         parser: ParserEngine,
         reader: ContentReader,
+        parse_parallel: bool = True,
+        parse_cache: ParseCache | None = None,
+        tree_cache_size: int | None = _DEFAULT_TREE_CACHE_SIZE,
     ) -> None:
         """Initialize with required dependencies.
 
@@ -47,11 +80,28 @@ class GraphUpdater:
             change_detector: Detects file changes since last build.
             parser: Extracts code structure via tree-sitter.
             reader: Reads file content with encoding fallback.
+            parse_parallel: Read and parse changed files on a thread pool.
+                Set to False to parse serially in the calling thread.
+            parse_cache: Optional cache of parse results keyed by content
+                hash; files whose content was parsed before skip tree-sitter.
+            tree_cache_size: Syntax trees the parser keeps so files modified
+                again in a later update() are reparsed incrementally. Pass 0
+                for one-shot processes that never call update() twice, or
+                None to keep the parser's own setting.
+
+        Raises:
+            ValueError: If tree_cache_size is negative.
         """
         self._graph_manager = graph_manager
         self._change_detector = change_detector
         self._parser = parser
         self._reader = reader
+        self._parse_parallel = parse_parallel
+        self._parse_cache = parse_cache
+        if tree_cache_size is not None:
+            parser.tree_cache_size = tree_cache_size
+        # Module roots with the graph version they were current at
+        self._module_roots: tuple[int, set[str]] | None = None
 
     def update(self, root: Path) -> ChangeSet:
         """Apply incremental changes to the graph.
@@ -60,7 +110,7 @@ class GraphUpdater:
             1. Detect changes via ChangeDetector
             2. Remove deleted files
             3. Remove and re-add modified files
-            4. Add new files
+            4. Add new files (file nodes first, then parse in parallel)
             5. Update build metadata
 
         Args:
@@ -75,9 +125,10 @@ class GraphUpdater:
 
         if changes.is_empty:
             logger.info("No changes detected")
-            self._update_build_metadata(root)
+            self._update_build_metadata(root, changes)
             return changes
 
+        start_version = self._graph_manager.version
         logger.info(
             "Applying changes: %d modified, %d added, %d deleted",
             len(changes.modified),
@@ -89,36 +140,75 @@ class GraphUpdater:
         added_count = 0
         import_count = 0
 
+        # Per-file failures are collected and logged once per step; skip the
+        # bookkeeping entirely when warnings would be discarded anyway
+        collect_failures = logger.isEnabledFor(logging.WARNING)
+        missing_paths: list[str] = []
+        read_failures: list[str] = []
+        parse_failures: list[str] = []
+
         # Step 1: Remove deleted files
         for file_path in changes.deleted:
             file_id = str(file_path)
-            if file_id in self._graph_manager.graph.nodes:
-                self._graph_manager.remove_file(file_id)
-                removed_count += 1
+            self._parser.discard_tree(file_path)
+            removed_count += self._graph_manager.remove_file(file_id, missing_ok=True)
 
         # Step 2: Remove modified files (will be re-added)
         for file_path in changes.modified:
             file_id = str(file_path)
-            if file_id in self._graph_manager.graph.nodes:
-                self._graph_manager.remove_file(file_id)
-                removed_count += 1
+            removed_count += self._graph_manager.remove_file(file_id, missing_ok=True)
 
-        # Step 3: Create file nodes for modified and added files (pass 1)
+        # Step 3: Create file nodes for modified and added files (pass 1);
+        # only Python files are queued for parsing
         files_to_parse: list[Path] = []
+        new_file_ids: list[str] = []
         for file_path in list(changes.modified) + list(changes.added):
             node_added = self._add_file_node(root, file_path)
             if node_added:
                 added_count += 1
-                files_to_parse.append(file_path)
-
-        # Step 4: Parse and resolve imports (pass 2)
-        for file_path in files_to_parse:
-            counts = self._parse_and_resolve_imports(root, file_path)
-            added_count += counts[0]
-            import_count += counts[1]
-
-        # Step 5: Update build metadata
-        self._update_build_metadata(root)
+                new_file_ids.append(str(file_path))
+                if file_path.suffix == ".py":
+                    files_to_parse.append(file_path)
+            elif collect_failures:
+                missing_paths.append(str(file_path))
+
+        # Step 4: Parse files (pass 2a), in parallel since tree-sitter
+        # releases the GIL; graph mutation stays in this thread
+        parse = partial(self._parse_only, root)
+        if self._parse_parallel and len(files_to_parse) > 1:
+            with ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="graph-parse"
+            ) as executor:
+                parsed = list(executor.map(parse, files_to_parse))
+        else:
+            parsed = [parse(file_path) for file_path in files_to_parse]
+
+        # Step 5: Add code nodes and resolve imports (pass 2b)
+        # Live key view of the node dict: O(1) membership without NodeView dispatch
+        node_ids = self._graph_manager.graph._node.keys()  # type: ignore[attr-defined]
+        local_roots = self._local_module_roots(start_version, new_file_ids) if parsed else set()
+        for file_path, code_nodes, error in parsed:
+            if code_nodes is not None:
+                counts = self._apply_parsed(file_path, code_nodes, node_ids, local_roots)
+                added_count += counts[0]
+                import_count += counts[1]
+            elif collect_failures:
+                failures = read_failures if isinstance(error, ContentReadError) else parse_failures
+                failures.append(f"{file_path} ({error})")
+
+        if parsed:
+            self._module_roots = (self._graph_manager.version, local_roots)
+
+        # Drop cached parses of deleted files and old content versions
+        if self._parse_cache is not None:
+            self._parse_cache.prune(self._graph_manager.nodes_by_type().get("file", ()))
+
+        _warn_failures("File not found for %d files: %s", missing_paths)
+        _warn_failures("Failed to read %d files: %s", read_failures)
+        _warn_failures("Failed to parse %d files: %s", parse_failures)
+
+        # Step 6: Update build metadata
+        self._update_build_metadata(root, changes)
 
         elapsed = time.perf_counter() - start
         logger.info(
@@ -139,73 +229,111 @@ class GraphUpdater:
             rel_path: Relative path of the file to add.
 
         Returns:
-            True if the file node was added, False if file not found.
+            True if the file node was added, False if file not found. Missing
+            files are reported by update().
         """
         abs_path = root / rel_path
 
         if not abs_path.exists():
-            logger.warning("File not found: %s", abs_path)
             return False
 
-        stat = abs_path.stat()
-        entry = FileEntry(
-            path=rel_path,
-            size=stat.st_size,
-            token_est=stat.st_size // 4,
-        )
-        self._graph_manager.add_file(entry)
+        size = abs_path.stat().st_size
+        self._graph_manager.add_file_raw(str(rel_path), size, size // 4)
         return True
 
-    def _parse_and_resolve_imports(self, root: Path, rel_path: Path) -> tuple[int, int]:
-        """Parse a file and resolve its imports (pass 2).
+    def _parse_only(
+        self, root: Path, rel_path: Path
+    ) -> tuple[Path, list[CodeNode] | None, Exception | None]:
+        """Read and parse a file without touching the graph (pass 2a).
 
-        Assumes the file node already exists in the graph.
+        Safe to run from worker threads: only the reader and parser are used.
+        Callers only pass Python files (see update()). Failures are returned
+        rather than logged so update() can report them in one message.
 
         Args:
             root: Project root directory.
             rel_path: Relative path of the file to parse.
 
         Returns:
-            Tuple of (code_nodes_added, imports_resolved) counts.
+            Tuple of (rel_path, code_nodes, error). code_nodes is None if the
+            file could not be read (error is the ContentReadError) or parsed
+            (error is the parser's ValueError); otherwise error is None.
         """
-        file_id = str(rel_path)
-        abs_path = root / rel_path
-
-        # Non-Python files: skip parsing
-        if rel_path.suffix != ".py":
-            return (0, 0)
-
         # Read content
         try:
-            content = self._reader.read_file(abs_path)
+            content = self._reader.read_file(root / rel_path)
         except ContentReadError as e:
-            logger.warning("Failed to read %s: %s", rel_path, e)
-            return (0, 0)
+            return (rel_path, None, e)
+
+        # Reuse cached results for content that was parsed before
+        cache = self._parse_cache
+        if cache is not None:
+            file_id = str(rel_path)
+            digest = cache.digest(content)
+            cached = cache.get(file_id, digest)
+            if cached is not None:
+                return (rel_path, cached, None)
 
         # Parse file
         try:
             code_nodes = self._parser.parse_file(rel_path, content)
         except ValueError as e:
-            logger.warning("Failed to parse %s: %s", rel_path, e)
-            return (0, 0)
+            return (rel_path, None, e)
+
+        if cache is not None:
+            cache.put(file_id, digest, code_nodes)
+        return (rel_path, code_nodes, None)
+
+    def _apply_parsed(
+        self,
+        rel_path: Path,
+        code_nodes: list[CodeNode],
+        node_ids: Container[str],
+        local_roots: Container[str],
+    ) -> tuple[int, int]:
+        """Add parsed code nodes and resolve imports (pass 2b).
+
+        Assumes the file node already exists in the graph. Must be called
+        serially, as it mutates the graph.
+
+        Args:
+            rel_path: Relative path of the parsed file.
+            code_nodes: Nodes returned by _parse_only().
+            node_ids: Live view of the graph's node IDs for import lookups.
+            local_roots: Module roots from _local_module_roots().
+
+        Returns:
+            Tuple of (code_nodes_added, imports_resolved) counts.
+        """
+        file_id = str(rel_path)
 
         # Add code nodes and collect imports
         imports: list[str] = []
-        node_count = 0
+        symbols: list[CodeNode] = []
         for node in code_nodes:
             if node.type == "import":
                 imports.append(node.name)
             else:
-                self._graph_manager.add_node(file_id, node)
-                node_count += 1
+                symbols.append(node)
+        self._graph_manager.add_nodes_bulk(file_id, symbols)
+        node_count = len(symbols)
 
-        # Resolve imports
+        # Resolve imports; the directory prefix is shared by all of them
+        parent = str(rel_path.parent)
+        dir_prefix = "" if parent == "." else f"{parent}{os.sep}"
         for module_name in imports:
-            self._resolve_and_add_import(root, rel_path, module_name)
+            self._resolve_and_add_import(file_id, dir_prefix, module_name, node_ids, local_roots)
 
         return (node_count, len(imports))
 
-    def _resolve_and_add_import(self, root: Path, source_file: Path, import_name: str) -> None:
+    def _resolve_and_add_import(
+        self,
+        source_file_id: str,
+        dir_prefix: str,
+        import_name: str,
+        node_ids: Container[str],
+        local_roots: Container[str],
+    ) -> None:
         """Resolve import name to file path and add dependency edge.
 
         Uses same resolution strategies as MapBuilder:
@@ -215,38 +343,48 @@ class GraphUpdater:
         4. Package __init__.py (from root)
         5. External module (fallback)
 
+        Candidate IDs are built by plain string concatenation, so no Path
+        objects are created per import. Imports whose root module (e.g.
+        "os" for "os.path") does not occur in any project file path cannot
+        match a strategy and go straight to the external fallback; this is
+        the common case for stdlib and third-party imports.
+
         Args:
-            root: Project root directory.
-            source_file: Relative path to the importing file.
+            source_file_id: Node ID (relative path) of the importing file.
+            dir_prefix: Directory of the importing file including a trailing
+                separator, or "" for files in the project root.
             import_name: Module name from the import statement.
+            node_ids: Live view of the graph's node IDs for membership checks.
+            local_roots: Module roots from _local_module_roots().
         """
-        source_file_id = str(source_file)
+        if import_name.split(".", 1)[0] not in local_roots:
+            external_node_id = self._graph_manager.add_external_module(import_name)
+            self._graph_manager.add_dependency(source_file_id, external_node_id)
+            return
+
+        dotted = import_name.replace(".", os.sep)
 
         # Strategy 1: Simple name in same directory (e.g., "utils" -> "utils.py")
-        same_dir_path = source_file.parent / f"{import_name}.py"
-        same_dir_id = str(same_dir_path)
-        if same_dir_id in self._graph_manager.graph.nodes:
+        same_dir_id = f"{dir_prefix}{import_name}.py"
+        if same_dir_id in node_ids:
             self._graph_manager.add_dependency(source_file_id, same_dir_id)
             return
 
         # Strategy 2: Dotted name as path (e.g., "a.b.c" -> "a/b/c.py")
-        dotted_path = Path(import_name.replace(".", "/")).with_suffix(".py")
-        dotted_id = str(dotted_path)
-        if dotted_id in self._graph_manager.graph.nodes:
+        dotted_id = f"{dotted}.py"
+        if dotted_id in node_ids:
             self._graph_manager.add_dependency(source_file_id, dotted_id)
             return
 
         # Strategy 3: Package import with __init__.py (same directory)
-        package_init_same_dir = source_file.parent / import_name / "__init__.py"
-        package_same_dir_id = str(package_init_same_dir)
-        if package_same_dir_id in self._graph_manager.graph.nodes:
+        package_same_dir_id = f"{dir_prefix}{import_name}{os.sep}__init__.py"
+        if package_same_dir_id in node_ids:
             self._graph_manager.add_dependency(source_file_id, package_same_dir_id)
             return
 
         # Strategy 4: Package import with __init__.py (from root)
-        package_init_root = Path(import_name.replace(".", "/")) / "__init__.py"
-        package_root_id = str(package_init_root)
-        if package_root_id in self._graph_manager.graph.nodes:
+        package_root_id = f"{dotted}{os.sep}__init__.py"
+        if package_root_id in node_ids:
             self._graph_manager.add_dependency(source_file_id, package_root_id)
             return
 
@@ -254,23 +392,115 @@ class GraphUpdater:
         external_node_id = self._graph_manager.add_external_module(import_name)
         self._graph_manager.add_dependency(source_file_id, external_node_id)
 
-    def _update_build_metadata(self, root: Path) -> None:
+    def _local_module_roots(self, since_version: int, new_file_ids: Iterable[str]) -> set[str]:
+        """Collect every name an import could resolve to inside the project.
+
+        Each path component of each file node is reduced to its part before
+        the first dot ("utils.py" -> "utils", "src" -> "src"). Every
+        candidate tried by _resolve_and_add_import() contains the import's
+        root module as such a component, so imports whose root is missing
+        from this set are guaranteed to be external.
+
+        The set from the previous update is reused when the graph has not
+        changed since (its version equals since_version); only the roots of
+        new_file_ids are added. Roots of removed files stay, which is safe
+        since a superset only sends a few more imports through full
+        resolution. Otherwise the set is rebuilt from all file nodes.
+
+        Args:
+            since_version: Graph version at the start of this update.
+            new_file_ids: File nodes added by this update.
+
+        Returns:
+            Set of module root names present in the graph's file paths.
+        """
+        cached = self._module_roots
+        if cached is not None and cached[0] == since_version:
+            roots = cached[1]
+            file_ids: Iterable[str] = new_file_ids
+        else:
+            roots = set()
+            file_ids = self._graph_manager.nodes_by_type().get("file", ())
+        for file_id in file_ids:
+            roots.update(part.split(".", 1)[0] for part in file_id.split(os.sep))
+        return roots
+
+    def _update_build_metadata(self, root: Path, changes: ChangeSet | None = None) -> None:
         """Update build metadata with current commit hash and file hashes.
 
+        When a ChangeSet is given and hashes from a previous build exist,
+        only the changed files are re-hashed; hashes of untouched files are
+        carried over and deleted files are dropped. Otherwise (first build
+        or no ChangeSet) every file node in the graph is hashed. An empty
+        ChangeSet on the already recorded commit returns without touching
+        the metadata at all.
+
+        Hashes already computed by hash-based change detection
+        (ChangeSet.current_hashes) are reused. Remaining files are hashed on
+        a shared thread pool, since hashing is I/O bound and hashlib releases
+        the GIL for large inputs.
+
         Args:
             root: Project root directory.
+            changes: ChangeSet applied by this update, or None to force a
+                full re-hash.
         """
+        metadata = self._graph_manager.build_metadata
+
         new_commit = self._change_detector.get_current_commit(root)
-        if new_commit:
-            self._graph_manager.build_metadata["commit_hash"] = new_commit
 
-        file_hashes: dict[str, str] = {}
-        for node_id, attrs in self._graph_manager.graph.nodes(data=True):
-            if attrs.get("type") == "file":
-                abs_path = root / node_id
-                if abs_path.exists():
-                    file_hashes[node_id] = self._change_detector._hash_file(abs_path)
-        self._graph_manager.build_metadata["file_hashes"] = file_hashes
+        # Nothing changed since the stored build: metadata is already current
+        if (
+            changes is not None
+            and changes.is_empty
+            and new_commit is not None
+            and new_commit == metadata.get("commit_hash")
+            and metadata.get("file_hashes")
+        ):
+            return
+
+        if new_commit:
+            metadata["commit_hash"] = new_commit
+
+        graph_nodes = self._graph_manager.graph.nodes
+        previous_hashes: dict[str, str] | None = metadata.get("file_hashes")
+
+        if changes is None or previous_hashes is None:
+            # Full scan: hash every file node in the graph
+            file_hashes: dict[str, str] = {}
+            candidates = [
+                node_id for node_id, attrs in graph_nodes(data=True) if attrs.get("type") == "file"
+            ]
+        else:
+            # Incremental: reuse stored hashes, re-hash only changed files
+            file_hashes = dict(previous_hashes)
+            for file_path in changes.deleted:
+                file_hashes.pop(str(file_path), None)
+            candidates = []
+            for file_path in list(changes.modified) + list(changes.added):
+                file_id = str(file_path)
+                file_hashes.pop(file_id, None)
+                if file_id in graph_nodes:
+                    candidates.append(file_id)
+
+        # Reuse detection hashes; collect remaining files that still exist
+        # and hash them in parallel
+        known_hashes = (changes.current_hashes if changes is not None else None) or {}
+        file_ids: list[str] = []
+        abs_paths: list[Path] = []
+        for node_id in candidates:
+            known = known_hashes.get(node_id)
+            if known is not None:
+                file_hashes[node_id] = known
+                continue
+            abs_path = root / node_id
+            if abs_path.exists():
+                file_ids.append(node_id)
+                abs_paths.append(abs_path)
+
+        hashes = _HASH_EXECUTOR.map(self._change_detector._hash_file, abs_paths)
+        file_hashes.update(zip(file_ids, hashes, strict=True))
+        metadata["file_hashes"] = file_hashes
 
     def get_affected_parent_nodes(self, changes: ChangeSet) -> set[str]:
         """Get parent package nodes affected by changes for re-aggregation.
@@ -282,13 +512,47 @@ class GraphUpdater:
             Set of parent node IDs that need re-aggregation.
         """
         affected: set[str] = set()
+        root = Path(".")
 
         all_paths = list(changes.modified) + list(changes.added) + list(changes.deleted)
 
         for file_path in all_paths:
-            for parent in file_path.parents:
-                if parent == Path("."):
+            # Stop at the first ancestor already collected: its own
+            # ancestors were added when it was first seen
+            parent = file_path.parent
+            while parent != root:
+                parent_id = str(parent)
+                if parent_id in affected:
                     break
-                affected.add(str(parent))
+                affected.add(parent_id)
+                parent = parent.parent
 
         return affected
+
+    def get_dirty_parents(self, changes: ChangeSet) -> set[str]:
+        """Get every node whose summary must be re-aggregated after changes.
+
+        Complete dirty set for HierarchyEnricher.aggregate_summaries(): the
+        modified and added file nodes (parents of their code nodes), their
+        ancestor packages from get_affected_parent_nodes(), and the project
+        node. Unchanged sibling packages are left out.
+
+        Args:
+            changes: ChangeSet applied by update().
+
+        Returns:
+            Set of node IDs to pass as aggregate_summaries(dirty=...).
+
+        Example:
+            >>> changes = updater.update(root)
+            >>> await hierarchy_enricher.aggregate_summaries(
+            ...     dirty=updater.get_dirty_parents(changes)
+            ... )
+        """
+        if changes.is_empty:
+            return set()
+        dirty = self.get_affected_parent_nodes(changes)
+        dirty.update(str(file_path) for file_path in changes.modified)
+        dirty.update(str(file_path) for file_path in changes.added)
+        dirty.update(self._graph_manager.nodes_by_type().get("project", ()))
+        return dirty
@@ -7,15 +7,21 @@ summaries from GraphEnricher as input to produce higher-level summaries.
 """
 
 import asyncio
-import json
+import itertools
 import logging
 from collections import defaultdict
+from collections.abc import Iterator
+
+import orjson
 
 from codemap.core.llm import LLMProvider
 from codemap.graph import GraphManager
 
 logger = logging.getLogger(__name__)
 
+# Parent node ID with its (child_id, summary) pairs
+_Parent = tuple[str, list[tuple[str, str]]]
+
 
 class HierarchyEnricher:
     """Aggregate semantic summaries bottom-up through the graph hierarchy.
@@ -30,6 +36,18 @@ class HierarchyEnricher:
         _llm_provider: LLMProvider instance for AI-powered summary aggregation.
     """
 
+    NODE_SYSTEM_PROMPT = (
+        "You are a code analysis assistant. Summarize the following "
+        "child components into a single cohesive summary for the parent. "
+        'Return JSON: [{"node_id": "...", "summary": "..."}]'
+    )
+
+    BATCH_SYSTEM_PROMPT = (
+        "You are a code analysis assistant. For each parent below, summarize "
+        "its child components into a single cohesive summary. Return JSON with "
+        'one entry per parent: [{"node_id": "...", "summary": "..."}]'
+    )
+
     def __init__(self, graph_manager: GraphManager, llm_provider: LLMProvider) -> None:
         """Initialize HierarchyEnricher with dependencies.
 
@@ -45,14 +63,30 @@ class HierarchyEnricher:
         self._graph_manager = graph_manager
         self._llm_provider = llm_provider
 
-    async def aggregate_summaries(self) -> None:
+    async def aggregate_summaries(self, batch_size: int = 8, dirty: set[str] | None = None) -> None:
         """Aggregate summaries bottom-up through the hierarchy.
 
-        Groups nodes by level attribute, then iterates from the highest
-        child level down to level 0. For each parent node at a given level,
-        collects summaries from CONTAINS children and calls the LLM to
-        produce an aggregated summary. Skips parent nodes whose children
-        have no summaries.
+        Groups nodes that have CONTAINS children by level attribute and
+        splits each level into batches of up to batch_size siblings; each
+        batch is summarized with a single LLM call. Instead of a barrier per
+        level, every batch only waits for the batches holding its members'
+        direct children, so a parent whose subtree finished early does not
+        wait for unrelated siblings of its children. Parents missing from a
+        batch response fall back to an individual call. Skips parent nodes
+        whose children have no summaries.
+
+        For incremental refreshes, pass GraphUpdater.get_dirty_parents()
+        of the applied ChangeSet as dirty; all other parents keep their
+        existing summaries.
+
+        Args:
+            batch_size: Maximum number of parent nodes per LLM call
+                (default: 8). Use 1 for one call per parent.
+            dirty: Parent node IDs to re-aggregate. None (default)
+                re-aggregates every parent in the hierarchy.
+
+        Raises:
+            ValueError: If batch_size is less than or equal to 0.
 
         Example:
             >>> enricher = HierarchyEnricher(graph_manager, llm_provider)
@@ -60,29 +94,161 @@ class HierarchyEnricher:
             >>> graph_manager.graph.nodes["project::MyProject"]["summary"]
             'Project overview summary...'
         """
-        graph = self._graph_manager.graph
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
 
-        # Group nodes by level
+        # Select parent nodes (nodes with CONTAINS children) per level from
+        # the manager's cached level index instead of scanning every node
         nodes_by_level: dict[int, list[str]] = defaultdict(list)
-        for node_id, attrs in graph.nodes(data=True):
-            level = attrs.get("level")
-            if level is not None:
-                nodes_by_level[int(level)].append(node_id)
+        for level, level_nodes in self._graph_manager.nodes_by_level().items():
+            for node_id in level_nodes:
+                if dirty is not None and node_id not in dirty:
+                    continue
+                if self._contains_children(node_id):
+                    nodes_by_level[level].append(node_id)
+
+        # Schedule batches from the deepest level up. Levels grow along
+        # CONTAINS edges, so every child's task exists before its parent's.
+        task_by_node: dict[str, asyncio.Task[None]] = {}
+        try:
+            async with asyncio.TaskGroup() as group:
+                for level in sorted(nodes_by_level, reverse=True):
+                    # Sorting by ID keeps siblings of one package in the same batch
+                    level_nodes = sorted(nodes_by_level[level])
+                    for i in range(0, len(level_nodes), batch_size):
+                        batch = level_nodes[i : i + batch_size]
+                        dependencies = {
+                            task_by_node[child_id]
+                            for node_id in batch
+                            for child_id in self._contains_children(node_id)
+                            if child_id in task_by_node
+                        }
+                        task = group.create_task(self._run_batch(batch, dependencies))
+                        for node_id in batch:
+                            task_by_node[node_id] = task
+        finally:
+            # Summaries are written on the graph directly; invalidate caches
+            # keyed on the version even if a batch failed midway
+            self._graph_manager.mark_modified()
+
+    async def _run_batch(self, node_ids: list[str], dependencies: set[asyncio.Task[None]]) -> None:
+        """Aggregate a batch once the batches of its children are done.
+
+        Never raises, so that parents depending on this batch still run.
+
+        Args:
+            node_ids: Parent node IDs at the same hierarchy level.
+            dependencies: Tasks aggregating the direct children of node_ids.
+        """
+        if dependencies:
+            await asyncio.wait(dependencies)
+
+        parents: list[_Parent] = []
+        for node_id in node_ids:
+            children = self._iter_child_summaries(node_id)
+            first = next(children, None)
+            if first is not None:
+                parents.append((node_id, [first, *children]))
+        if not parents:
+            return
+
+        try:
+            await self._aggregate_batch(parents)
+        except Exception as e:
+            logger.warning("Unexpected error aggregating %s: %s", ", ".join(node_ids), e)
+
+    def _contains_children(self, node_id: str) -> list[str]:
+        """Return the IDs of a node's CONTAINS children.
+
+        Args:
+            node_id: The parent node ID.
+
+        Returns:
+            Child node IDs in adjacency order.
+        """
+        # Plain adjacency dict: avoids building an OutEdgeDataView per call
+        successors = self._graph_manager.graph._succ[node_id]  # type: ignore[attr-defined]
+        return [
+            child_id
+            for child_id, edge_data in successors.items()
+            if edge_data.get("relationship") == "CONTAINS"
+        ]
+
+    def _iter_child_summaries(self, node_id: str) -> Iterator[tuple[str, str]]:
+        """Yield (child_id, summary) pairs of a node's CONTAINS children.
+
+        Lazy, so callers can bail out after peeking at the first pair
+        without collecting anything for parents that will be skipped.
 
-        if not nodes_by_level:
+        Args:
+            node_id: The parent node ID.
+
+        Yields:
+            Children that have a non-empty summary, in adjacency order.
+        """
+        graph = self._graph_manager.graph
+        node_data = graph._node  # type: ignore[attr-defined]
+        for child_id, edge_data in graph._succ[node_id].items():  # type: ignore[attr-defined]
+            if edge_data.get("relationship") != "CONTAINS":
+                continue
+            summary = node_data[child_id].get("summary")
+            if summary:
+                yield child_id, summary
+
+    async def _aggregate_batch(self, parents: list[_Parent]) -> None:
+        """Aggregate summaries for several sibling parents with one LLM call.
+
+        A single-node batch is delegated to _aggregate_node(). For larger
+        batches the response is matched to parents by node_id; parents that
+        are missing from the response, or all parents if the call or JSON
+        parsing fails, are retried individually via _aggregate_node().
+
+        Args:
+            parents: (node_id, child summaries) pairs of parents at the same
+                hierarchy level.
+        """
+        if len(parents) == 1:
+            await self._aggregate_node(parents[0][0])
             return
 
-        max_level = max(nodes_by_level.keys())
+        node_data = self._graph_manager.graph._node  # type: ignore[attr-defined]
+
+        node_ids = [node_id for node_id, _ in parents]
+        sections: list[str] = []
+        for node_id, children in parents:
+            attrs = node_data[node_id]
+            node_type = attrs.get("type", "unknown")
+            node_name = attrs.get("name", node_id)
+            sections.append(f"### {node_type} '{node_name}' (node_id: {node_id})")
+            sections.extend(f"- {child_id}: {summary}" for child_id, summary in children)
+            sections.append("")
+
+        user_prompt = (
+            "Summarize the components of each of these parents:\n\n"
+            + "\n".join(sections)
+            + f"\nReturn summaries for node_ids: {', '.join(node_ids)}"
+        )
 
-        # Process from second-highest level down to 0
-        # (highest level nodes are leaves that already have summaries)
-        for level in range(max_level - 1, -1, -1):
-            parent_nodes = nodes_by_level.get(level, [])
-            tasks = [self._aggregate_node(parent_id) for parent_id in parent_nodes]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for parent_id, result in zip(parent_nodes, results):
-                if isinstance(result, Exception):
-                    logger.warning("Unexpected error aggregating %s: %s", parent_id, result)
+        pending = set(node_ids)
+        try:
+            response = await self._llm_provider.send(self.BATCH_SYSTEM_PROMPT, user_prompt)
+            results: list[dict[str, str]] = orjson.loads(response)
+            for result in results:
+                result_id = result.get("node_id")
+                if result_id in pending:
+                    node_data[result_id]["summary"] = result["summary"]
+                    pending.discard(result_id)
+        except Exception as e:
+            logger.warning("Batch aggregation failed for %s: %s", ", ".join(node_ids), e)
+
+        # Retry parents not covered by the batch response one by one
+        retry = [node_id for node_id in node_ids if node_id in pending]
+        outcomes = await asyncio.gather(
+            *(self._aggregate_node(node_id) for node_id in retry), return_exceptions=True
+        )
+        for node_id, outcome in zip(retry, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning("Unexpected error aggregating %s: %s", node_id, outcome)
 
     async def _aggregate_node(self, node_id: str) -> None:
         """Aggregate summaries for a single parent node from its CONTAINS children.
@@ -95,32 +261,23 @@ class HierarchyEnricher:
         Args:
             node_id: The parent node ID to aggregate summaries for.
         """
-        graph = self._graph_manager.graph
+        node_data = self._graph_manager.graph._node  # type: ignore[attr-defined]
 
-        # Collect children with summaries via CONTAINS edges
-        children_with_summaries: list[tuple[str, str]] = []
-        for _, child_id, edge_data in graph.out_edges(node_id, data=True):
-            if edge_data.get("relationship") != "CONTAINS":
-                continue
-            summary = graph.nodes[child_id].get("summary")
-            if summary:
-                children_with_summaries.append((child_id, summary))
-
-        if not children_with_summaries:
+        # Peek at children with summaries via CONTAINS edges; skip the node
+        # before any prompt work if there are none
+        children = self._iter_child_summaries(node_id)
+        first = next(children, None)
+        if first is None:
             return
 
         # Build prompt with child node IDs in the user message
-        node_attrs = graph.nodes[node_id]
+        node_attrs = node_data[node_id]
         node_type = node_attrs.get("type", "unknown")
         node_name = node_attrs.get("name", node_id)
 
-        system_prompt = (
-            "You are a code analysis assistant. Summarize the following "
-            "child components into a single cohesive summary for the parent. "
-            'Return JSON: [{"node_id": "...", "summary": "..."}]'
-        )
-
-        child_lines = [f"- {child_id}: {summary}" for child_id, summary in children_with_summaries]
+        child_lines = [
+            f"- {child_id}: {summary}" for child_id, summary in itertools.chain((first,), children)
+        ]
 
         user_prompt = (
             f"Summarize these components of {node_type} '{node_name}':\n\n"
@@ -129,17 +286,17 @@ class HierarchyEnricher:
         )
 
         try:
-            response = await self._llm_provider.send(system_prompt, user_prompt)
+            response = await self._llm_provider.send(self.NODE_SYSTEM_PROMPT, user_prompt)
         except Exception as e:
             logger.warning("LLM call failed for %s: %s", node_id, e)
             return
 
         try:
-            results: list[dict[str, str]] = json.loads(response)
+            results: list[dict[str, str]] = orjson.loads(response)
 
             for result in results:
                 if result.get("node_id") == node_id:
-                    graph.nodes[node_id]["summary"] = result["summary"]
+                    node_attrs["summary"] = result["summary"]
                     break
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning("Failed to aggregate summary for %s: %s", node_id, e)
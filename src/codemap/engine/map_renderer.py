@@ -4,16 +4,118 @@ This module provides the MapRenderer class for rendering code relationship
 graphs as hierarchical Markdown documents. Each zoom level (0-4) has a
 dedicated render method that combines graph traversal with Markdown formatting.
 
-The renderer is stateless and uses GraphManager in read-only mode.
+The renderer uses GraphManager in read-only mode. Edge lookups are served
+from an adjacency index, and overview/package/module pages from a render
+cache; both are dropped whenever GraphManager.version changes.
 """
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any
+import asyncio
+import functools
+import io
+import itertools
+import os
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from codemap.graph import GraphManager
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from pathlib import Path
+
+# Same interned objects GraphManager stores on its edges
+_REL_CONTAINS = sys.intern("CONTAINS")
+_REL_IMPORTS = sys.intern("IMPORTS")
+
+# Code fence language per file extension for render_code()
+_CODE_LANGUAGES: dict[str, str] = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parent_package(node_id: str) -> str | None:
+    """Determine the parent package path for a node.
+
+    For file nodes, returns the directory. For code nodes (with '::'),
+    first extracts the file path, then returns its directory. Cached per
+    node ID, since a file takes part in many IMPORTS edges.
+
+    Args:
+        node_id: File or code node ID.
+
+    Returns:
+        Parent directory path, or None for nodes in the project root.
+    """
+    file_part = node_id.partition("::")[0]
+    parent, sep, _ = file_part.rpartition(os.sep)
+    if not sep:
+        return None
+    # A file directly below the filesystem root keeps the root as parent
+    return parent or sep
+
+
+def _ext_of(path: str) -> str:
+    """Return a file extension without the dot, following Path.suffix rules.
+
+    Args:
+        path: File path or node ID, e.g. 'src/auth/login.py'.
+
+    Returns:
+        Extension such as 'py', or an empty string if there is none.
+    """
+    name = os.path.basename(path)
+    dot = name.rfind(".")
+    return name[dot + 1 :] if 0 < dot < len(name) - 1 else ""
+
+
+def _attrs_summary(attrs: Mapping[str, Any]) -> str:
+    """Return the summary from already-fetched node attributes."""
+    return str(attrs.get("summary", ""))
+
+
+def _attrs_risks(attrs: Mapping[str, Any]) -> list[str]:
+    """Return the risks from already-fetched node attributes."""
+    risks = attrs.get("risks", [])
+    if isinstance(risks, list):
+        return [str(r) for r in risks]
+    return []
+
+
+def _page(buf: io.StringIO) -> str:
+    """Return a page written line by line, without its final newline.
+
+    Render methods terminate every line with a newline; dropping the last
+    one gives the same text as joining the lines with newlines.
+    """
+    return buf.getvalue()[:-1]
+
+
+@dataclass(slots=True)
+class _EdgeIndex:
+    """Per-relationship adjacency lists built in one pass over the graph.
+
+    Neighbour lists keep NetworkX's edge order, so rendered output is the
+    same as when walking out_edges()/in_edges() directly.
+
+    Attributes:
+        version: GraphManager.version the index was built at.
+        contains_children: Parent node ID -> CONTAINS children.
+        imports_by_src: Importing node ID -> imported node IDs.
+        imports_by_tgt: Imported node ID -> importing node IDs.
+    """
+
+    version: int
+    contains_children: dict[str, list[str]] = field(default_factory=dict)
+    imports_by_src: dict[str, list[str]] = field(default_factory=dict)
+    imports_by_tgt: dict[str, list[str]] = field(default_factory=dict)
+
 
 class MapRenderer:
     """Render code graph as hierarchical Markdown directory.
@@ -26,7 +128,12 @@ class MapRenderer:
         - Level 3 (render_symbol): Symbol with signature and callers
         - Level 4 (render_code): Source code with line numbers
 
-    The renderer is stateless and does not modify the graph.
+    The renderer does not modify the graph and reads node attribute dicts
+    in place rather than copying them. It caches an edge index and
+    the Markdown of levels 0-2 keyed on GraphManager.version; changes made
+    directly on the graph property after the first render are not picked
+    up until clear_cache() or GraphManager.mark_modified() is called.
+    GraphEnricher and HierarchyEnricher call mark_modified() themselves.
 
     Example:
         >>> renderer = MapRenderer(graph_manager)
@@ -52,6 +159,22 @@ class MapRenderer:
         """
         self._graph = graph_manager
         self._root_path = root_path
+        # String form of root_path for os.path.join in render_code
+        self._root_str = str(root_path) if root_path is not None else None
+        self._index: _EdgeIndex | None = None
+        # Rendered pages for _cache_version, keyed by (method, *args)
+        self._render_cache: dict[tuple[str, ...], str] = {}
+        self._cache_version = graph_manager.version
+
+    def clear_cache(self) -> None:
+        """Drop cached pages and the edge index.
+
+        Call this after changing node attributes or edges directly on the
+        graph, which does not bump GraphManager.version, unless the writer
+        calls GraphManager.mark_modified() (as both enrichers do).
+        """
+        self._render_cache.clear()
+        self._index = None
 
     def render_overview(self) -> str:
         """Render Level 0 - Project overview.
@@ -62,46 +185,46 @@ class MapRenderer:
         Returns:
             Markdown string with project overview.
         """
-        project_id: str | None = None
-        project_attrs: dict[str, Any] = {}
-        for node_id, attrs in self._graph.graph.nodes(data=True):
-            if attrs.get("type") == "project":
-                project_id = node_id
-                project_attrs = dict(attrs)
-                break
-
-        if project_id is None:
+        return self._cached(("overview",), self._render_overview)
+
+    def _render_overview(self) -> str:
+        """Build the Level 0 page for render_overview()."""
+        project_ids = self._graph.nodes_by_type().get("project")
+        if not project_ids:
             return "# Project Overview\n\nNo project node found.\n"
 
+        project_id = project_ids[0]
+        project_attrs = self._graph.graph.nodes[project_id]
         name = project_attrs.get("name", project_id)
         summary = self._get_node_summary(project_id)
 
-        lines: list[str] = [f"# {name}", ""]
+        buf = io.StringIO()
+        buf.write(f"# {name}\n\n")
         if summary:
-            lines.extend([summary, ""])
+            buf.write(f"{summary}\n\n")
 
         # Top-level packages
         children = self._collect_contains_children(project_id)
         if children:
-            lines.extend(["## Hauptbereiche:", ""])
+            buf.write("## Hauptbereiche:\n\n")
             for child_id, child_attrs in children:
                 child_name = child_attrs.get("name", child_id)
-                child_summary = self._get_node_summary(child_id)
+                child_summary = _attrs_summary(child_attrs)
                 if child_summary:
-                    lines.append(f"- **{child_name}** - {child_summary}")
+                    buf.write(f"- **{child_name}** - {child_summary}\n")
                 else:
-                    lines.append(f"- **{child_name}**")
-            lines.append("")
+                    buf.write(f"- **{child_name}**\n")
+            buf.write("\n")
 
         # Architecture hints from inter-package imports
         hints = self._collect_architecture_hints()
         if hints:
-            lines.extend(["## Architektur-Hinweise:", ""])
+            buf.write("## Architektur-Hinweise:\n\n")
             for hint in hints:
-                lines.append(f"- {hint}")
-            lines.append("")
+                buf.write(f"- {hint}\n")
+            buf.write("\n")
 
-        return "\n".join(lines)
+        return _page(buf)
 
     def render_package(self, package_path: str) -> str:
         """Render Level 1 - Package view.
@@ -115,10 +238,16 @@ class MapRenderer:
         Raises:
             ValueError: If package_path not found or not a package node.
         """
+        return self._cached(
+            ("package", package_path), lambda: self._render_package(package_path)
+        )
+
+    def _render_package(self, package_path: str) -> str:
+        """Build the Level 1 page for render_package()."""
         if package_path not in self._graph.graph.nodes:
             raise ValueError(f"Package '{package_path}' not found in graph")
 
-        attrs = dict(self._graph.graph.nodes[package_path])
+        attrs = self._graph.graph.nodes[package_path]
         if attrs.get("type") != "package":
             raise ValueError(
                 f"Node '{package_path}' is not a package (type={attrs.get('type')})"
@@ -127,49 +256,54 @@ class MapRenderer:
         summary = self._get_node_summary(package_path)
         risks = self._get_node_risks(package_path)
 
-        lines: list[str] = [f"# {package_path}/", ""]
+        buf = io.StringIO()
+        buf.write(f"# {package_path}/\n\n")
         if summary:
-            lines.extend([summary, ""])
+            buf.write(f"{summary}\n\n")
 
         # Contained modules / sub-packages
         children = self._collect_contains_children(package_path)
         if children:
-            lines.extend(["## Module:", ""])
+            buf.write("## Module:\n\n")
             for child_id, child_attrs in children:
                 child_name = child_attrs.get("name", child_id)
-                child_summary = self._get_node_summary(child_id)
+                child_summary = _attrs_summary(child_attrs)
                 if child_summary:
-                    lines.append(f"- **{child_name}** - {child_summary}")
+                    buf.write(f"- **{child_name}** - {child_summary}\n")
                 else:
-                    lines.append(f"- **{child_name}**")
-            lines.append("")
+                    buf.write(f"- **{child_name}**\n")
+            buf.write("\n")
+
+        # Child IDs are shared by the internal and boundary import helpers
+        child_order = [child_id for child_id, _ in children]
+        child_ids = frozenset(child_order)
 
         # Internal structure (imports within this package)
-        internal_imports = self._collect_internal_imports(package_path)
+        internal_imports = self._collect_internal_imports(child_order, child_ids)
         if internal_imports:
-            lines.extend(["## Interne Struktur:", ""])
+            buf.write("## Interne Struktur:\n\n")
             for imp in internal_imports:
-                lines.append(f"- {imp}")
-            lines.append("")
+                buf.write(f"- {imp}\n")
+            buf.write("\n")
 
         # External interfaces (imports crossing package boundary)
-        outgoing, incoming = self._collect_package_external_imports(package_path)
+        outgoing, incoming = self._collect_package_external_imports(child_order, child_ids)
         if outgoing or incoming:
-            lines.extend(["## Externe Schnittstellen:", ""])
+            buf.write("## Externe Schnittstellen:\n\n")
             if outgoing:
-                lines.append(f"- Importiert: {', '.join(outgoing)}")
+                buf.write(f"- Importiert: {', '.join(outgoing)}\n")
             if incoming:
-                lines.append(f"- Wird importiert von: {', '.join(incoming)}")
-            lines.append("")
+                buf.write(f"- Wird importiert von: {', '.join(incoming)}\n")
+            buf.write("\n")
 
         # Risks
         if risks:
-            lines.extend(["## Risiken:", ""])
+            buf.write("## Risiken:\n\n")
             for risk in risks:
-                lines.append(f"- {risk}")
-            lines.append("")
+                buf.write(f"- {risk}\n")
+            buf.write("\n")
 
-        return "\n".join(lines)
+        return _page(buf)
 
     def render_module(self, file_path: str) -> str:
         """Render Level 2 - Module view.
@@ -183,10 +317,14 @@ class MapRenderer:
         Raises:
             ValueError: If file_path not found or not a file node.
         """
+        return self._cached(("module", file_path), lambda: self._render_module(file_path))
+
+    def _render_module(self, file_path: str) -> str:
+        """Build the Level 2 page for render_module()."""
         if file_path not in self._graph.graph.nodes:
             raise ValueError(f"Module '{file_path}' not found in graph")
 
-        attrs = dict(self._graph.graph.nodes[file_path])
+        attrs = self._graph.graph.nodes[file_path]
         if attrs.get("type") != "file":
             raise ValueError(
                 f"Node '{file_path}' is not a file (type={attrs.get('type')})"
@@ -195,48 +333,54 @@ class MapRenderer:
         summary = self._get_node_summary(file_path)
         risks = self._get_node_risks(file_path)
 
-        lines: list[str] = [f"# {file_path}", ""]
+        buf = io.StringIO()
+        buf.write(f"# {file_path}\n\n")
         if summary:
-            lines.extend([summary, ""])
+            buf.write(f"{summary}\n\n")
 
         # Contained symbols (functions, classes)
         children = self._collect_contains_children(file_path)
         if children:
-            lines.extend(["## Enthält:", ""])
+            buf.write("## Enthält:\n\n")
             for child_id, child_attrs in children:
                 child_name = child_attrs.get("name", child_id)
-                child_summary = self._get_node_summary(child_id)
+                child_summary = _attrs_summary(child_attrs)
                 if child_summary:
-                    lines.append(f"- **{child_name}** - {child_summary}")
+                    buf.write(f"- **{child_name}** - {child_summary}\n")
                 else:
-                    lines.append(f"- **{child_name}**")
-            lines.append("")
+                    buf.write(f"- **{child_name}**\n")
+            buf.write("\n")
 
-        # Dependencies
-        outgoing, incoming = self._collect_imports(file_path)
+        # Dependencies, read straight from the edge index without copying
+        index = self._edge_index()
+        outgoing = index.imports_by_src.get(file_path, ())
+        incoming = index.imports_by_tgt.get(file_path, ())
         if outgoing or incoming:
-            lines.extend(["## Abhängigkeiten:", ""])
+            buf.write("## Abhängigkeiten:\n\n")
             if outgoing:
-                lines.append(f"- Importiert: {', '.join(outgoing)}")
+                buf.write(f"- Importiert: {', '.join(outgoing)}\n")
             if incoming:
                 # Count imports per source
-                import_counts: dict[str, int] = {}
-                for src in incoming:
-                    import_counts[src] = import_counts.get(src, 0) + 1
-                formatted = [
-                    f"{src} ({count}x)" for src, count in import_counts.items()
-                ]
-                lines.append(f"- Wird importiert von: {', '.join(formatted)}")
-            lines.append("")
+                import_counts = Counter(incoming)
+                if len(import_counts) == 1:
+                    # Common case: a single importer, no list to join
+                    ((src, count),) = import_counts.items()
+                    buf.write(f"- Wird importiert von: {src} ({count}x)\n")
+                else:
+                    formatted = [
+                        f"{src} ({count}x)" for src, count in import_counts.items()
+                    ]
+                    buf.write(f"- Wird importiert von: {', '.join(formatted)}\n")
+            buf.write("\n")
 
         # Risks
         if risks:
-            lines.extend(["## Risiken:", ""])
+            buf.write("## Risiken:\n\n")
             for risk in risks:
-                lines.append(f"- {risk}")
-            lines.append("")
+                buf.write(f"- {risk}\n")
+            buf.write("\n")
 
-        return "\n".join(lines)
+        return _page(buf)
 
     def render_symbol(self, file_path: str, symbol_name: str) -> str:
         """Render Level 3 - Symbol view.
@@ -255,39 +399,40 @@ class MapRenderer:
         if node_id not in self._graph.graph.nodes:
             raise ValueError(f"Symbol '{node_id}' not found in graph")
 
-        attrs = dict(self._graph.graph.nodes[node_id])
+        attrs = self._graph.graph.nodes[node_id]
         summary = self._get_node_summary(node_id)
         risks = self._get_node_risks(node_id)
         node_type = attrs.get("type", "unknown")
 
-        lines: list[str] = [f"# {node_id}", ""]
+        buf = io.StringIO()
+        buf.write(f"# {node_id}\n\n")
 
         # Signature
         if node_type == "function":
-            lines.extend(["## Signatur:", "", f"def {symbol_name}(...)", ""])
+            buf.write(f"## Signatur:\n\ndef {symbol_name}(...)\n\n")
         elif node_type == "class":
-            lines.extend(["## Signatur:", "", f"class {symbol_name}:", ""])
+            buf.write(f"## Signatur:\n\nclass {symbol_name}:\n\n")
 
         # Behavior (summary)
         if summary:
-            lines.extend(["## Verhalten:", "", summary, ""])
+            buf.write(f"## Verhalten:\n\n{summary}\n\n")
 
         # Callers (files importing the parent file)
         callers = self._find_callers(file_path)
         if callers:
-            lines.extend(["## Aufrufer:", ""])
+            buf.write("## Aufrufer:\n\n")
             for caller in callers:
-                lines.append(f"- {caller}")
-            lines.append("")
+                buf.write(f"- {caller}\n")
+            buf.write("\n")
 
         # Risks
         if risks:
-            lines.extend(["## Risiken:", ""])
+            buf.write("## Risiken:\n\n")
             for risk in risks:
-                lines.append(f"- {risk}")
-            lines.append("")
+                buf.write(f"- {risk}\n")
+            buf.write("\n")
 
-        return "\n".join(lines)
+        return _page(buf)
 
     def render_code(self, file_path: str, symbol_name: str) -> str:
         """Render Level 4 - Source code with line numbers.
@@ -303,14 +448,14 @@ class MapRenderer:
             ValueError: If root_path not set, symbol not found,
                 file not found, or invalid line range.
         """
-        if self._root_path is None:
+        if self._root_str is None:
             raise ValueError("root_path is required for code extraction")
 
         node_id = f"{file_path}::{symbol_name}"
         if node_id not in self._graph.graph.nodes:
             raise ValueError(f"Symbol '{node_id}' not found in graph")
 
-        attrs = dict(self._graph.graph.nodes[node_id])
+        attrs = self._graph.graph.nodes[node_id]
         start_line = attrs.get("start_line")
         end_line = attrs.get("end_line")
 
@@ -322,144 +467,167 @@ class MapRenderer:
                 f"Invalid line range for '{node_id}': {start_line}-{end_line}"
             )
 
-        abs_path = self._root_path / file_path
+        ext = _ext_of(file_path)
+        lang = _CODE_LANGUAGES.get(ext, ext)
+
+        # Stream only the requested lines into the page; no line list is kept
+        abs_path = os.path.join(self._root_str, file_path)
+        buf = io.StringIO()
+        buf.write(f"# {node_id} - Quellcode\n\n```{lang}\n")
         try:
-            content = abs_path.read_text()
+            with open(abs_path, encoding="utf-8") as source:
+                lines = itertools.islice(source, start_line - 1, end_line)
+                # Format with line numbers
+                for i, line in enumerate(lines, start=start_line):
+                    text = line.removesuffix("\n")
+                    buf.write(f"{i:4d} | {text}\n")
         except FileNotFoundError:
             raise ValueError(f"File not found: {abs_path}") from None
+        buf.write(f"```\n\nZeilen {start_line}-{end_line}")
 
-        all_lines = content.splitlines()
-        code_lines = all_lines[start_line - 1 : end_line]
+        return buf.getvalue()
 
-        # Format with line numbers
-        numbered: list[str] = []
-        for i, line in enumerate(code_lines, start=start_line):
-            numbered.append(f"{i:4d} | {line}")
+    async def arender_code(self, file_path: str, symbol_name: str) -> str:
+        """Render Level 4 in a worker thread.
 
-        ext = Path(file_path).suffix.lstrip(".")
-        lang_map: dict[str, str] = {
-            "py": "python",
-            "js": "javascript",
-            "ts": "typescript",
-        }
-        lang = lang_map.get(ext, ext)
-
-        result_lines: list[str] = [
-            f"# {node_id} - Quellcode",
-            "",
-            f"```{lang}",
-            *numbered,
-            "```",
-            "",
-            f"Zeilen {start_line}-{end_line}",
-        ]
+        Same output and errors as render_code(), but the source file is read
+        off the event loop so concurrent LLM calls are not stalled.
+
+        Args:
+            file_path: Parent file path (e.g. 'src/auth/login.py').
+            symbol_name: Symbol name (e.g. 'authenticate').
+
+        Returns:
+            Markdown string with source code block and line numbers.
 
-        return "\n".join(result_lines)
+        Raises:
+            ValueError: Same conditions as render_code().
+        """
+        return await asyncio.to_thread(self.render_code, file_path, symbol_name)
 
     # --- Private helpers ---
 
+    def _cached(self, key: tuple[str, ...], render: Callable[[], str]) -> str:
+        """Return a cached page, rendering it if missing or outdated.
+
+        The cache only ever holds pages for the current graph version; a
+        version change empties it first. Failed renders are not cached.
+        """
+        version = self._graph.version
+        if version != self._cache_version:
+            self._render_cache.clear()
+            self._cache_version = version
+        page = self._render_cache.get(key)
+        if page is None:
+            page = render()
+            self._render_cache[key] = page
+        return page
+
     def _get_node_summary(self, node_id: str) -> str:
         """Extract summary attribute or return empty string."""
-        if node_id not in self._graph.graph.nodes:
-            return ""
-        return str(self._graph.graph.nodes[node_id].get("summary", ""))
+        attrs = self._graph.graph.nodes.get(node_id)
+        return _attrs_summary(attrs) if attrs is not None else ""
 
     def _get_node_risks(self, node_id: str) -> list[str]:
         """Extract risks attribute or return empty list."""
-        if node_id not in self._graph.graph.nodes:
-            return []
-        risks = self._graph.graph.nodes[node_id].get("risks", [])
-        if isinstance(risks, list):
-            return [str(r) for r in risks]
-        return []
+        attrs = self._graph.graph.nodes.get(node_id)
+        return _attrs_risks(attrs) if attrs is not None else []
+
+    def _edge_index(self) -> _EdgeIndex:
+        """Return the edge index, rebuilding it if the graph has changed."""
+        version = self._graph.version
+        index = self._index
+        if index is not None and index.version == version:
+            return index
+
+        index = _EdgeIndex(version)
+        graph = self._graph.graph
+        contains = index.contains_children
+        imports_by_src = index.imports_by_src
+        for source, targets in graph._succ.items():  # type: ignore[attr-defined]
+            for target, data in targets.items():
+                relationship = data.get("relationship")
+                if relationship == _REL_CONTAINS:
+                    contains.setdefault(source, []).append(target)
+                elif relationship == _REL_IMPORTS:
+                    imports_by_src.setdefault(source, []).append(target)
+        # Walk predecessors separately to keep in_edges() order per target
+        imports_by_tgt = index.imports_by_tgt
+        for target, sources in graph._pred.items():  # type: ignore[attr-defined]
+            for source, data in sources.items():
+                if data.get("relationship") == _REL_IMPORTS:
+                    imports_by_tgt.setdefault(target, []).append(source)
+
+        self._index = index
+        return index
 
     def _collect_contains_children(
         self, node_id: str
-    ) -> list[tuple[str, dict[str, Any]]]:
-        """Collect all CONTAINS children with their attributes."""
-        children: list[tuple[str, dict[str, Any]]] = []
-        for _, target, data in self._graph.graph.out_edges(node_id, data=True):
-            if data.get("relationship") == "CONTAINS":
-                children.append((target, dict(self._graph.graph.nodes[target])))
-        return children
-
-    def _collect_imports(self, node_id: str) -> tuple[list[str], list[str]]:
-        """Collect outgoing and incoming IMPORTS edges for a node."""
-        outgoing: list[str] = []
-        incoming: list[str] = []
-        for _, target, data in self._graph.graph.out_edges(node_id, data=True):
-            if data.get("relationship") == "IMPORTS":
-                outgoing.append(target)
-        for source, _, data in self._graph.graph.in_edges(node_id, data=True):
-            if data.get("relationship") == "IMPORTS":
-                incoming.append(source)
-        return outgoing, incoming
-
-    def _get_parent_package(self, node_id: str) -> str | None:
-        """Determine the parent package path for a node.
-
-        For file nodes, returns the directory. For code nodes (with '::'),
-        first extracts the file path, then returns its directory.
-        """
-        if "::" in node_id:
-            node_id = node_id.split("::")[0]
-        path = Path(node_id)
-        if len(path.parts) > 1:
-            return str(Path(*path.parts[:-1]))
-        return None
+    ) -> list[tuple[str, Mapping[str, Any]]]:
+        """Collect all CONTAINS children with their live, read-only attributes."""
+        node_data = self._graph.graph.nodes
+        return [
+            (target, node_data[target])
+            for target in self._edge_index().contains_children.get(node_id, ())
+        ]
 
     def _collect_architecture_hints(self) -> list[str]:
         """Collect inter-package import relationships for architecture view."""
-        package_imports: set[tuple[str, str]] = set()
-        for source, target, data in self._graph.graph.edges(data=True):
-            if data.get("relationship") != "IMPORTS":
-                continue
-            source_pkg = self._get_parent_package(source)
-            target_pkg = self._get_parent_package(target)
-            if source_pkg and target_pkg and source_pkg != target_pkg:
-                package_imports.add((source_pkg, target_pkg))
+        index = self._edge_index()
+        package_imports = {
+            (source_pkg, target_pkg)
+            for source, targets in index.imports_by_src.items()
+            if (source_pkg := _parent_package(source))
+            for target in targets
+            if (target_pkg := _parent_package(target)) and target_pkg != source_pkg
+        }
         return [f"{src} importiert {tgt}" for src, tgt in sorted(package_imports)]
 
-    def _collect_internal_imports(self, package_id: str) -> list[str]:
-        """Collect import relationships between modules within a package."""
+    def _collect_internal_imports(
+        self, children: list[str], child_ids: frozenset[str]
+    ) -> list[str]:
+        """Collect import relationships between modules within a package.
+
+        Args:
+            children: The package's CONTAINS children, in edge order.
+            child_ids: The same IDs as a set for membership checks.
+        """
         internal: list[str] = []
-        children = self._collect_contains_children(package_id)
-        child_ids = {cid for cid, _ in children}
-
-        for child_id in child_ids:
-            for _, target, data in self._graph.graph.out_edges(child_id, data=True):
-                if data.get("relationship") == "IMPORTS" and target in child_ids:
-                    source_name = Path(child_id).name
-                    target_name = Path(target).name
+        index = self._edge_index()
+
+        for child_id in children:
+            for target in index.imports_by_src.get(child_id, ()):
+                if target in child_ids:
+                    source_name = os.path.basename(child_id)
+                    target_name = os.path.basename(target)
                     internal.append(f"{source_name} importiert {target_name}")
 
         return internal
 
     def _collect_package_external_imports(
-        self, package_id: str
+        self, children: list[str], child_ids: frozenset[str]
     ) -> tuple[list[str], list[str]]:
-        """Collect imports crossing the package boundary."""
-        outgoing: list[str] = []
-        incoming: list[str] = []
-        children = self._collect_contains_children(package_id)
-        child_ids = {cid for cid, _ in children}
-
-        for child_id in child_ids:
-            for _, target, data in self._graph.graph.out_edges(child_id, data=True):
-                if data.get("relationship") == "IMPORTS" and target not in child_ids:
-                    if target not in outgoing:
-                        outgoing.append(target)
-            for source, _, data in self._graph.graph.in_edges(child_id, data=True):
-                if data.get("relationship") == "IMPORTS" and source not in child_ids:
-                    if source not in incoming:
-                        incoming.append(source)
-
-        return outgoing, incoming
+        """Collect imports crossing the package boundary.
+
+        Args:
+            children: The package's CONTAINS children, in edge order.
+            child_ids: The same IDs as a set for membership checks.
+        """
+        # Insertion-ordered dicts deduplicate with O(1) membership checks
+        outgoing: dict[str, None] = {}
+        incoming: dict[str, None] = {}
+        index = self._edge_index()
+
+        for child_id in children:
+            for target in index.imports_by_src.get(child_id, ()):
+                if target not in child_ids:
+                    outgoing[target] = None
+            for source in index.imports_by_tgt.get(child_id, ()):
+                if source not in child_ids:
+                    incoming[source] = None
+
+        return list(outgoing), list(incoming)
 
     def _find_callers(self, file_path: str) -> list[str]:
         """Find files that import the given file (potential callers)."""
-        callers: list[str] = []
-        for source, _, data in self._graph.graph.in_edges(file_path, data=True):
-            if data.get("relationship") == "IMPORTS":
-                callers.append(source)
-        return callers
+        return list(self._edge_index().imports_by_tgt.get(file_path, ()))
@@ -93,4 +93,6 @@ class PlanCurator:
             openai.APIConnectionError: If LLM API connection fails.
             openai.APIError: If other LLM API errors occur.
         """
+        # Tool results are cached per session only
+        self._tools.clear_cache()
         return await self._agent.analyze_plan(plan)
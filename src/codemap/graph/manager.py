@@ -6,17 +6,76 @@ of code relationships using NetworkX.
 
 from __future__ import annotations
 
+import mmap
+import os
+import sys
+import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-import networkx as nx
 import orjson
-from networkx.readwrite import json_graph
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import networkx as nx
+
     from codemap.mapper.models import CodeNode
     from codemap.scout.models import FileEntry
 
+# Interned edge relationship values, so equality checks hit the identity fast path
+_REL_CONTAINS = sys.intern("CONTAINS")
+_REL_IMPORTS = sys.intern("IMPORTS")
+
+
+def _ancestor_dirs(path_id: str) -> list[str]:
+    """Return the ancestor directories of a path-like node ID, outermost first.
+
+    String-only equivalent of str(Path(*Path(path_id).parts[:i])) for each
+    i in 1..len(parts)-1, without building Path objects.
+
+    Args:
+        path_id: Normalized path string, e.g. 'src/auth/login.py'.
+
+    Returns:
+        Directory paths such as ['src', 'src/auth'].
+    """
+    ancestors: list[str] = []
+    sep = os.sep
+    end = path_id.find(sep)
+    while end != -1:
+        # A leading separator is the filesystem root itself
+        ancestors.append(path_id[:end] or sep)
+        end = path_id.find(sep, end + 1)
+    return ancestors
+
+
+def _load_json_mapped(path: Path) -> Any:
+    """Parse a JSON file from a read-only memory map.
+
+    orjson reads straight from the mapped pages, so the file is never
+    copied into a bytes object first and peak memory stays near the size
+    of the parsed result.
+
+    Args:
+        path: JSON file to parse.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        orjson.JSONDecodeError: If the file is empty or not valid JSON.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map empty files; let orjson report the error
+            return orjson.loads(b"")
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return orjson.loads(view)
+
 
 class GraphManager:
     """Manage a directed graph of code relationships using NetworkX.
@@ -81,8 +140,22 @@ class GraphManager:
 
     def __init__(self) -> None:
         """Initialize GraphManager with an empty directed graph."""
-        self._graph: nx.DiGraph[str] = nx.DiGraph()
+        # Deferred so importing codemap.graph (e.g. for CLI --help) does not
+        # pay NetworkX's ~200 ms import cost
+        from networkx import DiGraph
+
+        self._graph: nx.DiGraph[str] = DiGraph()
         self._build_metadata: dict[str, Any] = {}
+        # Lazily built level -> node IDs index, reset by mutating methods
+        self._level_index: dict[int, list[str]] | None = None
+        # Bumped by every structural change made through this class
+        self._version = 0
+        # Lazily built type -> node IDs index with the version it was built at
+        self._type_index: tuple[int, dict[str, list[str]]] | None = None
+        # Node/edge counts with the version they were taken at
+        self._stats: tuple[int, int, int] | None = None
+        # First project node, re-checked on use since it may have been removed
+        self._project_id: str | None = None
 
     @property
     def build_metadata(self) -> dict[str, Any]:
@@ -108,8 +181,8 @@ class GraphManager:
         """Return the underlying NetworkX directed graph.
 
         This property provides access to the raw NetworkX DiGraph for querying
-        and analysis. While direct modification is technically possible, prefer
-        using GraphManager methods for modifications:
+        and analysis. Treat it as read-only and use GraphManager methods for
+        modifications:
 
         Recommended API for modifications:
             - add_file(): Add file nodes
@@ -125,17 +198,118 @@ class GraphManager:
         Note:
             Direct modifications via graph.add_node() or graph.add_edge() bypass
             GraphManager's validation and may create inconsistent graph states.
-            Use the GraphManager methods for proper encapsulation.
+            Caches keyed on version (graph_stats, nodes_by_type(),
+            nodes_by_level(), rendered pages) do not see them either; code
+            that writes through this property, such as the enrichers, must
+            call mark_modified() afterwards.
 
         Returns:
             The directed graph managed by this instance.
         """
         return self._graph
 
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the graph structure changes.
+
+        Every GraphManager method that adds or removes nodes or edges
+        increments it, so readers can cache derived indexes and rebuild them
+        when the value differs from the one they were built at. Attribute
+        updates (e.g. summaries) and changes made directly on the graph
+        property only count once mark_modified() is called.
+
+        Returns:
+            Monotonically increasing structure version.
+
+        Example:
+            >>> manager = GraphManager()
+            >>> before = manager.version
+            >>> manager.add_file(FileEntry(Path("src/main.py"), 100, 25))
+            >>> manager.version > before
+            True
+        """
+        return self._version
+
+    def mark_modified(self) -> None:
+        """Bump the version after changing the graph directly.
+
+        Call this after writing node attributes (e.g. summaries) or edges
+        through the graph property, so caches keyed on version, such as
+        MapRenderer pages, are rebuilt.
+
+        Example:
+            >>> before = manager.version
+            >>> manager.graph.nodes["src/main.py"]["summary"] = "Entry point"
+            >>> manager.mark_modified()
+            >>> manager.version > before
+            True
+        """
+        self._level_index = None
+        self._version += 1
+
+    def nodes_by_level(self) -> dict[int, list[str]]:
+        """Return node IDs grouped by their hierarchy level attribute.
+
+        The index is built on first use and cached until the graph is changed
+        through a GraphManager method, so repeated enrichment passes do not
+        rescan every node. Nodes without a level are omitted. Changes made
+        directly on the graph property are not tracked.
+
+        Returns:
+            Mapping of level to node IDs in insertion order. Treat as
+            read-only; it is shared between calls.
+
+        Example:
+            >>> manager.build_hierarchy("MyProject")
+            >>> manager.nodes_by_level()[0]
+            ['project::MyProject']
+        """
+        if self._level_index is None:
+            index: dict[int, list[str]] = {}
+            for node_id, attrs in self._graph._node.items():  # type: ignore[attr-defined]
+                level = attrs.get("level")
+                if level is not None:
+                    index.setdefault(int(level), []).append(node_id)
+            self._level_index = index
+        return self._level_index
+
+    def nodes_by_type(self) -> dict[str, list[str]]:
+        """Return node IDs grouped by their type attribute.
+
+        Built on first use and cached until version changes, so lookups such
+        as finding the project node do not scan the whole graph. Nodes
+        without a type are omitted. Changes made directly on the graph
+        property are not tracked.
+
+        Returns:
+            Mapping of node type to node IDs in insertion order. Treat as
+            read-only; it is shared between calls.
+
+        Example:
+            >>> manager.build_hierarchy("MyProject")
+            >>> manager.nodes_by_type()["project"]
+            ['project::MyProject']
+        """
+        cached = self._type_index
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        index: dict[str, list[str]] = {}
+        for node_id, attrs in self._graph._node.items():  # type: ignore[attr-defined]
+            node_type = attrs.get("type")
+            if node_type is not None:
+                index.setdefault(node_type, []).append(node_id)
+        self._type_index = (self._version, index)
+        return index
+
     @property
     def graph_stats(self) -> dict[str, int]:
         """Return statistics about the graph.
 
+        Counts are cached until version changes, so polling between builds
+        is O(1). Every mutating GraphManager method bumps the version;
+        changes made directly on the graph property are picked up once
+        mark_modified() is called.
+
         Returns:
             dict[str, int]: Dictionary with keys 'nodes' and 'edges' containing
                 the respective counts as integers.
@@ -145,10 +319,14 @@ class GraphManager:
             >>> manager.graph_stats
             {'nodes': 0, 'edges': 0}
         """
-        return {
-            "nodes": self._graph.number_of_nodes(),
-            "edges": self._graph.number_of_edges(),
-        }
+        stats = self._stats
+        if stats is None or stats[0] != self._version:
+            # Count adjacency entries directly; number_of_edges() goes through
+            # the degree view and sums per-node degrees in Python
+            succ = self._graph._succ  # type: ignore[attr-defined]
+            stats = (self._version, len(self._graph), sum(map(len, succ.values())))
+            self._stats = stats
+        return {"nodes": stats[1], "edges": stats[2]}
 
     def add_file(self, entry: FileEntry) -> None:
         """Add a file node to the graph.
@@ -168,13 +346,54 @@ class GraphManager:
             >>> "src/main.py" in manager.graph.nodes
             True
         """
-        node_id = str(entry.path)
-        self._graph.add_node(
-            node_id,
-            type="file",
-            size=entry.size,
-            token_est=entry.token_est,
-        )
+        self.add_file_raw(str(entry.path), entry.size, entry.token_est)
+
+    def add_file_raw(self, file_id: str, size: int, token_est: int) -> None:
+        """Add a file node from plain values, without a FileEntry.
+
+        Same as add_file(), for internal callers that already hold the node
+        ID and metadata and would otherwise build a FileEntry just to pass
+        them through.
+
+        Args:
+            file_id: Node ID of the file (relative path string).
+            size: File size in bytes.
+            token_est: Estimated token count.
+
+        Example:
+            >>> manager = GraphManager()
+            >>> manager.add_file_raw("src/main.py", size=1024, token_est=256)
+            >>> manager.graph.nodes["src/main.py"]["size"]
+            1024
+        """
+        self._graph.add_node(file_id, type="file", size=size, token_est=token_est)
+        self._version += 1
+
+    def add_files_bulk(self, entries: Iterable[FileEntry]) -> None:
+        """Add many file nodes in a single pass.
+
+        Same result as calling add_file() for each entry, but hands all nodes
+        to NetworkX at once and bumps the version only once.
+
+        Args:
+            entries: FileEntry objects to add. Existing nodes are updated.
+
+        Example:
+            >>> manager = GraphManager()
+            >>> manager.add_files_bulk([
+            ...     FileEntry(Path("src/main.py"), 1024, 256),
+            ...     FileEntry(Path("src/utils.py"), 512, 128),
+            ... ])
+            >>> manager.graph_stats
+            {'nodes': 2, 'edges': 0}
+        """
+        nodes = [
+            (str(e.path), {"type": "file", "size": e.size, "token_est": e.token_est})
+            for e in entries
+        ]
+        if nodes:
+            self._graph.add_nodes_from(nodes)
+            self._version += 1
 
     def add_node(self, parent_file_id: str, node: CodeNode) -> None:
         """Add a code node to the graph with a CONTAINS edge from its parent file.
@@ -204,10 +423,12 @@ class GraphManager:
             >>> manager.graph.has_edge("src/app.py", "src/app.py::main")
             True
         """
-        if parent_file_id not in self._graph.nodes:
+        # Plain dict lookup on the node table, one per call
+        parent_attrs = self._graph._node.get(parent_file_id)  # type: ignore[attr-defined]
+        if parent_attrs is None:
             raise ValueError(f"Parent file '{parent_file_id}' does not exist in graph")
 
-        if self._graph.nodes[parent_file_id].get("type") != "file":
+        if parent_attrs.get("type") != "file":
             raise ValueError(f"Node '{parent_file_id}' is not a file node")
 
         code_node_id = f"{parent_file_id}::{node.name}"
@@ -218,7 +439,60 @@ class GraphManager:
             start_line=node.start_line,
             end_line=node.end_line,
         )
-        self._graph.add_edge(parent_file_id, code_node_id, relationship="CONTAINS")
+        self._graph.add_edge(parent_file_id, code_node_id, relationship=_REL_CONTAINS)
+        self._version += 1
+
+    def add_nodes_bulk(self, parent_file_id: str, nodes: Iterable[CodeNode]) -> None:
+        """Add many code nodes of one file in a single pass.
+
+        Same result as calling add_node() for each node, but the parent is
+        validated once and all nodes and CONTAINS edges are handed to
+        NetworkX at once.
+
+        Args:
+            parent_file_id: The file node ID that contains the code elements.
+            nodes: CodeNode objects to add.
+
+        Raises:
+            ValueError: If parent_file_id does not exist in graph.
+            ValueError: If parent_file_id exists but is not a file node.
+
+        Example:
+            >>> manager = GraphManager()
+            >>> manager.add_file(FileEntry(Path("src/app.py"), 512, 128))
+            >>> manager.add_nodes_bulk("src/app.py", [
+            ...     CodeNode("function", "main", 1, 10),
+            ...     CodeNode("class", "App", 12, 40),
+            ... ])
+            >>> manager.graph_stats
+            {'nodes': 3, 'edges': 2}
+        """
+        parent_attrs = self._graph._node.get(parent_file_id)  # type: ignore[attr-defined]
+        if parent_attrs is None:
+            raise ValueError(f"Parent file '{parent_file_id}' does not exist in graph")
+
+        if parent_attrs.get("type") != "file":
+            raise ValueError(f"Node '{parent_file_id}' is not a file node")
+
+        code_nodes = [
+            (
+                f"{parent_file_id}::{node.name}",
+                {
+                    "type": node.type,
+                    "name": node.name,
+                    "start_line": node.start_line,
+                    "end_line": node.end_line,
+                },
+            )
+            for node in nodes
+        ]
+        if code_nodes:
+            self._graph.add_nodes_from(code_nodes)
+            self._graph.add_edges_from(
+                ((parent_file_id, code_node_id) for code_node_id, _ in code_nodes),
+                relationship=_REL_CONTAINS,
+            )
+            self._version += 1
 
     def add_dependency(self, source_file_id: str, target_file_id: str) -> None:
         """Add an IMPORTS edge between two nodes.
@@ -272,14 +546,47 @@ class GraphManager:
             >>> # Enrich the lazy node with type attribute
             >>> manager.graph.nodes["external::os"]["type"] = "external_module"
         """
-        if source_file_id not in self._graph.nodes:
+        if source_file_id not in self._graph._node:  # type: ignore[attr-defined]
             raise ValueError(f"Source node '{source_file_id}' not found in graph")
 
-        # Create target node lazily if it doesn't exist
-        if target_file_id not in self._graph.nodes:
-            self._graph.add_node(target_file_id)
+        # add_edge creates a missing target node lazily, without attributes
+        self._graph.add_edge(source_file_id, target_file_id, relationship=_REL_IMPORTS)
+        self._version += 1
+
+    def add_dependencies_bulk(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Add many IMPORTS edges in a single pass.
 
-        self._graph.add_edge(source_file_id, target_file_id, relationship="IMPORTS")
+        Same result as calling add_dependency() for each (source, target)
+        pair, including lazy creation of missing targets. All sources are
+        validated before anything is added, so a bad pair leaves the graph
+        unchanged.
+
+        Args:
+            pairs: (source_file_id, target_file_id) tuples.
+
+        Raises:
+            ValueError: If any source_file_id does not exist in graph.
+
+        Example:
+            >>> manager = GraphManager()
+            >>> manager.add_file(FileEntry(Path("src/main.py"), 512, 128))
+            >>> manager.add_dependencies_bulk([
+            ...     ("src/main.py", "external::os"),
+            ...     ("src/main.py", "external::sys"),
+            ... ])
+            >>> manager.graph_stats
+            {'nodes': 3, 'edges': 2}
+        """
+        edges = list(pairs)
+        node_data = self._graph._node  # type: ignore[attr-defined]
+        for source_file_id, _ in edges:
+            if source_file_id not in node_data:
+                raise ValueError(f"Source node '{source_file_id}' not found in graph")
+
+        if edges:
+            # add_edges_from creates missing targets without attributes
+            self._graph.add_edges_from(edges, relationship=_REL_IMPORTS)
+            self._version += 1
 
     def add_external_module(self, module_name: str) -> str:
         """Add an external module node to the graph.
@@ -321,12 +628,15 @@ class GraphManager:
         node_id = f"external::{module_name}"
 
         # If node already exists, do NOT overwrite attributes
-        if node_id in self._graph.nodes:
+        attrs = self._graph._node.get(node_id)  # type: ignore[attr-defined]
+        if attrs is not None:
             # Only add missing attributes, preserve existing ones
-            if "type" not in self._graph.nodes[node_id]:
-                self._graph.nodes[node_id]["type"] = "external_module"
-            if "name" not in self._graph.nodes[node_id]:
-                self._graph.nodes[node_id]["name"] = module_name
+            if "type" not in attrs:
+                attrs["type"] = "external_module"
+                self._version += 1
+            if "name" not in attrs:
+                attrs["name"] = module_name
+                self._version += 1
         else:
             # Create new node with attributes
             self._graph.add_node(
@@ -334,6 +644,7 @@ class GraphManager:
                 type="external_module",
                 name=module_name,
             )
+            self._version += 1
 
         return node_id
 
@@ -356,11 +667,13 @@ class GraphManager:
             >>> "src/test.py" in manager.graph.nodes
             False
         """
-        if node_id not in self._graph.nodes:
+        if node_id not in self._graph._node:  # type: ignore[attr-defined]
             raise ValueError(f"Node '{node_id}' not found in graph")
         self._graph.remove_node(node_id)
+        self._level_index = None
+        self._version += 1
 
-    def remove_file(self, file_id: str) -> None:
+    def remove_file(self, file_id: str, missing_ok: bool = False) -> bool:
         """Remove a file node and all contained code nodes.
 
         Finds all nodes connected via CONTAINS edge (code elements like functions
@@ -369,9 +682,15 @@ class GraphManager:
 
         Args:
             file_id: ID of the file node to remove.
+            missing_ok: If True, a missing node is not an error and False is
+                returned instead, so callers need no separate membership check.
+
+        Returns:
+            True if the file was removed, False if it was missing and
+            missing_ok is True.
 
         Raises:
-            ValueError: If node does not exist in graph.
+            ValueError: If node does not exist in graph and missing_ok is False.
             ValueError: If node exists but is not a file node (type != "file").
 
         Example:
@@ -384,22 +703,28 @@ class GraphManager:
             >>> "src/test.py::func" in manager.graph.nodes
             False
         """
-        if file_id not in self._graph.nodes:
+        attrs = self._graph.nodes.get(file_id)
+        if attrs is None:
+            if missing_ok:
+                return False
             raise ValueError(f"Node '{file_id}' not found in graph")
-        if self._graph.nodes[file_id].get("type") != "file":
+        if attrs.get("type") != "file":
             raise ValueError(f"Node '{file_id}' is not a file node")
 
         # Collect children connected via CONTAINS edges
         children = [
             target
             for _, target, data in self._graph.out_edges(file_id, data=True)
-            if data.get("relationship") == "CONTAINS"
+            if data.get("relationship") == _REL_CONTAINS
         ]
 
         # Remove children first, then the file node
         for child_id in children:
             self._graph.remove_node(child_id)
         self._graph.remove_node(file_id)
+        self._level_index = None
+        self._version += 1
+        return True
 
     def add_project(self, name: str) -> None:
         """Add a project root node (level 0) to the graph.
@@ -416,6 +741,8 @@ class GraphManager:
             >>> manager.graph.nodes["project::MyProject"]["level"]
             0
         """
+        self._level_index = None
+        self._version += 1
         node_id = f"project::{name}"
         self._graph.add_node(
             node_id,
@@ -424,6 +751,26 @@ class GraphManager:
             name=name,
         )
 
+    def _find_project(self) -> str | None:
+        """Return the ID of the first project node, or None if there is none.
+
+        The ID found by the last scan is verified with a dict lookup, so
+        repeated add_package() calls scan the node table only once, and
+        again only after that project is gone.
+        """
+        nodes = self._graph._node  # type: ignore[attr-defined]
+        project_id = self._project_id
+        if project_id is not None:
+            attrs = nodes.get(project_id)
+            if attrs is not None and attrs.get("type") == "project":
+                return project_id
+        self._project_id = None
+        for node_id, attrs in nodes.items():
+            if attrs.get("type") == "project":
+                self._project_id = node_id
+                break
+        return self._project_id
+
     def add_package(self, package_path: str, project_id: str | None = None) -> None:
         """Add a package node with correct level and parent CONTAINS edge.
 
@@ -443,6 +790,8 @@ class GraphManager:
             >>> manager.graph.nodes["src"]["level"]
             1
         """
+        self._level_index = None
+        self._version += 1
         parts = Path(package_path).parts
         name = parts[-1] if parts else package_path
 
@@ -456,18 +805,14 @@ class GraphManager:
         # Connect to parent
         if len(parts) > 1:
             parent_path = str(Path(*parts[:-1]))
-            if parent_path in self._graph.nodes:
-                self._graph.add_edge(parent_path, package_path, relationship="CONTAINS")
+            if parent_path in self._graph._node:  # type: ignore[attr-defined]
+                self._graph.add_edge(parent_path, package_path, relationship=_REL_CONTAINS)
         else:
             # Root-level package: connect to project node
             if project_id is None:
-                # Find existing project node
-                for node_id, attrs in self._graph.nodes(data=True):
-                    if attrs.get("type") == "project":
-                        project_id = node_id
-                        break
+                project_id = self._find_project()
             if project_id:
-                self._graph.add_edge(project_id, package_path, relationship="CONTAINS")
+                self._graph.add_edge(project_id, package_path, relationship=_REL_CONTAINS)
 
     def build_hierarchy(self, project_name: str) -> None:
         """Build hierarchical structure from existing file nodes.
@@ -488,48 +833,60 @@ class GraphManager:
             >>> "src/auth" in manager.graph.nodes
             True
         """
+        self._level_index = None
+        self._version += 1
         project_id = f"project::{project_name}"
         self.add_project(project_name)
 
-        # Collect all unique directory paths from file nodes
-        directories: set[str] = set()
-        for node_id, attrs in self._graph.nodes(data=True):
-            if attrs.get("type") == "file":
-                path = Path(node_id)
-                for i in range(1, len(path.parts)):
-                    directories.add(str(Path(*path.parts[:i])))
+        # One type-index build replaces separate full scans for file and
+        # code nodes; the lists stay valid while packages are added below
+        by_type = self.nodes_by_type()
+        node_table = self._graph._node  # type: ignore[attr-defined]
+
+        # Collect file nodes with their ancestor directories, and the depth
+        # of every unique directory (its number of path parts)
+        file_dirs = [
+            (node_id, node_table[node_id], _ancestor_dirs(node_id))
+            for node_id in by_type.get("file", ())
+        ]
+        directories: dict[str, int] = {}
+        for _, _, ancestors in file_dirs:
+            for depth, dir_path in enumerate(ancestors, start=1):
+                directories[dir_path] = depth
 
         # Create package nodes sorted by depth for proper parent creation
-        for dir_path in sorted(directories, key=lambda p: len(Path(p).parts)):
+        for dir_path in sorted(directories, key=directories.__getitem__):
             self.add_package(dir_path, project_id)
 
-        # Set level on file nodes and connect to parent package
-        file_nodes = [nid for nid, a in self._graph.nodes(data=True) if a.get("type") == "file"]
-        for node_id in file_nodes:
-            path = Path(node_id)
-            self._graph.nodes[node_id]["level"] = len(path.parts)
+        # Set level on file nodes and connect to parent package, handing all
+        # CONTAINS edges to NetworkX in one call
+        file_edges: list[tuple[str, str]] = []
+        for node_id, attrs, ancestors in file_dirs:
+            attrs["level"] = len(ancestors) + 1
 
-            if len(path.parts) > 1:
-                parent_dir = str(Path(*path.parts[:-1]))
-                if parent_dir in self._graph.nodes:
-                    self._graph.add_edge(parent_dir, node_id, relationship="CONTAINS")
+            if ancestors:
+                parent_dir = ancestors[-1]
+                if parent_dir in node_table:
+                    file_edges.append((parent_dir, node_id))
             else:
-                self._graph.add_edge(project_id, node_id, relationship="CONTAINS")
+                file_edges.append((project_id, node_id))
+        self._graph.add_edges_from(file_edges, relationship=_REL_CONTAINS)
 
         # Set level on code nodes (file_level + 1)
-        for node_id, attrs in self._graph.nodes(data=True):
-            if attrs.get("type") in ("function", "class"):
-                file_id = node_id.split("::")[0]
-                if file_id in self._graph.nodes:
-                    file_level = self._graph.nodes[file_id].get("level", 0)
-                    self._graph.nodes[node_id]["level"] = file_level + 1
+        code_ids = (*by_type.get("function", ()), *by_type.get("class", ()))
+        for node_id in code_ids:
+            file_attrs = node_table.get(node_id.split("::")[0])
+            if file_attrs is not None:
+                node_table[node_id]["level"] = file_attrs.get("level", 0) + 1
 
     def save(self, path: Path) -> None:
         """Save the graph to a JSON file using orjson.
 
-        Serializes the graph using NetworkX's node_link_data format and writes
+        Serializes the graph in NetworkX's node_link_data format and writes
         it to the specified path. Parent directories are created automatically
-        if they don't exist.
+        if they don't exist. Output is streamed into a temporary file next to
+        path and moved into place only once complete, so a failed save leaves
+        an existing file untouched.
 
         Args:
             path: Path object specifying where to save the graph JSON file.
@@ -539,6 +896,8 @@ class GraphManager:
 
         Raises:
             OSError: If the file cannot be written (e.g., permission denied).
+            TypeError: If a node, edge or build_metadata value is not JSON
+                serializable.
 
         Example:
             >>> manager = GraphManager()
@@ -546,10 +905,47 @@ class GraphManager:
             >>> manager.save(Path("output/graph.json"))  # Creates output/ if needed
         """
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = json_graph.node_link_data(self._graph)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with tmp_path.open("xb") as out:
+                self._write_node_link(out)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write_node_link(self, out: BinaryIO) -> None:
+        """Stream the node_link_data JSON, one node or edge at a time.
+
+        Writes the same bytes as orjson.dumps() of
+        json_graph.node_link_data(self._graph) plus build_metadata, but
+        never holds more than one serialized item in memory.
+
+        Args:
+            out: Binary file object to write to.
+        """
+        graph = self._graph
+        out.write(b'{"directed":true,"multigraph":false,"graph":')
+        out.write(orjson.dumps(graph.graph))
+        out.write(b',"nodes":[')
+        sep = b""
+        # Walk the node and adjacency dicts directly instead of the
+        # nodes()/edges() data views
+        for n, attrs in graph._node.items():  # type: ignore[attr-defined]
+            out.write(sep)
+            out.write(orjson.dumps({**attrs, "id": n}))
+            sep = b","
+        out.write(b'],"edges":[')
+        sep = b""
+        for u, nbrs in graph._succ.items():  # type: ignore[attr-defined]
+            for v, attrs in nbrs.items():
+                out.write(sep)
+                out.write(orjson.dumps({**attrs, "source": u, "target": v}))
+                sep = b","
         # Add build_metadata to serialized data
-        data["build_metadata"] = self._build_metadata
-        path.write_bytes(orjson.dumps(data))
+        out.write(b'],"build_metadata":')
+        out.write(orjson.dumps(self._build_metadata))
+        out.write(b"}")
 
     def load(self, path: Path) -> None:
         """Load a graph from a JSON file.
@@ -568,7 +964,8 @@ class GraphManager:
             FileNotFoundError: If the specified file does not exist.
             ValueError: If the file contains syntactically invalid JSON.
             ValueError: If the JSON structure does not conform to node_link_data
-                schema (e.g., missing 'nodes' or 'links' keys).
+                schema (e.g., missing 'nodes' or 'edges' keys). Files written
+                with the pre-3.6 NetworkX 'links' key are accepted.
 
         Example:
             >>> manager = GraphManager()
@@ -581,26 +978,64 @@ class GraphManager:
             raise FileNotFoundError(f"Graph file not found: {path}")
 
         try:
-            data = orjson.loads(path.read_bytes())
+            data = _load_json_mapped(path)
         except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in graph file: {e}") from e
 
-        # Create temporary graph from loaded data
+        # Split the decoded node/edge dicts into (id, attrs) in place; the
+        # parsed dicts become the attribute dicts, no temporary graph needed.
+        # NetworkX before 3.6 wrote edges under "links", so accept both.
         try:
-            temp_graph: nx.DiGraph[str] = json_graph.node_link_graph(data, directed=True)
-        except (KeyError, TypeError, ValueError) as e:
+            nodes = [(d.pop("id"), d) for d in data["nodes"]]
+            edge_list = data["edges"] if "edges" in data else data["links"]
+            edges = [(d.pop("source"), d.pop("target"), d) for d in edge_list]
+        except (KeyError, TypeError, AttributeError) as e:
             raise ValueError(f"Invalid graph schema in file: {e}") from e
 
+        # Intern decoded node types and relationships. orjson already shares
+        # decoded keys, but every value is a fresh string; these few distinct
+        # values repeat on every node and edge.
+        for _, attrs in nodes:
+            node_type = attrs.get("type")
+            if isinstance(node_type, str):
+                attrs["type"] = sys.intern(node_type)
+        for _, _, attrs in edges:
+            relationship = attrs.get("relationship")
+            if isinstance(relationship, str):
+                attrs["relationship"] = sys.intern(relationship)
+
         # Clear existing graph while preserving instance identity
         self._graph.clear()
-
-        # Copy all nodes with their attributes
-        for node_id, attrs in temp_graph.nodes(data=True):
-            self._graph.add_node(node_id, **attrs)
-
-        # Copy all edges with their attributes
-        for source, target, attrs in temp_graph.edges(data=True):
-            self._graph.add_edge(source, target, **attrs)
+        self._level_index = None
+        self._project_id = None
+        self._version += 1
+
+        # Fill NetworkX's node/adjacency dicts directly. Same result as
+        # add_nodes_from()/add_edges_from() (duplicates merge, missing edge
+        # endpoints are created bare), without their per-item overhead.
+        node_table = self._graph._node  # type: ignore[attr-defined]
+        succ = self._graph._succ  # type: ignore[attr-defined]
+        pred = self._graph._pred  # type: ignore[attr-defined]
+        for node_id, attrs in nodes:
+            existing = node_table.get(node_id)
+            if existing is None:
+                node_table[node_id] = attrs
+                succ[node_id] = {}
+                pred[node_id] = {}
+            else:
+                existing.update(attrs)
+        for source, target, attrs in edges:
+            for endpoint in (source, target):
+                if endpoint not in node_table:
+                    node_table[endpoint] = {}
+                    succ[endpoint] = {}
+                    pred[endpoint] = {}
+            existing = succ[source].get(target)
+            if existing is None:
+                succ[source][target] = attrs
+                pred[target][source] = attrs
+            else:
+                existing.update(attrs)
 
         # Restore build_metadata if present
         self._build_metadata = data.get("build_metadata", {})
@@ -4,6 +4,7 @@ This module provides tools to parse source code using tree-sitter and extract
 structural information (classes, functions) and dependencies (imports).
 """
 
+from codemap.mapper.cache import ParseCache
 from codemap.mapper.engine import (
     LANGUAGE_MAP,
     ParserEngine,
@@ -17,6 +18,7 @@ __all__ = [
     "ContentReader",
     "ContentReadError",
     "LANGUAGE_MAP",
+    "ParseCache",
     "ParserEngine",
     "QueryLoadError",
     "get_supported_languages",
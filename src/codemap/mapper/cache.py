@@ -0,0 +1,202 @@
+"""Persistent cache of parse results keyed by file path and content hash.
+
+This module provides the ParseCache class, a small SQLite-backed store that
+lets callers skip tree-sitter parsing when a file's content has been parsed
+before (e.g. an mtime-only change or switching back to a previous branch).
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections.abc import Iterable
+from importlib.resources import files
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import orjson
+
+from codemap import __version__
+from codemap.mapper.models import CodeNode
+
+# Bump when the stored row layout or the meaning of cached results changes
+_CACHE_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    path TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    nodes BLOB NOT NULL,
+    PRIMARY KEY (path, digest)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def parser_version() -> str:
+    """Return the version tag that cached parse results are valid for.
+
+    Combines the cache row format, the codemap version and the content of
+    every .scm query file, so upgrading codemap or editing a query
+    invalidates results parsed by the old code.
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+    hasher = hashlib.sha256(f"{_CACHE_FORMAT}:{__version__}".encode())
+    languages_dir = files("codemap.mapper.languages")
+    for query_file in sorted(languages_dir.iterdir(), key=lambda f: f.name):
+        if query_file.name.endswith(".scm"):
+            hasher.update(query_file.name.encode())
+            hasher.update(query_file.read_bytes())
+    return hasher.hexdigest()
+
+
+class ParseCache:
+    """Cache ParserEngine results by (path, content digest).
+
+    Entries are stored as JSON arrays of [type, name, start_line, end_line]
+    rows, so no code is ever unpickled from disk. Several content versions
+    of the same path are kept, which makes branch switches cheap; prune()
+    bounds how many. All entries are dropped when the database was written
+    for a different parser_version().
+
+    Thread Safety:
+        A single instance may be shared between threads; all database
+        access is serialized through an internal lock.
+
+    Example:
+        >>> cache = ParseCache(Path(".codemap/parse_cache.sqlite"))
+        >>> digest = ParseCache.digest(content)
+        >>> nodes = cache.get("src/main.py", digest)
+        >>> if nodes is None:
+        ...     nodes = parser.parse_file(Path("src/main.py"), content)
+        ...     cache.put("src/main.py", digest, nodes)
+    """
+
+    def __init__(self, db_path: Path | str = ":memory:", version: str | None = None) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite database file. Defaults to an in-memory database.
+            version: Version tag the stored results must match. Defaults to
+                parser_version(). On a mismatch all cached rows are deleted.
+        """
+        if version is None:
+            version = parser_version()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != version:
+            self._conn.execute("DELETE FROM parse_cache")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,)
+            )
+        self._conn.commit()
+
+    @staticmethod
+    def digest(content: str) -> str:
+        """Return the cache key digest for a file's content.
+
+        Args:
+            content: Decoded file content.
+
+        Returns:
+            Hex-encoded SHA-256 digest of the UTF-8 encoded content.
+        """
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, path: str, digest: str) -> list[CodeNode] | None:
+        """Look up cached parse results.
+
+        Args:
+            path: Relative file path (graph node ID).
+            digest: Content digest from digest().
+
+        Returns:
+            Cached CodeNode list, or None on a cache miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT nodes FROM parse_cache WHERE path = ? AND digest = ?",
+                (path, digest),
+            ).fetchone()
+        if row is None:
+            return None
+        return [CodeNode(*fields) for fields in orjson.loads(row[0])]
+
+    def put(self, path: str, digest: str, nodes: list[CodeNode]) -> None:
+        """Store parse results for a file version.
+
+        Args:
+            path: Relative file path (graph node ID).
+            digest: Content digest from digest().
+            nodes: CodeNode list produced by the parser.
+        """
+        payload = orjson.dumps([(n.type, n.name, n.start_line, n.end_line) for n in nodes])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_cache (path, digest, nodes) VALUES (?, ?, ?)",
+                (path, digest, payload),
+            )
+            self._conn.commit()
+
+    def prune(self, live_paths: Iterable[str], keep: int = 3) -> int:
+        """Drop entries for deleted files and old content versions.
+
+        Args:
+            live_paths: Paths (graph node IDs) that still exist. Entries for
+                any other path are deleted.
+            keep: Number of most recently stored digests to keep per path.
+
+        Returns:
+            Number of deleted entries.
+        """
+        live = set(live_paths)
+        with self._lock:
+            before = self._conn.total_changes
+            stored = self._conn.execute("SELECT DISTINCT path FROM parse_cache").fetchall()
+            self._conn.executemany(
+                "DELETE FROM parse_cache WHERE path = ?",
+                [row for row in stored if row[0] not in live],
+            )
+            # REPLACE re-inserts a row, so rowid order is storage order
+            self._conn.execute(
+                """
+                DELETE FROM parse_cache WHERE rowid IN (
+                    SELECT rowid FROM (
+                        SELECT rowid, ROW_NUMBER() OVER (
+                            PARTITION BY path ORDER BY rowid DESC
+                        ) AS rank
+                        FROM parse_cache
+                    ) WHERE rank > ?
+                )
+                """,
+                (keep,),
+            )
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> Self:
+        """Return self for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the cache when leaving the context."""
+        self.close()
@@ -4,11 +4,13 @@ This module provides the main parsing functionality that uses tree-sitter
 to analyze source code and extract structural information.
 """
 
+import threading
+from collections import OrderedDict
 from importlib.resources import files
 from pathlib import Path
 from typing import Iterator
 
-from tree_sitter import Node, Query, QueryCursor
+from tree_sitter import Node, Point, Query, QueryCursor, Tree
 from tree_sitter_language_pack import get_language, get_parser
 
 from codemap.mapper.models import CodeNode, QueryLoadError
@@ -20,6 +22,67 @@ LANGUAGE_MAP: dict[str, str] = {
 }
 
 
+def _common_prefix_len(a: bytes, b: bytes, limit: int) -> int:
+    """Return the length of the common prefix of a and b, at most limit.
+
+    Binary search over slice comparisons keeps the work in C (memcmp)
+    instead of a per-byte Python loop.
+    """
+    va, vb = memoryview(a), memoryview(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if va[:mid] == vb[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: bytes, b: bytes, limit: int) -> int:
+    """Return the length of the common suffix of a and b, at most limit."""
+    va, vb = memoryview(a), memoryview(b)
+    len_a, len_b = len(a), len(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if va[len_a - mid :] == vb[len_b - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(source: bytes, offset: int) -> Point:
+    """Convert a byte offset into a tree-sitter (row, column) point."""
+    row = source.count(b"\n", 0, offset)
+    column = offset - (source.rfind(b"\n", 0, offset) + 1)
+    return Point(row, column)
+
+
+def _edit_tree(tree: Tree, old: bytes, new: bytes) -> None:
+    """Describe the change from old to new source as a single tree edit.
+
+    The edited region spans from the first differing byte to the start of
+    the common suffix, which is enough for tree-sitter to reuse every
+    subtree outside of it.
+    """
+    prefix = _common_prefix_len(old, new, min(len(old), len(new)))
+    if prefix == len(old) == len(new):
+        return
+    suffix = _common_suffix_len(old, new, min(len(old), len(new)) - prefix)
+    old_end = len(old) - suffix
+    new_end = len(new) - suffix
+    tree.edit(
+        start_byte=prefix,
+        old_end_byte=old_end,
+        new_end_byte=new_end,
+        start_point=_point_at(old, prefix),
+        old_end_point=_point_at(old, old_end),
+        new_end_point=_point_at(new, new_end),
+    )
+
+
 def get_supported_languages() -> set[str]:
     """Return the set of language IDs that have .scm query files in the languages/ directory.
 
@@ -72,16 +135,56 @@ class ParserEngine:
         # Or use parse_file for automatic language detection:
         >>> nodes = engine.parse_file(Path("example.py"), code)
 
+    Incremental Reparsing:
+        With tree_cache_size > 0, parse_file() keeps the syntax tree of the
+        most recently parsed files. Parsing the same path again edits the
+        old tree with the changed byte range and lets tree-sitter reuse all
+        unchanged subtrees, so reparse cost follows the size of the edit
+        rather than the size of the file. It is off by default since a
+        single full build parses every file once; GraphUpdater enables it
+        for long-lived updaters that reparse the same files repeatedly.
+
     Thread Safety:
-        ParserEngine instances are NOT thread-safe. The internal query cache
-        may exhibit race conditions when accessed concurrently from multiple
-        threads. For parallel processing, create a separate ParserEngine
-        instance per thread or worker.
+        parse() creates a fresh tree-sitter parser per call and only reads
+        the shared compiled queries, so concurrent calls are safe. A race on
+        the internal query cache at worst compiles the same query twice.
+        The tree cache is guarded by a lock.
     """
 
-    def __init__(self) -> None:
-        """Initialize ParserEngine."""
+    def __init__(self, tree_cache_size: int = 0) -> None:
+        """Initialize ParserEngine.
+
+        Args:
+            tree_cache_size: Number of syntax trees parse_file() keeps for
+                incremental reparsing (LRU). 0 disables the tree cache.
+        """
         self._query_cache: dict[str, Query] = {}
+        self._tree_cache: OrderedDict[Path, tuple[bytes, Tree]] = OrderedDict()
+        self._tree_lock = threading.Lock()
+        self._tree_cache_size = 0
+        self.tree_cache_size = tree_cache_size
+
+    @property
+    def tree_cache_size(self) -> int:
+        """Return how many syntax trees parse_file() keeps (0 = disabled)."""
+        return self._tree_cache_size
+
+    @tree_cache_size.setter
+    def tree_cache_size(self, size: int) -> None:
+        """Resize the tree cache, evicting the least recently parsed trees.
+
+        Args:
+            size: New maximum number of cached trees. 0 disables the cache.
+
+        Raises:
+            ValueError: If size is negative.
+        """
+        if size < 0:
+            raise ValueError("tree_cache_size must not be negative")
+        with self._tree_lock:
+            self._tree_cache_size = size
+            while len(self._tree_cache) > size:
+                self._tree_cache.popitem(last=False)
 
     def _load_query_from_file(self, language: str) -> str:
         """Load tree-sitter query from .scm file in languages/ directory.
@@ -186,6 +289,25 @@ class ParserEngine:
         if not code:
             return []
 
+        return self._parse_source(bytes(code, "utf-8"), language_id)[0]
+
+    def _parse_source(
+        self, source: bytes, language_id: str, old_tree: Tree | None = None
+    ) -> tuple[list[CodeNode], Tree]:
+        """Parse source bytes and extract structural elements.
+
+        Args:
+            source: UTF-8 encoded source code.
+            language_id: Language identifier with a languages/*.scm query.
+            old_tree: Previous tree of this file, already edited to match
+                source, for incremental reparsing.
+
+        Returns:
+            Tuple of (CodeNode list sorted by start_line, syntax tree).
+
+        Raises:
+            QueryLoadError: If the query file for language_id cannot be loaded.
+        """
         # Initialize parser and language for the requested language_id
         # Type ignore: tree-sitter-language-pack expects a Literal type
         # but we use runtime validation for flexibility
@@ -201,8 +323,8 @@ class ParserEngine:
             query = Query(lang, query_string)
             self._query_cache[language_id] = query
 
-        # Parse code (tree-sitter requires bytes)
-        tree = parser.parse(bytes(code, "utf-8"))
+        # Parse code, reusing unchanged subtrees of old_tree if given
+        tree = parser.parse(source, old_tree) if old_tree is not None else parser.parse(source)
 
         # Create query cursor using tree-sitter API
         cursor = QueryCursor(query)
@@ -253,7 +375,7 @@ class ParserEngine:
         # Sort by start_line for consistent ordering
         nodes.sort(key=lambda n: n.start_line)
 
-        return nodes
+        return nodes, tree
 
     def parse_file(self, path: Path, code: str | None = None) -> list[CodeNode]:
         """Parse file and extract structural elements with automatic language detection.
@@ -293,4 +415,31 @@ class ParserEngine:
         if code is None:
             code = path.read_text(encoding="utf-8")
 
-        return self.parse(code, language_id=language_id)
+        if not self._tree_cache_size or not code:
+            return self.parse(code, language_id=language_id)
+
+        # Incremental path: edit the cached tree of this path and reparse
+        source = bytes(code, "utf-8")
+        with self._tree_lock:
+            previous = self._tree_cache.pop(path, None)
+        old_tree = None
+        if previous is not None:
+            old_source, old_tree = previous
+            _edit_tree(old_tree, old_source, source)
+
+        nodes, tree = self._parse_source(source, language_id, old_tree)
+
+        with self._tree_lock:
+            self._tree_cache[path] = (source, tree)
+            if len(self._tree_cache) > self._tree_cache_size:
+                self._tree_cache.popitem(last=False)
+        return nodes
+
+    def discard_tree(self, path: Path) -> None:
+        """Drop the cached syntax tree of a file (e.g. after deletion).
+
+        Args:
+            path: Path the file was parsed under in parse_file().
+        """
+        with self._tree_lock:
+            self._tree_cache.pop(path, None)
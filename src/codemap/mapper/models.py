@@ -32,13 +32,14 @@ class QueryLoadError(Exception):
         super().__init__(f"Failed to load query for '{language_id}': {message}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeNode:
     """Immutable representation of a code structure element.
 
     This frozen dataclass encapsulates information about a single code element
     (class, function, or import) extracted from source code via tree-sitter.
-    Instances cannot be modified after creation.
+    Instances cannot be modified after creation. Fields live in __slots__,
+    since a parse creates one node per element.
 
     Attributes:
         type: Type of code element ("class", "function", "import").
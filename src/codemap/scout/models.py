@@ -42,13 +42,14 @@ class TreeReport:
     estimated_tokens: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileEntry:
     """Immutable representation of a file with metadata for LLM context.
 
     This frozen dataclass encapsulates information about a single file,
     including its path, size, and estimated token count for LLM processing.
-    Instances cannot be modified after creation.
+    Instances cannot be modified after creation. Fields live in __slots__,
+    since a walk creates one entry per file.
 
     Attributes:
         path: Relative file path from the project root as a Path object.
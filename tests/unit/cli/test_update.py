@@ -185,6 +185,28 @@ class TestUpdateCommand:
         assert result.exit_code == 0
         mock_graph_updater.update.assert_called_once()
 
+    def test_update_disables_tree_cache_for_one_shot_run(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        setup_codemap_dir: Path,
+        mock_graph_manager: MagicMock,
+        mock_graph_updater: MagicMock,
+        mock_change_detector: MagicMock,
+        mock_parser_engine: MagicMock,
+        mock_content_reader: MagicMock,
+    ) -> None:
+        """A single CLI update never reparses a file, so no trees are kept."""
+        from codemap.cli.commands import update as update_module
+
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["update"])
+
+        assert result.exit_code == 0
+        assert update_module.GraphUpdater.call_args.kwargs["tree_cache_size"] == 0
+
     def test_update_saves_updated_graph(
         self,
         runner: CliRunner,
@@ -494,6 +516,66 @@ class TestUpdateCommandLocking:
         assert metadata["commit_hash"] == "abc123def456"
 
 
+class TestUpdateCommandParseCache:
+    """Tests for recovering from an unusable parse cache."""
+
+    def test_update_recreates_corrupt_parse_cache(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        setup_codemap_dir: Path,
+        mock_graph_manager: MagicMock,
+        mock_graph_updater: MagicMock,
+        mock_change_detector: MagicMock,
+        mock_parser_engine: MagicMock,
+        mock_content_reader: MagicMock,
+    ) -> None:
+        """A garbage parse_cache.sqlite is replaced by a fresh cache."""
+        from codemap.cli.commands import update as update_module
+        from codemap.mapper.cache import ParseCache
+
+        cache_path = setup_codemap_dir / "parse_cache.sqlite"
+        cache_path.write_bytes(b"this is not a sqlite database" * 100)
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["update"])
+
+        assert result.exit_code == 0
+        parse_cache = update_module.GraphUpdater.call_args.kwargs["parse_cache"]
+        assert isinstance(parse_cache, ParseCache)
+        with ParseCache(cache_path) as reopened:
+            assert reopened.get("x.py", "digest") is None
+
+    def test_update_runs_without_unavailable_parse_cache(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        setup_codemap_dir: Path,
+        mock_graph_manager: MagicMock,
+        mock_graph_updater: MagicMock,
+        mock_change_detector: MagicMock,
+        mock_parser_engine: MagicMock,
+        mock_content_reader: MagicMock,
+    ) -> None:
+        """A cache that cannot be opened at all only produces a warning."""
+        import sqlite3
+
+        from codemap.cli.commands import update as update_module
+
+        locked = MagicMock(side_effect=sqlite3.OperationalError("database is locked"))
+        monkeypatch.setattr("codemap.cli.commands.update.ParseCache", locked)
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["update"])
+
+        assert result.exit_code == 0
+        assert "parse cache unavailable" in result.output
+        assert update_module.GraphUpdater.call_args.kwargs["parse_cache"] is None
+        mock_graph_manager.save.assert_called_once()
+
+
 class TestUpdateCommandIntegration:
     """Integration tests for update command workflow."""
 
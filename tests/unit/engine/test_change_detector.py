@@ -313,6 +313,24 @@ class TestHashBasedDetection:
         assert Path("stable.py") not in changes.added
         assert Path("stable.py") not in changes.deleted
 
+    def test_hash_detection_exposes_current_hashes(self, tmp_path: Path) -> None:
+        """Hashes of all scanned files are returned for reuse."""
+        import hashlib
+
+        (tmp_path / "a.py").write_text("a = 1")
+        (tmp_path / "b.py").write_text("b = 2")
+
+        manager = GraphManager()
+        manager.build_metadata["file_hashes"] = {"a.py": "outdated"}
+        detector = ChangeDetector(manager)
+
+        changes = detector.detect_changes(tmp_path)
+
+        assert changes.current_hashes == {
+            "a.py": hashlib.sha256(b"a = 1").hexdigest(),
+            "b.py": hashlib.sha256(b"b = 2").hexdigest(),
+        }
+
 
 class TestGetCurrentCommit:
     """Tests for get_current_commit() method."""
@@ -12,6 +12,7 @@ Test Organization:
     - TestShowCode: Level 4 code display tool
     - TestDocstrings: LLM-optimized documentation
     - TestIntegration: End-to-end with real graph data
+    - TestToolCache: Session cache for symbol and code views
 """
 
 from __future__ import annotations
@@ -443,3 +444,86 @@ class TestIntegration:
         code = tools.show_code("src/auth/login.py", "authenticate")
         assert "def authenticate" in code
         assert "Zeilen" in code
+
+
+class TestToolCache:
+    """Tests for caching of Level 3/4 tool results."""
+
+    def test_symbol_view_cached_until_cleared(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Repeated symbol zooms reuse the rendered view until clear_cache()."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+        tools = CuratorTools(renderer)
+        first = tools.zoom_to_symbol("src/auth/login.py", "authenticate")
+        node = simple_graph_with_hierarchy.graph.nodes["src/auth/login.py::authenticate"]
+        node["summary"] = "Changed summary"
+
+        assert tools.zoom_to_symbol("src/auth/login.py", "authenticate") is first
+
+        tools.clear_cache()
+        assert "Changed summary" in tools.zoom_to_symbol("src/auth/login.py", "authenticate")
+
+    def test_clear_cache_refreshes_renderer_pages(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """clear_cache() also drops the MapRenderer's level 0-2 pages."""
+        tools = CuratorTools(MapRenderer(simple_graph_with_hierarchy))
+        tools.get_project_overview()
+        node = simple_graph_with_hierarchy.graph.nodes["project::TestProject"]
+        node["summary"] = "Freshly enriched project"
+
+        tools.clear_cache()
+
+        assert "Freshly enriched project" in tools.get_project_overview()
+
+    def test_code_view_cached_per_symbol(self, tmp_path: Path) -> None:
+        """show_code reads each symbol's source once per session."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        source = src_dir / "example.py"
+        source.write_text("def hello():\n    return 'world'\n")
+
+        gm = GraphManager()
+        gm.add_file(FileEntry(Path("src/example.py"), size=100, token_est=25))
+        gm.add_node("src/example.py", CodeNode("function", "hello", 1, 2))
+        tools = CuratorTools(MapRenderer(gm, root_path=tmp_path))
+        first = tools.show_code("src/example.py", "hello")
+        source.unlink()
+
+        assert tools.show_code("src/example.py", "hello") is first
+
+    @pytest.mark.asyncio
+    async def test_async_code_view_shares_cache(self, tmp_path: Path) -> None:
+        """ashow_code reads in a thread and shares the cache with show_code."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        source = src_dir / "example.py"
+        source.write_text("def hello():\n    return 'world'\n")
+
+        gm = GraphManager()
+        gm.add_file(FileEntry(Path("src/example.py"), size=100, token_est=25))
+        gm.add_node("src/example.py", CodeNode("function", "hello", 1, 2))
+        tools = CuratorTools(MapRenderer(gm, root_path=tmp_path))
+        first = await tools.ashow_code("src/example.py", "hello")
+        source.unlink()
+
+        assert "def hello():" in first
+        assert await tools.ashow_code("src/example.py", "hello") is first
+        assert tools.show_code("src/example.py", "hello") is first
+
+    def test_errors_are_not_cached(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """A failed lookup succeeds once the symbol exists."""
+        tools = CuratorTools(MapRenderer(simple_graph_with_hierarchy))
+        with pytest.raises(ValueError, match="nicht gefunden"):
+            tools.zoom_to_symbol("src/auth/login.py", "logout")
+
+        simple_graph_with_hierarchy.add_node(
+            "src/auth/login.py", CodeNode("function", "logout", 52, 60)
+        )
+
+        assert "# src/auth/login.py::logout" in tools.zoom_to_symbol(
+            "src/auth/login.py", "logout"
+        )
@@ -20,7 +20,7 @@ Test Patterns:
 Component Interactions Tested:
     - GraphManager: Node iteration, attribute updates
     - LLMProvider: Async send() calls with batched prompts
-    - asyncio.gather: Parallel batch processing with error isolation
+    - asyncio.as_completed: Concurrent batch processing with error isolation
 """
 
 from unittest.mock import AsyncMock
@@ -182,6 +182,24 @@ class TestEnrichNodesGraphUpdates:
             f"Expected func2 risks ['Risk B', 'Risk C'], got {func2_node.get('risks')}"
         )
 
+    @pytest.mark.asyncio
+    async def test_enricher_bumps_graph_version(self) -> None:
+        """Written summaries invalidate caches keyed on GraphManager.version."""
+        from pathlib import Path
+
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("file.py"), size=512, token_est=128))
+        graph_manager.add_node("file.py", CodeNode("function", "func1", 1, 5))
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = (
+            '[{"node_id": "file.py::func1", "summary": "Does X", "risks": []}]'
+        )
+        before = graph_manager.version
+
+        await GraphEnricher(graph_manager, llm_provider).enrich_nodes()
+
+        assert graph_manager.version > before
+
 
 class TestEnrichNodesErrorHandling:
     """Test suite for GraphEnricher error handling and batch isolation."""
@@ -349,12 +367,11 @@ class TestEnrichNodesErrorHandling:
         # Act & Assert - TypeError should propagate (not be silently swallowed)
         enricher = GraphEnricher(graph_manager, llm_provider)
 
-        # asyncio.gather with return_exceptions=True wraps exceptions
-        # So we need to check that the exception is returned, not raised
-        # But _enrich_batch does raise, so gather returns it as result
+        # _enrich_batch logs and re-raises; enrich_nodes isolates the failed
+        # batch so the exception does not abort the remaining batches
         await enricher.enrich_nodes(batch_size=10)
 
-        # The exception was raised in _enrich_batch and caught by gather
+        # The exception was raised in _enrich_batch and isolated per batch
         # We can verify by checking the node was NOT enriched
         assert "summary" not in graph_manager.graph.nodes["test.py::func_0"]
 
@@ -1753,3 +1770,376 @@ class TestEnricherCodeContent:
         assert "```" not in user_prompt, (
             "Empty string should NOT produce a code block"
         )
+
+
+class TestLangForPath:
+    """Test suite for the cached extension-to-language helper."""
+
+    def test_known_extensions_map_to_language(self) -> None:
+        """Known extensions resolve to their code-fence language name."""
+        from codemap.engine.enricher import _lang_for_path
+
+        assert _lang_for_path("src/main.py") == "python"
+        assert _lang_for_path("web/app.js") == "javascript"
+        assert _lang_for_path("web/app.ts") == "typescript"
+
+    def test_unknown_extension_returned_verbatim(self) -> None:
+        """Unknown extensions are passed through unchanged."""
+        from codemap.engine.enricher import _lang_for_path
+
+        assert _lang_for_path("lib/tool.rs") == "rs"
+
+    def test_path_without_extension_returns_empty(self) -> None:
+        """Paths without a suffix (or dotfiles, dotted dirs) yield an empty string."""
+        from codemap.engine.enricher import _lang_for_path
+
+        assert _lang_for_path("Makefile") == ""
+        assert _lang_for_path("config/.env") == ""
+        assert _lang_for_path("pkg.v2/Makefile") == ""
+
+
+class TestParseNodeId:
+    """Test suite for the node-ID parsing helper."""
+
+    def test_splits_file_and_symbol(self) -> None:
+        """Node IDs with '::' are split into file path and symbol name."""
+        from codemap.engine.enricher import _parse_node_id
+
+        assert _parse_node_id("src/main.py::main") == ("src/main.py", "main")
+
+    def test_splits_only_on_first_separator(self) -> None:
+        """Only the first '::' separates file path from symbol."""
+        from codemap.engine.enricher import _parse_node_id
+
+        assert _parse_node_id("a.py::Outer::inner") == ("a.py", "Outer::inner")
+
+    def test_returns_none_without_separator(self) -> None:
+        """Node IDs without '::' (e.g. file nodes) yield None."""
+        from codemap.engine.enricher import _parse_node_id
+
+        assert _parse_node_id("src/main.py") is None
+
+
+class TestEnricherIOPool:
+    """Test suite for the bounded file-read pool used in code-content mode."""
+
+    def test_metadata_only_mode_has_no_pool(self) -> None:
+        """Without root_path no thread pool is created."""
+        enricher = GraphEnricher(GraphManager(), AsyncMock())
+
+        assert enricher._io_pool is None
+
+    def test_code_content_mode_pool_is_bounded(self, tmp_path) -> None:
+        """With root_path the pool is capped at _MAX_IO_WORKERS threads."""
+        from codemap.engine.enricher import _MAX_IO_WORKERS
+
+        enricher = GraphEnricher(GraphManager(), AsyncMock(), root_path=tmp_path)
+
+        assert enricher._io_pool is not None
+        assert enricher._io_pool._max_workers == _MAX_IO_WORKERS
+        assert _MAX_IO_WORKERS <= 32
+        enricher.close()
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_pool(self, tmp_path) -> None:
+        """Leaving the async context shuts the pool down; close() is idempotent."""
+        from pathlib import Path
+
+        # Arrange
+        (tmp_path / "mod.py").write_text("def func():\n    return 1\n")
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("mod.py"), size=30, token_est=7))
+        graph_manager.add_node(
+            "mod.py", CodeNode(type="function", name="func", start_line=1, end_line=2)
+        )
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = (
+            '[{"node_id": "mod.py::func", "summary": "Returns 1", "risks": []}]'
+        )
+
+        # Act
+        async with GraphEnricher(graph_manager, llm_provider, root_path=tmp_path) as enricher:
+            await enricher.enrich_nodes()
+
+        # Assert
+        _system_prompt, user_prompt = llm_provider.send.call_args[0]
+        assert "return 1" in user_prompt
+        assert enricher._io_pool is None
+        enricher.close()
+
+    @pytest.mark.asyncio
+    async def test_enrich_after_close_raises(self, tmp_path) -> None:
+        """A closed enricher refuses to run instead of reading on another pool."""
+        from pathlib import Path
+
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("mod.py"), size=30, token_est=7))
+        graph_manager.add_node("mod.py", CodeNode("function", "func", 1, 2))
+        llm_provider = AsyncMock()
+        enricher = GraphEnricher(graph_manager, llm_provider, root_path=tmp_path)
+        enricher.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await enricher.enrich_nodes()
+
+        llm_provider.send.assert_not_called()
+
+
+class TestMetadataOnlyPrompt:
+    """Test suite for the pre-rendered metadata-only prompt fast path."""
+
+    @pytest.mark.asyncio
+    async def test_metadata_prompt_layout(self) -> None:
+        """Pre-rendered blocks are numbered per batch and separated by blank lines."""
+        from pathlib import Path
+
+        # Arrange
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("m.py"), size=100, token_est=25))
+        graph_manager.add_node("m.py", CodeNode("function", "a", 1, 3))
+        graph_manager.add_node("m.py", CodeNode("class", "B", 5, 9))
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = "[]"
+        enricher = GraphEnricher(graph_manager, llm_provider)
+
+        # Act
+        await enricher.enrich_nodes(batch_size=10)
+
+        # Assert
+        _system_prompt, user_prompt = llm_provider.send.call_args[0]
+        assert user_prompt == (
+            "Analyze these code elements:\n\n"
+            "### 1. m.py::a\n- type: function\n- name: a\n- lines: 1-3\n\n"
+            "### 2. m.py::B\n- type: class\n- name: B\n- lines: 5-9\n\n"
+            'Return JSON array: [{"node_id": "...", "summary": "...", "risks": ["..."]}]'
+        )
+
+
+class TestTokenBudgetBatching:
+    """Test suite for token-budget-aware batch packing."""
+
+    def test_rejects_non_positive_budget(self) -> None:
+        """max_prompt_tokens <= 0 raises ValueError."""
+        with pytest.raises(ValueError, match="max_prompt_tokens must be positive"):
+            GraphEnricher(GraphManager(), AsyncMock(), max_prompt_tokens=0)
+
+    @pytest.mark.asyncio
+    async def test_budget_closes_batches_early(self, tmp_path) -> None:
+        """Large code nodes are split into separate batches when over budget.
+
+        Each 50-line node is estimated at ~500 tokens in code-content mode, so
+        a 600-token budget allows only one node per batch even though
+        batch_size would allow ten.
+        """
+        from pathlib import Path
+
+        # Arrange
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("big.py"), size=10000, token_est=2500))
+        for i in range(3):
+            graph_manager.add_node(
+                "big.py", CodeNode("class", f"C{i}", i * 50 + 1, i * 50 + 50)
+            )
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = "[]"
+        enricher = GraphEnricher(
+            graph_manager, llm_provider, root_path=tmp_path, max_prompt_tokens=600
+        )
+
+        # Act
+        await enricher.enrich_nodes(batch_size=10)
+        enricher.close()
+
+        # Assert
+        assert llm_provider.send.call_count == 3
+
+    def test_small_nodes_fill_up_to_batch_size(self) -> None:
+        """Small metadata-only nodes are packed until batch_size is reached."""
+        enricher = GraphEnricher(GraphManager(), AsyncMock(), max_prompt_tokens=10_000)
+        nodes = [(f"f.py::n{i}", {"type": "function"}, f"f.py::n{i}") for i in range(7)]
+
+        batches = enricher._create_batches(nodes, batch_size=3)
+
+        assert [len(b) for b in batches] == [3, 3, 1]
+
+    def test_oversized_node_gets_own_batch(self) -> None:
+        """A node exceeding the whole budget still forms a batch on its own."""
+        enricher = GraphEnricher(GraphManager(), AsyncMock(), max_prompt_tokens=5)
+        nodes = [
+            ("a.py::small", {}, "x"),
+            ("a.py::huge", {}, "y" * 400),
+            ("a.py::tail", {}, "z"),
+        ]
+
+        batches = enricher._create_batches(nodes, batch_size=10)
+
+        assert [[n[0] for n in b] for b in batches] == [
+            ["a.py::small"],
+            ["a.py::huge"],
+            ["a.py::tail"],
+        ]
+
+    def test_code_mode_estimate_without_line_range(self, tmp_path) -> None:
+        """Nodes lacking line numbers are estimated from metadata only."""
+        enricher = GraphEnricher(GraphManager(), AsyncMock(), root_path=tmp_path)
+
+        tokens = enricher._estimate_tokens(("a.py::f", {"type": "function"}, "a" * 40))
+        enricher.close()
+
+        assert tokens == 11
+
+    def test_no_nodes_yields_no_batches(self) -> None:
+        """An empty node list produces no batches."""
+        enricher = GraphEnricher(GraphManager(), AsyncMock())
+
+        assert enricher._create_batches([], batch_size=10) == []
+
+
+class TestResponseCache:
+    """Test suite for the exact-match LLM response cache."""
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_hit_cache(self) -> None:
+        """A repeated identical prompt is answered without a provider call."""
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = "[]"
+        enricher = GraphEnricher(GraphManager(), llm_provider)
+
+        first = await enricher._send_cached("sys", "user")
+        second = await enricher._send_cached("sys", "user")
+
+        assert first == second == "[]"
+        assert llm_provider.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_miss_cache(self) -> None:
+        """Prompts differing in either part are sent separately."""
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = "[]"
+        enricher = GraphEnricher(GraphManager(), llm_provider)
+
+        await enricher._send_cached("sys", "a")
+        await enricher._send_cached("sys", "b")
+        await enricher._send_cached("other", "a")
+
+        assert llm_provider.send.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_calls_are_not_cached(self) -> None:
+        """Provider errors propagate and the retry reaches the provider again."""
+        llm_provider = AsyncMock()
+        llm_provider.send.side_effect = [ValueError("empty"), "[]"]
+        enricher = GraphEnricher(GraphManager(), llm_provider)
+
+        with pytest.raises(ValueError):
+            await enricher._send_cached("sys", "user")
+        result = await enricher._send_cached("sys", "user")
+
+        assert result == "[]"
+        assert llm_provider.send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_malformed_response_calls_provider_again(self) -> None:
+        """Unusable responses are not replayed from the cache on retry."""
+        from pathlib import Path
+
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("file.py"), size=512, token_est=128))
+        graph_manager.add_node("file.py", CodeNode("function", "func1", 1, 5))
+        llm_provider = AsyncMock()
+        llm_provider.send.side_effect = [
+            "not json at all",
+            '[{"node_id": "file.py::func1", "summary": "Does X", "risks": []}]',
+        ]
+        enricher = GraphEnricher(graph_manager, llm_provider)
+
+        await enricher.enrich_nodes()
+        await enricher.enrich_nodes()
+
+        assert llm_provider.send.call_count == 2
+        assert graph_manager.graph.nodes["file.py::func1"]["summary"] == "Does X"
+
+    @pytest.mark.asyncio
+    async def test_response_naming_no_nodes_is_not_cached(self) -> None:
+        """A response that updates no node is dropped from the cache."""
+        from pathlib import Path
+
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("file.py"), size=512, token_est=128))
+        graph_manager.add_node("file.py", CodeNode("function", "func1", 1, 5))
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = '[{"node_id": "other.py::x", "summary": "?"}]'
+        enricher = GraphEnricher(graph_manager, llm_provider)
+
+        await enricher.enrich_nodes()
+
+        assert len(enricher._response_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, monkeypatch) -> None:
+        """The cache keeps only the most recently used entries."""
+        import codemap.engine.enricher as enricher_module
+
+        monkeypatch.setattr(enricher_module, "_RESPONSE_CACHE_SIZE", 2)
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = "[]"
+        enricher = GraphEnricher(GraphManager(), llm_provider)
+
+        await enricher._send_cached("s", "a")
+        await enricher._send_cached("s", "b")
+        await enricher._send_cached("s", "a")  # hit, refreshes "a"
+        await enricher._send_cached("s", "c")  # evicts "b"
+        await enricher._send_cached("s", "a")  # still cached
+        await enricher._send_cached("s", "b")  # miss again
+
+        assert llm_provider.send.call_count == 4
+
+
+class TestResponseParsing:
+    """Test suite for the JSON response parsing fast path and fallbacks."""
+
+    @staticmethod
+    def _single_node_graph() -> GraphManager:
+        from pathlib import Path
+
+        graph_manager = GraphManager()
+        graph_manager.add_file(FileEntry(Path("t.py"), size=100, token_est=25))
+        graph_manager.add_node("t.py", CodeNode("function", "f", 1, 2))
+        return graph_manager
+
+    @pytest.mark.asyncio
+    async def test_array_with_trailing_text_falls_back_to_regex(self) -> None:
+        """A leading array followed by prose is still extracted."""
+        graph_manager = self._single_node_graph()
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = (
+            '  [{"node_id": "t.py::f", "summary": "S", "risks": []}]\nHope this helps!'
+        )
+
+        await GraphEnricher(graph_manager, llm_provider).enrich_nodes()
+
+        assert graph_manager.graph.nodes["t.py::f"]["summary"] == "S"
+
+    @pytest.mark.asyncio
+    async def test_unterminated_array_logs_parse_failure(self, caplog) -> None:
+        """A response starting with '[' but lacking ']' is reported as a parse error."""
+        graph_manager = self._single_node_graph()
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = '[{"node_id": "t.py::f"'
+
+        await GraphEnricher(graph_manager, llm_provider).enrich_nodes()
+
+        assert "summary" not in graph_manager.graph.nodes["t.py::f"]
+        assert "Failed to parse JSON response" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_non_array_json_is_rejected(self, caplog) -> None:
+        """A top-level JSON object is logged and ignored."""
+        graph_manager = self._single_node_graph()
+        llm_provider = AsyncMock()
+        llm_provider.send.return_value = '{"node_id": "t.py::f", "summary": "S"}'
+
+        await GraphEnricher(graph_manager, llm_provider).enrich_nodes()
+
+        assert "summary" not in graph_manager.graph.nodes["t.py::f"]
+        assert "Expected JSON array" in caplog.text
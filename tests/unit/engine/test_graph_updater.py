@@ -6,6 +6,7 @@ GraphManager, ParserEngine, and ContentReader.
 """
 
 import logging
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,6 +15,7 @@ import pytest
 from codemap.engine.change_detector import ChangeDetector, ChangeSet
 from codemap.engine.graph_updater import GraphUpdater
 from codemap.graph import GraphManager
+from codemap.mapper.cache import ParseCache
 from codemap.mapper.engine import ParserEngine
 from codemap.mapper.models import CodeNode
 from codemap.mapper.reader import ContentReader, ContentReadError
@@ -353,6 +355,107 @@ class TestApplyModifiedFiles:
         assert "Failed to parse" in caplog.text
 
 
+class TestConsolidatedWarnings:
+    """Tests for per-step failure warnings emitted once by update()."""
+
+    def test_missing_files_reported_in_one_warning(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Many missing files produce a single, truncated warning."""
+        added = [Path(f"src/gone_{i:02d}.py") for i in range(12)]
+        change_detector.detect_changes.return_value = ChangeSet(added=added)
+        change_detector.get_current_commit.return_value = None
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        with (
+            patch.object(Path, "exists", return_value=False),
+            caplog.at_level(logging.WARNING),
+        ):
+            updater.update(Path("/project"))
+
+        warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert len(warnings) == 1
+        assert warnings[0].startswith("File not found for 12 files: src/gone_00.py")
+        assert "src/gone_09.py, ..." in warnings[0]
+        assert "src/gone_10.py" not in warnings[0]
+
+    def test_read_and_parse_failures_reported_separately(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Read and parse failures each get one warning naming the files."""
+        added = [Path("src/binary.py"), Path("src/broken.py"), Path("src/ok.py")]
+        change_detector.detect_changes.return_value = ChangeSet(added=added)
+        change_detector.get_current_commit.return_value = None
+
+        def read_file(path: Path) -> str:
+            if path.name == "binary.py":
+                raise ContentReadError("Binary file")
+            return path.name
+
+        def parse_file(path: Path, content: str) -> list[CodeNode]:
+            if content == "broken.py":
+                raise ValueError("Parse error")
+            return []
+
+        reader.read_file.side_effect = read_file
+        parser.parse_file.side_effect = parse_file
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        with (
+            patch.object(Path, "exists", return_value=True),
+            patch.object(Path, "stat", return_value=MagicMock(st_size=50)),
+            caplog.at_level(logging.WARNING),
+        ):
+            updater.update(Path("/project"))
+
+        warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert warnings == [
+            "Failed to read 1 files: src/binary.py (Binary file)",
+            "Failed to parse 1 files: src/broken.py (Parse error)",
+        ]
+
+    def test_failures_not_collected_when_warnings_disabled(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """With WARNING disabled the failure lists are never built."""
+        added = [Path("src/gone.py"), Path("src/binary.py")]
+        change_detector.detect_changes.return_value = ChangeSet(added=added)
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.side_effect = ContentReadError("Binary file")
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        def exists(path: Path) -> bool:
+            return path.name != "gone.py"
+
+        with (
+            patch.object(Path, "exists", autospec=True, side_effect=exists),
+            patch.object(Path, "stat", return_value=MagicMock(st_size=50)),
+            patch("codemap.engine.graph_updater.logger.isEnabledFor", return_value=False),
+            patch("codemap.engine.graph_updater._warn_failures") as warn_failures,
+        ):
+            updater.update(Path("/project"))
+
+        for call in warn_failures.call_args_list:
+            assert call.args[1] == []
+
+
 class TestApplyAddedFiles:
     """Tests for added file processing in update()."""
 
@@ -363,7 +466,7 @@ class TestApplyAddedFiles:
         parser: MagicMock,
         reader: MagicMock,
     ) -> None:
-        """New file node is created via add_file() for added files."""
+        """New file node is created via add_file_raw() for added files."""
         changes = ChangeSet(added=[Path("src/new_module.py")])
         change_detector.detect_changes.return_value = changes
         change_detector.get_current_commit.return_value = None
@@ -602,18 +705,18 @@ class TestUpdateOrchestration:
 
         original_remove_file = populated_graph.remove_file
 
-        def track_remove_file(file_id: str) -> None:
+        def track_remove_file(file_id: str, missing_ok: bool = False) -> bool:
             call_order.append(f"remove:{file_id}")
-            original_remove_file(file_id)
+            return original_remove_file(file_id, missing_ok)
 
-        original_add_file = populated_graph.add_file
+        original_add_file_raw = populated_graph.add_file_raw
 
-        def track_add_file(entry: FileEntry) -> None:
-            call_order.append(f"add:{entry.path}")
-            original_add_file(entry)
+        def track_add_file_raw(file_id: str, size: int, token_est: int) -> None:
+            call_order.append(f"add:{file_id}")
+            original_add_file_raw(file_id, size, token_est)
 
         populated_graph.remove_file = track_remove_file  # type: ignore[assignment]
-        populated_graph.add_file = track_add_file  # type: ignore[assignment]
+        populated_graph.add_file_raw = track_add_file_raw  # type: ignore[method-assign]
 
         changes = ChangeSet(
             deleted=[Path("src/utils.py")],
@@ -818,6 +921,172 @@ class TestImportResolution:
         # Dotted path resolution: codemap.scout.walker -> codemap/scout/walker.py
         assert graph_manager.graph.has_edge("src/main.py", "codemap/scout/walker.py")
 
+    def test_resolution_checks_supplied_node_ids(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Candidates are looked up in the node-id container passed in."""
+        graph_manager.add_file(FileEntry(Path("src/main.py"), 10, 2))
+        graph_manager.add_file(FileEntry(Path("pkg/__init__.py"), 10, 2))
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        # Only the container is consulted, not the graph itself
+        updater._resolve_and_add_import(
+            "src/main.py", "src/", "pkg", {"pkg/__init__.py"}, {"src", "main", "pkg", "other"}
+        )
+        updater._resolve_and_add_import(
+            "src/main.py", "src/", "other", set(), {"src", "main", "pkg", "other"}
+        )
+
+        assert graph_manager.graph.has_edge("src/main.py", "pkg/__init__.py")
+        assert graph_manager.graph.has_edge("src/main.py", "external::other")
+
+    def test_import_with_unknown_root_skips_candidate_lookups(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Roots absent from the project paths go straight to an external node."""
+        graph_manager.add_file(FileEntry(Path("src/main.py"), 10, 2))
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        node_ids = MagicMock(spec=set)
+
+        updater._resolve_and_add_import("src/main.py", "src/", "os.path", node_ids, {"src"})
+
+        node_ids.__contains__.assert_not_called()
+        assert graph_manager.graph.has_edge("src/main.py", "external::os.path")
+
+    def test_local_module_shadowing_stdlib_still_resolves(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """A project module named like a stdlib module resolves internally."""
+        graph_manager.add_file(FileEntry(Path("src/logging.py"), 50, 12))
+
+        changes = ChangeSet(added=[Path("src/main.py")])
+        change_detector.detect_changes.return_value = changes
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.return_value = "import logging\nimport json"
+        parser.parse_file.return_value = [
+            CodeNode("import", "logging", 1, 1),
+            CodeNode("import", "json", 2, 2),
+        ]
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        with (
+            patch.object(Path, "exists", return_value=True),
+            patch.object(Path, "stat", return_value=MagicMock(st_size=100)),
+        ):
+            updater.update(Path("/project"))
+
+        assert graph_manager.graph.has_edge("src/main.py", "src/logging.py")
+        assert graph_manager.graph.has_edge("src/main.py", "external::json")
+
+    def test_local_module_roots_cover_all_path_components(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Directory names and file stems of file nodes are collected."""
+        graph_manager.add_file(FileEntry(Path("src/pkg/__init__.py"), 10, 1))
+        graph_manager.add_file(FileEntry(Path("src/pkg/util.py"), 10, 1))
+        graph_manager.add_external_module("numpy")
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        roots = updater._local_module_roots(graph_manager.version, [])
+
+        assert roots == {"src", "pkg", "__init__", "util"}
+
+    def test_local_module_roots_reused_across_updates(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Later updates extend the previous roots instead of rescanning the graph."""
+        change_detector.detect_changes.side_effect = [
+            ChangeSet(added=[Path("src/a.py")]),
+            ChangeSet(added=[Path("lib/b.py")]),
+        ]
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.return_value = ""
+        parser.parse_file.return_value = []
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        with (
+            patch.object(Path, "exists", return_value=True),
+            patch.object(Path, "stat", return_value=MagicMock(st_size=100)),
+        ):
+            updater.update(Path("/project"))
+            with patch.object(graph_manager, "nodes_by_type") as nodes_by_type:
+                updater.update(Path("/project"))
+
+        nodes_by_type.assert_not_called()
+        assert updater._module_roots == (graph_manager.version, {"src", "a", "lib", "b"})
+
+    def test_local_module_roots_rebuilt_after_outside_change(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Graph changes made outside the updater trigger a full rebuild."""
+        change_detector.detect_changes.return_value = ChangeSet(added=[Path("src/a.py")])
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.return_value = ""
+        parser.parse_file.return_value = []
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        with (
+            patch.object(Path, "exists", return_value=True),
+            patch.object(Path, "stat", return_value=MagicMock(st_size=100)),
+        ):
+            updater.update(Path("/project"))
+            graph_manager.add_file(FileEntry(Path("other/c.py"), 10, 1))
+            updater.update(Path("/project"))
+
+        assert updater._module_roots is not None
+        assert {"other", "c"} <= updater._module_roots[1]
+
+    def test_root_level_file_resolves_sibling_without_prefix(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Files in the project root resolve siblings as bare file names."""
+        graph_manager.add_file(FileEntry(Path("utils.py"), 50, 12))
+
+        changes = ChangeSet(added=[Path("main.py")])
+        change_detector.detect_changes.return_value = changes
+        change_detector.get_current_commit.return_value = None
+        parser.parse_file.return_value = [CodeNode("import", "utils", 1, 1)]
+        reader.read_file.return_value = "import utils"
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        with (
+            patch.object(Path, "exists", return_value=True),
+            patch.object(Path, "stat", return_value=MagicMock(st_size=100)),
+        ):
+            updater.update(Path("/project"))
+
+        assert graph_manager.graph.has_edge("main.py", "utils.py")
+        assert "external::utils" not in graph_manager.graph.nodes
+
 
 class TestGetAffectedParentNodes:
     """Tests for get_affected_parent_nodes()."""
@@ -917,6 +1186,38 @@ class TestGetAffectedParentNodes:
         assert "src" in affected
         assert "." not in affected
 
+    def test_siblings_with_shared_ancestors(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Files sharing a parent chain yield each ancestor exactly once."""
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        changes = ChangeSet(
+            modified=[Path("src/a/b/one.py"), Path("src/a/b/two.py")],
+            added=[Path("src/a/c/three.py")],
+        )
+        affected = updater.get_affected_parent_nodes(changes)
+
+        assert affected == {"src", "src/a", "src/a/b", "src/a/c"}
+
+    def test_absolute_paths_terminate_at_filesystem_root(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Absolute paths stop at the filesystem root instead of looping."""
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        affected = updater.get_affected_parent_nodes(ChangeSet(deleted=[Path("/src/x.py")]))
+
+        assert affected == {"/src", "/"}
+
 
 class TestBuildMetadataOnEmptyChangeSet:
     """Tests for build metadata update on empty ChangeSet (Comment 1)."""
@@ -961,6 +1262,48 @@ class TestBuildMetadataOnEmptyChangeSet:
         assert "file_hashes" in graph_manager.build_metadata
         assert "src/existing.py" in graph_manager.build_metadata["file_hashes"]
 
+    def test_empty_changeset_on_same_commit_is_noop(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Unchanged commit with stored hashes leaves metadata untouched."""
+        graph_manager.add_file(FileEntry(Path("src/existing.py"), 100, 25))
+        stored_hashes = {"src/existing.py": "stored"}
+        graph_manager.build_metadata["commit_hash"] = "samecommit"
+        graph_manager.build_metadata["file_hashes"] = stored_hashes
+        change_detector.detect_changes.return_value = ChangeSet()
+        change_detector.get_current_commit.return_value = "samecommit"
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        updater.update(Path("/project"))
+
+        assert graph_manager.build_metadata["file_hashes"] is stored_hashes
+        change_detector._hash_file.assert_not_called()
+
+    def test_empty_changeset_without_stored_hashes_still_hashes(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Same commit but no stored hashes falls through to a full scan."""
+        graph_manager.add_file(FileEntry(Path("src/existing.py"), 100, 25))
+        graph_manager.build_metadata["commit_hash"] = "samecommit"
+        change_detector.detect_changes.return_value = ChangeSet()
+        change_detector.get_current_commit.return_value = "samecommit"
+        change_detector._hash_file.return_value = "hash_abc"
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        with patch.object(Path, "exists", return_value=True):
+            updater.update(Path("/project"))
+
+        assert graph_manager.build_metadata["file_hashes"] == {"src/existing.py": "hash_abc"}
+
 
 class TestTwoPassImportResolution:
     """Tests for two-pass file processing (Comment 3)."""
@@ -998,3 +1341,348 @@ class TestTwoPassImportResolution:
         # helpers.py should resolve as internal (same dir), not external
         assert graph_manager.graph.has_edge("src/api.py", "src/helpers.py")
         assert "external::helpers" not in graph_manager.graph.nodes
+
+
+class TestParallelFileHashing:
+    """Tests for thread-pooled hashing in _update_build_metadata()."""
+
+    def test_hashes_mapped_to_their_files(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Each file node gets its own hash even when hashed concurrently."""
+        for i in range(20):
+            (tmp_path / f"m{i}.py").write_text(f"x = {i}\n")
+            graph_manager.add_file(FileEntry(Path(f"m{i}.py"), 6, 1))
+        graph_manager.add_file(FileEntry(Path("gone.py"), 6, 1))
+        change_detector.get_current_commit.return_value = None
+        change_detector._hash_file.side_effect = lambda p: p.read_text()
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        updater._update_build_metadata(tmp_path)
+
+        file_hashes = graph_manager.build_metadata["file_hashes"]
+        assert file_hashes == {f"m{i}.py": f"x = {i}\n" for i in range(20)}
+
+
+class TestIncrementalFileHashes:
+    """Tests for reusing stored hashes of unchanged files."""
+
+    def test_only_changed_files_rehashed(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Unchanged entries are copied, deleted dropped, changed re-hashed."""
+        for name in ("keep.py", "mod.py", "new.py"):
+            (tmp_path / name).write_text("x = 1\n")
+            graph_manager.add_file(FileEntry(Path(name), 6, 1))
+        graph_manager.build_metadata["file_hashes"] = {
+            "keep.py": "old_keep",
+            "mod.py": "old_mod",
+            "gone.py": "old_gone",
+        }
+        changes = ChangeSet(
+            modified=[Path("mod.py")],
+            added=[Path("new.py"), Path("vanished.py")],
+            deleted=[Path("gone.py")],
+        )
+        change_detector.get_current_commit.return_value = None
+        change_detector._hash_file.side_effect = lambda p: f"new_{p.name}"
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        updater._update_build_metadata(tmp_path, changes)
+
+        assert graph_manager.build_metadata["file_hashes"] == {
+            "keep.py": "old_keep",
+            "mod.py": "new_mod.py",
+            "new.py": "new_new.py",
+        }
+        hashed = {c.args[0].name for c in change_detector._hash_file.call_args_list}
+        assert hashed == {"mod.py", "new.py"}
+
+    def test_detection_hashes_are_reused(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Hashes computed during change detection are not recomputed."""
+        for name in ("a.py", "notes.md"):
+            (tmp_path / name).write_text("content\n")
+            graph_manager.add_file(FileEntry(Path(name), 8, 2))
+        graph_manager.build_metadata["file_hashes"] = {"a.py": "old"}
+        changes = ChangeSet(
+            modified=[Path("a.py")],
+            added=[Path("notes.md")],
+            current_hashes={"a.py": "detected"},
+        )
+        change_detector.get_current_commit.return_value = None
+        change_detector._hash_file.side_effect = lambda p: f"hashed_{p.name}"
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        updater._update_build_metadata(tmp_path, changes)
+
+        assert graph_manager.build_metadata["file_hashes"] == {
+            "a.py": "detected",
+            "notes.md": "hashed_notes.md",
+        }
+        change_detector._hash_file.assert_called_once_with(tmp_path / "notes.md")
+
+    def test_missing_stored_hashes_triggers_full_scan(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Without stored hashes every file node is hashed."""
+        (tmp_path / "a.py").write_text("a = 1\n")
+        graph_manager.add_file(FileEntry(Path("a.py"), 6, 1))
+        change_detector.get_current_commit.return_value = None
+        change_detector._hash_file.return_value = "h"
+
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        updater._update_build_metadata(tmp_path, ChangeSet())
+
+        assert graph_manager.build_metadata["file_hashes"] == {"a.py": "h"}
+
+
+class TestParallelParsing:
+    """Tests for thread-pooled parsing in update()."""
+
+    @staticmethod
+    def _run(updater: GraphUpdater) -> None:
+        with (
+            patch.object(Path, "exists", return_value=True),
+            patch.object(Path, "stat", return_value=MagicMock(st_size=100)),
+        ):
+            updater.update(Path("/project"))
+
+    def test_files_parsed_on_worker_threads(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Several changed files are parsed off the calling thread."""
+        files = [Path(f"src/mod{i}.py") for i in range(8)]
+        change_detector.detect_changes.return_value = ChangeSet(added=files)
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.return_value = "def f(): pass"
+        threads: set[str] = set()
+
+        def mock_parse(path: Path, content: str) -> list[CodeNode]:
+            threads.add(threading.current_thread().name)
+            return [CodeNode("function", f"f_{path.stem}", 1, 1)]
+
+        parser.parse_file.side_effect = mock_parse
+
+        self._run(GraphUpdater(graph_manager, change_detector, parser, reader))
+
+        assert all(name.startswith("graph-parse") for name in threads)
+        for file_path in files:
+            assert f"{file_path}::f_{file_path.stem}" in graph_manager.graph.nodes
+
+    def test_parse_parallel_false_parses_in_calling_thread(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """With parse_parallel=False every file is parsed serially."""
+        files = [Path("src/a.py"), Path("src/b.py")]
+        change_detector.detect_changes.return_value = ChangeSet(added=files)
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.return_value = "def f(): pass"
+        threads: set[str] = set()
+
+        def mock_parse(path: Path, content: str) -> list[CodeNode]:
+            threads.add(threading.current_thread().name)
+            return []
+
+        parser.parse_file.side_effect = mock_parse
+
+        self._run(
+            GraphUpdater(graph_manager, change_detector, parser, reader, parse_parallel=False)
+        )
+
+        assert threads == {threading.current_thread().name}
+        assert parser.parse_file.call_count == 2
+
+
+class TestParseCache:
+    """Tests for skipping tree-sitter via ParseCache."""
+
+    def test_cache_hit_skips_parser(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Unchanged content is served from the cache on the next update."""
+        graph_manager.add_file(FileEntry(Path("src/utils.py"), 50, 12))
+        change_detector.detect_changes.return_value = ChangeSet(modified=[Path("src/utils.py")])
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.return_value = "def helper(): pass"
+        parser.parse_file.return_value = [CodeNode("function", "helper", 1, 1)]
+
+        with ParseCache() as cache:
+            updater = GraphUpdater(
+                graph_manager, change_detector, parser, reader, parse_cache=cache
+            )
+            with (
+                patch.object(Path, "exists", return_value=True),
+                patch.object(Path, "stat", return_value=MagicMock(st_size=100)),
+            ):
+                updater.update(Path("/project"))
+                updater.update(Path("/project"))
+
+        assert parser.parse_file.call_count == 1
+        assert "src/utils.py::helper" in graph_manager.graph.nodes
+
+    def test_changed_content_is_parsed_again(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """A different content digest is a cache miss."""
+        change_detector.detect_changes.return_value = ChangeSet(added=[Path("a.py")])
+        change_detector.get_current_commit.return_value = None
+        reader.read_file.side_effect = ["x = 1", "x = 2"]
+        parser.parse_file.return_value = []
+
+        with ParseCache() as cache:
+            updater = GraphUpdater(
+                graph_manager, change_detector, parser, reader, parse_cache=cache
+            )
+            with (
+                patch.object(Path, "exists", return_value=True),
+                patch.object(Path, "stat", return_value=MagicMock(st_size=100)),
+            ):
+                updater.update(Path("/project"))
+                updater.update(Path("/project"))
+
+        assert parser.parse_file.call_count == 2
+
+    def test_update_prunes_deleted_files(
+        self,
+        populated_graph: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Cache entries of files removed from the graph are dropped."""
+        change_detector.detect_changes.return_value = ChangeSet(deleted=[Path("src/utils.py")])
+        change_detector.get_current_commit.return_value = None
+
+        with ParseCache() as cache:
+            cache.put("src/utils.py", "d", [])
+            cache.put("src/auth/login.py", "d", [])
+            updater = GraphUpdater(
+                populated_graph, change_detector, parser, reader, parse_cache=cache
+            )
+            with patch.object(Path, "exists", return_value=True):
+                updater.update(Path("/project"))
+
+            assert cache.get("src/utils.py", "d") is None
+            assert cache.get("src/auth/login.py", "d") == []
+
+
+class TestDirtyParents:
+    """Tests for get_dirty_parents()."""
+
+    def test_includes_files_packages_and_project(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Changed files, their ancestors and the project node are dirty."""
+        graph_manager.add_file(FileEntry(Path("src/auth/login.py"), 10, 1))
+        graph_manager.add_file(FileEntry(Path("src/api/routes.py"), 10, 1))
+        graph_manager.build_hierarchy("P")
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+        changes = ChangeSet(
+            modified=[Path("src/auth/login.py")],
+            added=[Path("lib/new.py")],
+            deleted=[Path("old/gone.py")],
+        )
+
+        dirty = updater.get_dirty_parents(changes)
+
+        assert dirty == {
+            "src/auth/login.py",
+            "src/auth",
+            "src",
+            "lib/new.py",
+            "lib",
+            "old",
+            "project::P",
+        }
+
+    def test_empty_changes_are_clean(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """No changes means nothing to re-aggregate, not even the project."""
+        graph_manager.add_project("P")
+        updater = GraphUpdater(graph_manager, change_detector, parser, reader)
+
+        assert updater.get_dirty_parents(ChangeSet()) == set()
+
+
+class TestTreeCacheEviction:
+    """Tests for dropping cached syntax trees of deleted files."""
+
+    def test_updater_enables_parser_tree_cache(
+        self,
+        graph_manager: GraphManager,
+        change_detector: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """The updater turns on incremental reparsing unless told otherwise."""
+        default_parser = ParserEngine()
+        kept_parser = ParserEngine(tree_cache_size=7)
+
+        GraphUpdater(graph_manager, change_detector, default_parser, reader)
+        GraphUpdater(graph_manager, change_detector, kept_parser, reader, tree_cache_size=None)
+
+        assert default_parser.tree_cache_size == 512
+        assert kept_parser.tree_cache_size == 7
+
+    def test_deleted_files_discard_parser_tree(
+        self,
+        populated_graph: GraphManager,
+        change_detector: MagicMock,
+        parser: MagicMock,
+        reader: MagicMock,
+    ) -> None:
+        """Deleted files are evicted from the parser's tree cache."""
+        change_detector.detect_changes.return_value = ChangeSet(deleted=[Path("src/utils.py")])
+        change_detector.get_current_commit.return_value = None
+
+        updater = GraphUpdater(populated_graph, change_detector, parser, reader)
+        with patch.object(Path, "exists", return_value=True):
+            updater.update(Path("/project"))
+
+        parser.discard_tree.assert_called_once_with(Path("src/utils.py"))
@@ -6,14 +6,21 @@ Tests cover:
 - Level-based processing order
 - Handling of nodes without child summaries
 - Edge cases: empty graph, non-CONTAINS edges, LLM error handling
+- Batching of sibling parents into one LLM call with per-node fallback
 """
 
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from codemap.core.llm import LLMProvider
+from codemap.engine.change_detector import ChangeSet
+from codemap.engine.graph_updater import GraphUpdater
 from codemap.engine.hierarchy_enricher import HierarchyEnricher
 from codemap.graph import GraphManager
 from codemap.mapper.models import CodeNode
@@ -116,6 +123,20 @@ class TestAggregationBottomUp:
         # Assert
         assert "summary" in graph_with_hierarchy.graph.nodes["src/auth/login.py"]
 
+    @pytest.mark.asyncio
+    async def test_aggregation_bumps_graph_version(
+        self, graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Aggregated summaries invalidate caches keyed on GraphManager.version."""
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.return_value = "[]"
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+        before = graph_with_hierarchy.version
+
+        await enricher.aggregate_summaries()
+
+        assert graph_with_hierarchy.version > before
+
     @pytest.mark.asyncio
     async def test_aggregate_package_summary_from_file_nodes(
         self, graph_with_hierarchy: GraphManager
@@ -357,3 +378,259 @@ class TestEdgeCases:
         assert "summary" in graph_with_hierarchy.graph.nodes["src/api/routes.py"]
         # login.py should NOT have a summary (its aggregation crashed)
         assert "summary" not in graph_with_hierarchy.graph.nodes["src/auth/login.py"]
+
+
+def _answer_all(summary: str) -> Callable[[str, str], Awaitable[str]]:
+    """Build an LLM stub that answers every node_id requested in the prompt."""
+
+    async def respond(_system: str, user: str) -> str:
+        if "node_ids: " in user:
+            node_ids = user.rsplit("node_ids: ", 1)[1].split(", ")
+        else:
+            node_ids = [user.rsplit("node_id: ", 1)[1]]
+        return json.dumps([{"node_id": nid, "summary": summary} for nid in node_ids])
+
+    return respond
+
+
+class TestSiblingBatching:
+    """Test suite for batching sibling parents into one LLM call."""
+
+    @pytest.mark.asyncio
+    async def test_siblings_share_one_llm_call(self, graph_with_hierarchy: GraphManager) -> None:
+        """Both file nodes on level 2 are summarized with a single request."""
+        # Arrange
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = _answer_all("batched")
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+
+        # Act
+        await enricher.aggregate_summaries()
+
+        # Assert - first call covers both files
+        first_prompt = provider.send.call_args_list[0].args[1]
+        assert "node_id: src/auth/login.py" in first_prompt
+        assert "node_id: src/api/routes.py" in first_prompt
+        assert graph_with_hierarchy.graph.nodes["src/auth/login.py"]["summary"] == "batched"
+        assert graph_with_hierarchy.graph.nodes["src/api/routes.py"]["summary"] == "batched"
+
+    @pytest.mark.asyncio
+    async def test_batch_size_one_sends_one_call_per_parent(
+        self, graph_with_hierarchy: GraphManager
+    ) -> None:
+        """batch_size=1 keeps the per-parent prompt."""
+        # Arrange
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = _answer_all("single")
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+
+        # Act
+        await enricher.aggregate_summaries(batch_size=1)
+
+        # Assert
+        prompts = [c.args[1] for c in provider.send.call_args_list]
+        assert all("node_ids: " not in prompt for prompt in prompts)
+        assert graph_with_hierarchy.graph.nodes["project::TestProject"]["summary"] == "single"
+
+    @pytest.mark.asyncio
+    async def test_missing_parent_falls_back_to_single_call(
+        self, graph_with_hierarchy: GraphManager
+    ) -> None:
+        """A parent absent from the batch response is retried on its own."""
+        # Arrange - batch answers only login.py; single calls answer anything
+        single = _answer_all("retried")
+
+        async def respond(system: str, user: str) -> str:
+            if "node_ids: " in user:
+                return '[{"node_id": "src/auth/login.py", "summary": "from batch"}]'
+            return await single(system, user)
+
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = respond
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+
+        # Act
+        await enricher.aggregate_summaries()
+
+        # Assert
+        nodes = graph_with_hierarchy.graph.nodes
+        assert nodes["src/auth/login.py"]["summary"] == "from batch"
+        assert nodes["src/api/routes.py"]["summary"] == "retried"
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_json_falls_back_for_all(
+        self, graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Unparseable batch responses retry every parent individually."""
+        # Arrange
+        single = _answer_all("retried")
+
+        async def respond(system: str, user: str) -> str:
+            if "node_ids: " in user:
+                return "not json"
+            return await single(system, user)
+
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = respond
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+
+        # Act
+        await enricher.aggregate_summaries()
+
+        # Assert
+        assert graph_with_hierarchy.graph.nodes["src/auth/login.py"]["summary"] == "retried"
+        assert graph_with_hierarchy.graph.nodes["src/api/routes.py"]["summary"] == "retried"
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_in_single_batch_is_logged(
+        self, graph_with_hierarchy: GraphManager, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """An exception escaping a batch is logged and other batches continue."""
+        # Arrange
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = _answer_all("ok")
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+        original = enricher._aggregate_node
+
+        async def failing(node_id: str) -> None:
+            if node_id == "src/auth/login.py":
+                raise RuntimeError("boom")
+            await original(node_id)
+
+        enricher._aggregate_node = failing  # type: ignore[method-assign]
+
+        # Act
+        with caplog.at_level(logging.WARNING):
+            await enricher.aggregate_summaries(batch_size=1)
+
+        # Assert
+        assert "Unexpected error aggregating src/auth/login.py: boom" in caplog.text
+        assert graph_with_hierarchy.graph.nodes["src/api/routes.py"]["summary"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_non_positive_batch_size_raises(self, graph_with_hierarchy: GraphManager) -> None:
+        """batch_size must be at least 1."""
+        enricher = HierarchyEnricher(graph_with_hierarchy, AsyncMock(spec=LLMProvider))
+
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            await enricher.aggregate_summaries(batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_aggregate_node_without_child_summaries_is_noop(
+        self, graph_with_hierarchy: GraphManager
+    ) -> None:
+        """_aggregate_node skips parents whose children lack summaries."""
+        provider = AsyncMock(spec=LLMProvider)
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+
+        await enricher._aggregate_node("src")
+
+        provider.send.assert_not_called()
+
+
+class TestDependencyScheduling:
+    """Test suite for per-subtree scheduling without level barriers."""
+
+    @pytest.mark.asyncio
+    async def test_parent_does_not_wait_for_unrelated_subtree(self) -> None:
+        """Package 'a' is aggregated while file 'b/y.py' is still pending."""
+        # Arrange - two independent subtrees a/ and b/
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("a/x.py"), size=10, token_est=2))
+        manager.add_file(FileEntry(Path("b/y.py"), size=10, token_est=2))
+        manager.add_node("a/x.py", CodeNode("function", "fx", 1, 2))
+        manager.add_node("b/y.py", CodeNode("function", "fy", 1, 2))
+        manager.build_hierarchy("P")
+        manager.graph.nodes["a/x.py::fx"]["summary"] = "fx summary"
+        manager.graph.nodes["b/y.py::fy"]["summary"] = "fy summary"
+
+        package_a_done = asyncio.Event()
+        answer = _answer_all("done")
+
+        async def respond(system: str, user: str) -> str:
+            if "node_id: b/y.py" in user:
+                # Blocks until package 'a' was aggregated; a level barrier deadlocks here
+                await asyncio.wait_for(package_a_done.wait(), timeout=5)
+            result = await answer(system, user)
+            if user.endswith("node_id: a"):
+                package_a_done.set()
+            return result
+
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = respond
+        enricher = HierarchyEnricher(manager, provider)
+
+        # Act
+        await enricher.aggregate_summaries(batch_size=1)
+
+        # Assert
+        assert manager.graph.nodes["a"]["summary"] == "done"
+        assert manager.graph.nodes["b/y.py"]["summary"] == "done"
+        assert manager.graph.nodes["project::P"]["summary"] == "done"
+
+
+class TestDirtyAggregation:
+    """Test suite for restricting aggregation to dirty parents."""
+
+    @pytest.mark.asyncio
+    async def test_only_dirty_parents_are_aggregated(
+        self, graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Parents outside the dirty set keep their summaries and cost no calls."""
+        # Arrange
+        graph_with_hierarchy.graph.nodes["src/api/routes.py"]["summary"] = "unchanged"
+        graph_with_hierarchy.graph.nodes["src/api"]["summary"] = "unchanged"
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = _answer_all("fresh")
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+        dirty = {"src/auth/login.py", "src/auth", "src", "project::TestProject"}
+
+        # Act
+        await enricher.aggregate_summaries(batch_size=1, dirty=dirty)
+
+        # Assert
+        nodes = graph_with_hierarchy.graph.nodes
+        assert provider.send.call_count == len(dirty)
+        assert nodes["src/auth/login.py"]["summary"] == "fresh"
+        assert nodes["project::TestProject"]["summary"] == "fresh"
+        assert nodes["src/api/routes.py"]["summary"] == "unchanged"
+        assert nodes["src/api"]["summary"] == "unchanged"
+
+    @pytest.mark.asyncio
+    async def test_updater_dirty_set_skips_clean_sibling_package(
+        self, graph_with_hierarchy: GraphManager
+    ) -> None:
+        """A change under src/auth never sends src/api or its files to the LLM."""
+        # Arrange
+        prompts: list[str] = []
+        answer = _answer_all("fresh")
+
+        async def recording_send(system: str, user: str) -> str:
+            prompts.append(user)
+            return await answer(system, user)
+
+        provider = AsyncMock(spec=LLMProvider)
+        provider.send.side_effect = recording_send
+        updater = GraphUpdater(graph_with_hierarchy, MagicMock(), MagicMock(), MagicMock())
+        changes = ChangeSet(modified=[Path("src/auth/login.py")])
+
+        # Act
+        dirty = updater.get_dirty_parents(changes)
+        await HierarchyEnricher(graph_with_hierarchy, provider).aggregate_summaries(dirty=dirty)
+
+        # Assert
+        sent = "\n".join(prompts)
+        assert dirty == {"src/auth/login.py", "src/auth", "src", "project::TestProject"}
+        assert "src/api/routes.py" not in sent
+        assert "node_id: src/api" not in sent and "node_ids: src/api" not in sent
+        assert graph_with_hierarchy.graph.nodes["project::TestProject"]["summary"] == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_empty_dirty_set_makes_no_calls(self, graph_with_hierarchy: GraphManager) -> None:
+        """An empty dirty set skips aggregation entirely."""
+        provider = AsyncMock(spec=LLMProvider)
+        enricher = HierarchyEnricher(graph_with_hierarchy, provider)
+
+        await enricher.aggregate_summaries(dirty=set())
+
+        provider.send.assert_not_called()
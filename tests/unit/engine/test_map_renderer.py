@@ -12,15 +12,18 @@ Test Organization:
     - TestRenderCode: Level 4 code detail rendering
     - TestMarkdownFormatting: Markdown output quality
     - TestEdgeCases: Edge cases and graceful degradation
+    - TestEdgeIndex: Cached adjacency index and its invalidation
+    - TestRenderCache: Memoized level 0-2 pages
 """
 
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from codemap.engine.map_renderer import MapRenderer
+from codemap.engine.map_renderer import MapRenderer, _ext_of, _parent_package
 from codemap.graph import GraphManager
 from codemap.mapper.models import CodeNode
 from codemap.scout.models import FileEntry
@@ -141,6 +144,7 @@ class TestMapRendererInit:
         gm = GraphManager()
         renderer = MapRenderer(gm, root_path=Path("/tmp/test"))
         assert renderer._root_path == Path("/tmp/test")
+        assert renderer._root_str == str(Path("/tmp/test"))
 
 
 class TestRenderOverview:
@@ -451,6 +455,23 @@ class TestRenderCode:
         assert "return 'world'" in output
         assert "def other():" not in output
 
+    @pytest.mark.asyncio
+    async def test_arender_code_matches_render_code(self, tmp_path: Path) -> None:
+        """The async variant returns the same page and raises the same errors."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "example.py").write_text("def hello():\n    return 'world'\n")
+
+        gm = GraphManager()
+        gm.add_file(FileEntry(Path("src/example.py"), size=100, token_est=25))
+        gm.add_node("src/example.py", CodeNode("function", "hello", 1, 2))
+
+        renderer = MapRenderer(gm, root_path=tmp_path)
+        output = await renderer.arender_code("src/example.py", "hello")
+        assert output == renderer.render_code("src/example.py", "hello")
+        with pytest.raises(ValueError, match="not found"):
+            await renderer.arender_code("src/example.py", "missing")
+
     def test_shows_line_numbers_in_output(self, tmp_path: Path) -> None:
         """Output contains Zeilen indicator with line range."""
         src_dir = tmp_path / "src"
@@ -505,6 +526,63 @@ class TestRenderCode:
         with pytest.raises(ValueError, match="root_path is required"):
             renderer.render_code("src/example.py", "func")
 
+    def test_reads_only_up_to_end_line(self, tmp_path: Path) -> None:
+        """Content after the symbol is never decoded."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        head = b"def hello():\n    return 'world'\n"
+        # Undecodable bytes well past the reader's buffer size
+        (src_dir / "example.py").write_bytes(head + b"# pad\n" * 50_000 + b"\xff\xfe\n")
+
+        gm = GraphManager()
+        gm.add_file(FileEntry(Path("src/example.py"), size=100, token_est=25))
+        gm.add_node("src/example.py", CodeNode("function", "hello", 1, 2))
+        gm.build_hierarchy("Test")
+
+        renderer = MapRenderer(gm, root_path=tmp_path)
+        output = renderer.render_code("src/example.py", "hello")
+
+        assert "   1 | def hello():\n   2 |     return 'world'\n```" in output
+
+    def test_crlf_and_missing_final_newline(self, tmp_path: Path) -> None:
+        """Windows line endings and an unterminated last line render cleanly."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "example.py").write_bytes(b"x = 1\r\ndef f():\r\n    pass")
+
+        gm = GraphManager()
+        gm.add_file(FileEntry(Path("src/example.py"), size=100, token_est=25))
+        gm.add_node("src/example.py", CodeNode("function", "f", 2, 3))
+        gm.build_hierarchy("Test")
+
+        renderer = MapRenderer(gm, root_path=tmp_path)
+        output = renderer.render_code("src/example.py", "f")
+
+        assert "```python\n   2 | def f():\n   3 |     pass\n```" in output
+        assert "\r" not in output
+
+    def test_fence_language_from_suffix(self, tmp_path: Path) -> None:
+        """Code fence language follows the file suffix like Path.suffix."""
+        cases = {
+            "src/app.ts": "```typescript\n",
+            "src/tool.rs": "```rs\n",
+            "src/v1.2/Makefile": "```\n",
+            "src/.env": "```\n",
+        }
+        gm = GraphManager()
+        for file_path in cases:
+            abs_path = tmp_path / file_path
+            abs_path.parent.mkdir(parents=True, exist_ok=True)
+            abs_path.write_text("line1\n")
+            gm.add_file(FileEntry(Path(file_path), size=6, token_est=1))
+            gm.add_node(file_path, CodeNode("function", "f", 1, 1))
+
+        renderer = MapRenderer(gm, root_path=tmp_path)
+
+        for file_path, fence in cases.items():
+            output = renderer.render_code(file_path, "f")
+            assert f"Quellcode\n\n{fence}   1 | line1" in output, file_path
+
 
 class TestMarkdownFormatting:
     """Tests for Markdown output quality."""
@@ -699,6 +777,20 @@ class TestEdgeCases:
         renderer = MapRenderer(gm)
         assert renderer._get_node_risks("nonexistent") == []
 
+    def test_child_summaries_use_collected_attrs(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Child summaries come from collected attrs, not per-child lookups."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+
+        with patch.object(
+            renderer, "_get_node_summary", wraps=renderer._get_node_summary
+        ) as spy:
+            output = renderer.render_module("src/auth/login.py")
+
+        assert spy.call_count == 1
+        assert "authenticate" in output
+
     def test_architecture_hints_with_root_level_file(self) -> None:
         """Root-level files (single-part path) return None for parent package."""
         gm = GraphManager()
@@ -747,3 +839,167 @@ class TestEdgeCases:
         output = renderer.render_package("pkg")
         # other/shared.py should appear only once in outgoing
         assert output.count("other/shared.py") >= 1
+
+    def test_package_external_imports_follow_child_order(self) -> None:
+        """Boundary imports are listed once, in package child order."""
+        gm = GraphManager()
+        for path in ("pkg/a.py", "pkg/b.py", "other/x.py", "other/y.py"):
+            gm.add_file(FileEntry(Path(path), size=100, token_est=25))
+        gm.build_hierarchy("Test")
+        gm.add_dependency("pkg/b.py", "other/y.py")
+        gm.add_dependency("pkg/a.py", "other/x.py")
+        gm.add_dependency("pkg/a.py", "other/y.py")
+        gm.add_dependency("pkg/b.py", "other/x.py")
+        gm.add_dependency("pkg/b.py", "pkg/a.py")
+
+        renderer = MapRenderer(gm)
+        children = ["pkg/a.py", "pkg/b.py"]
+        outgoing, incoming = renderer._collect_package_external_imports(
+            children, frozenset(children)
+        )
+
+        assert outgoing == ["other/x.py", "other/y.py"]
+        assert incoming == []
+
+
+class TestEdgeIndex:
+    """Tests for the cached per-relationship edge index."""
+
+    def test_index_reused_while_graph_unchanged(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Repeated renders share one index build."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+        renderer.render_overview()
+        index = renderer._edge_index()
+
+        renderer.render_package("src/auth")
+        renderer.render_module("src/auth/login.py")
+
+        assert renderer._edge_index() is index
+
+    def test_index_rebuilt_after_graph_change(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Changes made through GraphManager show up in the next render."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+        assert "src/auth/models.py" not in renderer.render_module("src/utils/helpers.py")
+
+        simple_graph_with_hierarchy.add_dependency("src/auth/models.py", "src/utils/helpers.py")
+        output = renderer.render_module("src/utils/helpers.py")
+
+        assert "src/auth/models.py (1x)" in output
+        assert "src/auth importiert src/utils" in renderer.render_overview()
+
+    def test_index_keeps_edge_order_and_ignores_other_relationships(self) -> None:
+        """Neighbour order matches in_edges(); unknown relationships are skipped."""
+        gm = GraphManager()
+        for name in ("a", "b", "target"):
+            gm.add_file(FileEntry(Path(f"pkg/{name}.py"), size=10, token_est=2))
+        # b imports target before a does, although a was added first
+        gm.add_dependency("pkg/b.py", "pkg/target.py")
+        gm.add_dependency("pkg/a.py", "pkg/target.py")
+        gm.graph.add_edge("pkg/a.py", "pkg/b.py", relationship="CALLS")
+
+        renderer = MapRenderer(gm)
+
+        assert renderer._find_callers("pkg/target.py") == ["pkg/b.py", "pkg/a.py"]
+        assert renderer._edge_index().imports_by_src == {
+            "pkg/b.py": ["pkg/target.py"],
+            "pkg/a.py": ["pkg/target.py"],
+        }
+
+    def test_architecture_hints_resolve_each_node_once(self) -> None:
+        """Parent packages are computed once per node, not once per edge."""
+        gm = GraphManager()
+        paths = ["core/base.py", "api/a.py", "api/b.py", "cli/c.py"]
+        for path in paths:
+            gm.add_file(FileEntry(Path(path), size=10, token_est=2))
+        for source in paths[1:]:
+            gm.add_dependency(source, "core/base.py")
+        gm.add_dependency("api/a.py", "api/b.py")
+
+        renderer = MapRenderer(gm)
+        _parent_package.cache_clear()
+        hints = renderer._collect_architecture_hints()
+
+        assert hints == ["api importiert core", "cli importiert core"]
+        assert _parent_package.cache_info().misses == len(paths)
+
+    def test_parent_package_of_node_ids(self) -> None:
+        """Parent directories are derived from the file part of node IDs."""
+        assert _parent_package("src/auth/login.py") == "src/auth"
+        assert _parent_package("src/auth/login.py::authenticate") == "src/auth"
+        assert _parent_package("main.py") is None
+        assert _parent_package("external::os.path") is None
+        assert _parent_package("/main.py") == "/"
+
+    def test_ext_of_matches_path_suffix(self) -> None:
+        """_ext_of follows Path.suffix without constructing a Path."""
+        for path in ["src/a.py", "src/.env", "src/Makefile", "a.tar.gz", "src/x.", "pkg.d/mod"]:
+            assert _ext_of(path) == Path(path).suffix.removeprefix(".")
+
+
+class TestRenderCache:
+    """Tests for memoized overview/package/module pages."""
+
+    def test_repeated_render_returns_cached_page(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Identical calls on an unchanged graph return the same string object."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+
+        assert renderer.render_overview() is renderer.render_overview()
+        assert renderer.render_package("src/auth") is renderer.render_package("src/auth")
+        assert renderer.render_module("src/auth/login.py") is renderer.render_module(
+            "src/auth/login.py"
+        )
+
+    def test_pages_cached_per_argument(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Different packages get their own cache entries."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+
+        auth = renderer.render_package("src/auth")
+        utils = renderer.render_package("src/utils")
+
+        assert auth != utils
+        assert renderer.render_package("src/auth") is auth
+
+    def test_version_change_invalidates_pages(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Structural changes through GraphManager drop cached pages."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+        before = renderer.render_module("src/auth/login.py")
+
+        simple_graph_with_hierarchy.add_node(
+            "src/auth/login.py", CodeNode("function", "logout", 52, 60)
+        )
+
+        after = renderer.render_module("src/auth/login.py")
+        assert "logout" not in before
+        assert "- **logout**" in after
+
+    def test_clear_cache_picks_up_attribute_changes(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Attribute edits are visible after clear_cache()."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+        renderer.render_overview()
+        simple_graph_with_hierarchy.graph.nodes["src"]["summary"] = "Rewritten summary"
+
+        assert "Rewritten summary" not in renderer.render_overview()
+        renderer.clear_cache()
+        assert "Rewritten summary" in renderer.render_overview()
+
+    def test_failed_render_not_cached(
+        self, simple_graph_with_hierarchy: GraphManager
+    ) -> None:
+        """Unknown nodes raise on every call instead of caching an error."""
+        renderer = MapRenderer(simple_graph_with_hierarchy)
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="not found"):
+                renderer.render_package("nonexistent")
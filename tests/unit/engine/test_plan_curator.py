@@ -359,6 +359,24 @@ class TestCurateSimplePlan:
         assert mock_llm_simple.send.call_count == 1
 
 
+class TestCurateSession:
+    """Tests for per-session tool state."""
+
+    @pytest.mark.asyncio
+    async def test_curate_clears_tool_cache(
+        self,
+        enriched_graph: GraphManager,
+        mock_llm_simple: AsyncMock,
+    ) -> None:
+        """Each curate() call starts with an empty tool cache."""
+        curator = PlanCurator(enriched_graph, mock_llm_simple)
+        curator._tools._cache[("symbol", "a.py", "f")] = "stale"
+
+        await curator.curate("# Plan")
+
+        assert curator._tools._cache == {}
+
+
 class TestCurateWithRisks:
     """Tests for plans with risks - LLM navigates graph via tools."""
 
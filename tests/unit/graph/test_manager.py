@@ -5,11 +5,15 @@ following strict TDD RED phase - all tests define the expected API contract
 and will fail until implementation is complete.
 """
 
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any
 
 import networkx as nx
+import orjson
 import pytest
+from networkx.readwrite import json_graph
 
 from codemap.graph import GraphManager
 from codemap.mapper.models import CodeNode
@@ -32,6 +36,16 @@ class TestGraphModuleExports:
         assert hasattr(graph, "__all__")
         assert "GraphManager" in graph.__all__
 
+    def test_import_defers_networkx(self) -> None:
+        """Importing codemap.graph does not import NetworkX until a manager is built."""
+        code = (
+            "import sys, codemap.graph; "
+            "assert 'networkx' not in sys.modules; "
+            "codemap.graph.GraphManager(); "
+            "assert 'networkx' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
 
 class TestGraphManagerInitialization:
     """Test suite for GraphManager initialization."""
@@ -140,6 +154,16 @@ class TestGraphManagerBasic:
         assert manager.graph.nodes["src/main.py"]["size"] == 2048
         assert manager.graph.nodes["src/main.py"]["token_est"] == 512
 
+    def test_add_file_raw_matches_add_file(self) -> None:
+        """Test add_file_raw creates the same node as add_file."""
+        via_entry = GraphManager()
+        via_raw = GraphManager()
+
+        via_entry.add_file(FileEntry(path=Path("src/main.py"), size=1024, token_est=256))
+        via_raw.add_file_raw("src/main.py", 1024, 256)
+
+        assert dict(via_raw.graph.nodes(data=True)) == dict(via_entry.graph.nodes(data=True))
+
 
 class TestGraphManagerHierarchy:
     """Test suite for GraphManager hierarchy and relationship operations."""
@@ -511,6 +535,36 @@ class TestGraphManagerPersistence:
         assert (tmp_path / "graph.json").exists()
         assert (tmp_path / "graph.json").stat().st_size > 0
 
+    def test_failed_save_keeps_existing_file(self, tmp_path: Path) -> None:
+        """A serialization error leaves the previous file and no temp file behind."""
+        graph_file = tmp_path / "graph.json"
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/app.py"), 512, 128))
+        manager.save(graph_file)
+        original = graph_file.read_bytes()
+        manager.graph.nodes["src/app.py"]["bad"] = object()
+
+        with pytest.raises(TypeError):
+            manager.save(graph_file)
+
+        assert graph_file.read_bytes() == original
+        assert list(tmp_path.iterdir()) == [graph_file]
+
+    def test_save_matches_node_link_data(self, tmp_path: Path) -> None:
+        """Saved JSON is byte-identical to NetworkX's node_link_data output."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/app.py"), 512, 128))
+        manager.add_node("src/app.py", CodeNode("function", "main", 1, 10))
+        manager.add_dependency("src/app.py", "external::os")
+        manager.graph.nodes["src/app.py"]["id"] = "shadowed"
+        manager.build_metadata["commit_hash"] = "abc123"
+
+        manager.save(tmp_path / "graph.json")
+
+        expected = json_graph.node_link_data(manager.graph)
+        expected["build_metadata"] = {"commit_hash": "abc123"}
+        assert (tmp_path / "graph.json").read_bytes() == orjson.dumps(expected)
+
     def test_save_and_load_roundtrip(self, tmp_path: Path) -> None:
         """Test save and load preserves graph structure."""
         manager = GraphManager()
@@ -607,14 +661,24 @@ class TestGraphManagerPersistence:
         ):  # orjson.JSONDecodeError is a ValueError subclass
             manager.load(invalid_file)
 
+    def test_load_empty_file_raises_invalid_json(self, tmp_path: Path) -> None:
+        """An empty file (which cannot be memory-mapped) is reported as invalid JSON."""
+        empty_file = tmp_path / "empty.json"
+        empty_file.write_bytes(b"")
+
+        manager = GraphManager()
+
+        with pytest.raises(ValueError, match="Invalid JSON in graph file"):
+            manager.load(empty_file)
+
     def test_load_invalid_graph_schema_raises_error(self, tmp_path: Path) -> None:
         """Test load raises ValueError for valid JSON with invalid graph schema.
 
         Valid JSON that does not conform to node_link_data structure (e.g., missing
-        'nodes' or 'links' keys) should raise a ValueError with clear message.
+        'nodes' or 'edges' keys) should raise a ValueError with clear message.
         """
         invalid_schema_file = tmp_path / "invalid_schema.json"
-        # Valid JSON but missing required "nodes" and "links" keys
+        # Valid JSON but missing required "nodes" and "edges"/"links" keys
         invalid_schema_file.write_bytes(b'{"foo": "bar", "baz": 123}')
 
         manager = GraphManager()
@@ -622,6 +686,87 @@ class TestGraphManagerPersistence:
         with pytest.raises(ValueError, match="Invalid graph schema"):
             manager.load(invalid_schema_file)
 
+    def test_load_accepts_legacy_links_key(self, tmp_path: Path) -> None:
+        """Files written by NetworkX < 3.6 store edges under 'links'."""
+        content = orjson.dumps(
+            {
+                "directed": True,
+                "multigraph": False,
+                "graph": {},
+                "nodes": [{"id": "a.py", "type": "file"}, {"id": "b.py", "type": "file"}],
+                "links": [{"source": "a.py", "target": "b.py", "relationship": "IMPORTS"}],
+            }
+        )
+        graph_file = tmp_path / "graph.json"
+        graph_file.write_bytes(content)
+        manager = GraphManager()
+
+        manager.load(graph_file)
+
+        assert manager.graph.edges["a.py", "b.py"]["relationship"] == "IMPORTS"
+        assert manager.graph_stats == {"nodes": 2, "edges": 1}
+
+    def test_load_matches_node_link_graph(self, tmp_path: Path) -> None:
+        """load() rebuilds the same nodes, edges and attributes as node_link_graph."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/app.py"), 512, 128))
+        manager.add_node("src/app.py", CodeNode("function", "main", 1, 10))
+        manager.add_dependency("src/app.py", "external::os")
+        manager.graph.edges["src/app.py", "external::os"]["weight"] = 2
+        manager.save(tmp_path / "graph.json")
+        expected = json_graph.node_link_graph(
+            orjson.loads((tmp_path / "graph.json").read_bytes()), directed=True
+        )
+
+        loaded = GraphManager()
+        loaded.load(tmp_path / "graph.json")
+
+        assert list(loaded.graph.nodes(data=True)) == list(expected.nodes(data=True))
+        assert list(loaded.graph.edges(data=True)) == list(expected.edges(data=True))
+
+    def test_load_merges_duplicates_like_node_link_graph(self, tmp_path: Path) -> None:
+        """Duplicate entries merge and edge-only endpoints are created bare."""
+        content = orjson.dumps(
+            {
+                "directed": True,
+                "multigraph": False,
+                "nodes": [
+                    {"id": "a.py", "type": "file"},
+                    {"id": "a.py", "size": 10},
+                ],
+                "edges": [
+                    {"source": "a.py", "target": "external::os", "relationship": "IMPORTS"},
+                    {"source": "a.py", "target": "external::os", "weight": 2},
+                ],
+            }
+        )
+        (tmp_path / "graph.json").write_bytes(content)
+        expected = json_graph.node_link_graph(orjson.loads(content), directed=True)
+
+        manager = GraphManager()
+        manager.load(tmp_path / "graph.json")
+
+        assert list(manager.graph.nodes(data=True)) == list(expected.nodes(data=True))
+        assert list(manager.graph.edges(data=True)) == list(expected.edges(data=True))
+        assert list(manager.graph.predecessors("external::os")) == ["a.py"]
+
+    def test_load_invalid_entry_keeps_graph(self, tmp_path: Path) -> None:
+        """Malformed node or edge entries are rejected before the graph is cleared."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/app.py"), 512, 128))
+        bad_files = {
+            "no_id.json": b'{"nodes": [{"type": "file"}], "edges": []}',
+            "not_dict.json": b'{"nodes": ["src/a.py"], "edges": []}',
+            "no_target.json": b'{"nodes": [], "edges": [{"source": "a"}]}',
+        }
+
+        for name, content in bad_files.items():
+            (tmp_path / name).write_bytes(content)
+            with pytest.raises(ValueError, match="Invalid graph schema"):
+                manager.load(tmp_path / name)
+
+        assert list(manager.graph.nodes) == ["src/app.py"]
+
     def test_save_creates_parent_directories(self, tmp_path: Path) -> None:
         """Test save creates parent directories when they don't exist."""
         manager = GraphManager()
@@ -767,6 +912,79 @@ class TestGraphManagerStats:
         # 3 CONTAINS + 1 IMPORTS = 4 edges
         assert manager.graph_stats == {"nodes": 5, "edges": 4}
 
+    def test_graph_stats_cached_until_version_changes(self) -> None:
+        """Counts are reused between manager mutations and refreshed after them."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/main.py"), 1024, 256))
+        assert manager.graph_stats == {"nodes": 1, "edges": 0}
+
+        manager.add_dependency("src/main.py", "external::os")
+        assert manager.graph_stats == {"nodes": 2, "edges": 1}
+
+        manager.graph.add_node("direct")
+        manager.mark_modified()
+        assert manager.graph_stats == {"nodes": 3, "edges": 1}
+
+    def test_graph_stats_refreshed_by_every_mutating_method(self, tmp_path: Path) -> None:
+        """Hierarchy building, removal and loading all invalidate the counts."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/main.py"), 1024, 256))
+        manager.add_node("src/main.py", CodeNode("function", "main", 1, 10))
+        assert manager.graph_stats == {"nodes": 2, "edges": 1}
+
+        manager.build_hierarchy("MyProject")
+        assert manager.graph_stats == {
+            "nodes": manager.graph.number_of_nodes(),
+            "edges": manager.graph.number_of_edges(),
+        }
+
+        manager.save(tmp_path / "graph.json")
+        manager.remove_file("src/main.py")
+        assert manager.graph_stats == {
+            "nodes": manager.graph.number_of_nodes(),
+            "edges": manager.graph.number_of_edges(),
+        }
+
+        manager.load(tmp_path / "graph.json")
+        assert manager.graph_stats == {
+            "nodes": manager.graph.number_of_nodes(),
+            "edges": manager.graph.number_of_edges(),
+        }
+        assert manager.graph_stats["nodes"] > 2
+
+    def test_graph_stats_matches_networkx_counts(self) -> None:
+        """Counts agree with NetworkX after direct graph edits and removals."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/main.py"), 1024, 256))
+        manager.add_node("src/main.py", CodeNode("function", "main", 1, 10))
+        manager.graph.add_edge("src/main.py", "external::os", relationship="IMPORTS")
+        manager.graph.add_edge("src/main.py", "src/main.py", relationship="IMPORTS")
+        manager.remove_node("src/main.py::main")
+
+        assert manager.graph_stats == {
+            "nodes": manager.graph.number_of_nodes(),
+            "edges": manager.graph.number_of_edges(),
+        }
+        assert manager.graph_stats == {"nodes": 2, "edges": 2}
+
+    def test_load_interns_relationship_values(self, tmp_path: Path) -> None:
+        """Loaded relationship and type strings are interned; other values pass through."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/a.py"), 100, 25))
+        manager.add_node("src/a.py", CodeNode("function", "foo", 1, 5))
+        manager.graph.add_edge("src/a.py", "src/b.py", relationship=None)
+        manager.graph.nodes["src/b.py"]["type"] = None
+        manager.save(tmp_path / "graph.json")
+
+        loaded = GraphManager()
+        loaded.load(tmp_path / "graph.json")
+
+        relationship = loaded.graph.edges["src/a.py", "src/a.py::foo"]["relationship"]
+        assert relationship is sys.intern("CONTAINS")
+        assert loaded.graph.nodes["src/a.py::foo"]["type"] is sys.intern("function")
+        assert loaded.graph.edges["src/a.py", "src/b.py"]["relationship"] is None
+        assert loaded.graph.nodes["src/b.py"]["type"] is None
+
     def test_load_preserves_graph_identity(self, tmp_path: Path) -> None:
         """Test load() preserves graph instance identity.
 
@@ -939,6 +1157,34 @@ class TestHierarchyBuilding:
         # No project node exists, so no CONTAINS edge should be created
         assert manager.graph.in_degree("src") == 0
 
+    def test_add_package_uses_first_project_node(self) -> None:
+        """Root-level packages attach to the first project, even after it is removed."""
+        manager = GraphManager()
+        manager.add_project("First")
+        manager.add_project("Second")
+
+        manager.add_package("src")
+        manager.add_package("docs")
+        first_children = list(manager.graph.successors("project::First"))
+        manager.remove_node("project::First")
+        manager.add_package("lib")
+
+        assert first_children == ["src", "docs"]
+        assert list(manager.graph.predecessors("lib")) == ["project::Second"]
+
+    def test_add_package_finds_project_after_load(self, tmp_path: Path) -> None:
+        """A project node from a loaded graph is picked up by add_package()."""
+        source = GraphManager()
+        source.add_project("Loaded")
+        source.save(tmp_path / "graph.json")
+        manager = GraphManager()
+        manager.add_project("Old")
+
+        manager.load(tmp_path / "graph.json")
+        manager.add_package("src")
+
+        assert manager.graph.has_edge("project::Loaded", "src")
+
     def test_deep_nesting_hierarchy(self) -> None:
         """build_hierarchy() handles deeply nested paths (>5 levels) correctly."""
         manager = GraphManager()
@@ -959,6 +1205,250 @@ class TestHierarchyBuilding:
         assert manager.graph.nodes["a/b/c/d/e/f"]["level"] == 6
         assert manager.graph.nodes["a/b/c/d/e/f/deep.py"]["level"] == 7
 
+    def test_ancestor_dirs_matches_pathlib_parts(self) -> None:
+        """_ancestor_dirs() yields the same directories as Path.parts prefixes."""
+        from codemap.graph.manager import _ancestor_dirs
+
+        for raw in ["main.py", "src/main.py", "a/b/c/d.py", "/abs/x/y.py"]:
+            parts = Path(raw).parts
+            expected = [str(Path(*parts[:i])) for i in range(1, len(parts))]
+
+            result = _ancestor_dirs(str(Path(raw)))
+
+            assert result == expected, raw
+
+
+class TestLevelIndex:
+    """Tests for the cached nodes_by_level() index."""
+
+    def test_groups_nodes_by_level(self) -> None:
+        """nodes_by_level() buckets hierarchy nodes and skips unleveled ones."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/a.py"), size=10, token_est=2))
+        manager.add_node("src/a.py", CodeNode("function", "f", 1, 2))
+        manager.add_external_module("os")
+        manager.build_hierarchy("P")
+
+        index = manager.nodes_by_level()
+
+        assert index == {
+            0: ["project::P"],
+            1: ["src"],
+            2: ["src/a.py"],
+            3: ["src/a.py::f"],
+        }
+
+    def test_index_is_cached_between_calls(self) -> None:
+        """Repeated calls without mutation return the same index."""
+        manager = GraphManager()
+        manager.add_project("P")
+
+        assert manager.nodes_by_level() is manager.nodes_by_level()
+
+    def test_mutations_invalidate_index(self, tmp_path: Path) -> None:
+        """Removing nodes, adding packages and loading rebuild the index."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/a.py"), size=10, token_est=2))
+        manager.build_hierarchy("P")
+        manager.save(tmp_path / "graph.json")
+        assert 2 in manager.nodes_by_level()
+
+        manager.remove_file("src/a.py")
+        assert 2 not in manager.nodes_by_level()
+
+        manager.add_package("lib")
+        assert manager.nodes_by_level()[1] == ["src", "lib"]
+
+        manager.remove_node("lib")
+        assert manager.nodes_by_level()[1] == ["src"]
+
+        manager.load(tmp_path / "graph.json")
+        assert manager.nodes_by_level()[2] == ["src/a.py"]
+
+
+class TestTypeIndex:
+    """Tests for the cached nodes_by_type() index."""
+
+    def test_groups_nodes_by_type(self) -> None:
+        """nodes_by_type() buckets nodes and skips untyped ones."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/a.py"), size=10, token_est=2))
+        manager.add_node("src/a.py", CodeNode("function", "f", 1, 2))
+        manager.add_dependency("src/a.py", "lazy_target")
+        manager.build_hierarchy("P")
+
+        index = manager.nodes_by_type()
+
+        assert index == {
+            "file": ["src/a.py"],
+            "function": ["src/a.py::f"],
+            "project": ["project::P"],
+            "package": ["src"],
+        }
+
+    def test_index_cached_until_version_changes(self) -> None:
+        """Same index object until a structural change, then rebuilt."""
+        manager = GraphManager()
+        manager.add_project("P")
+        index = manager.nodes_by_type()
+        assert manager.nodes_by_type() is index
+
+        manager.add_file(FileEntry(Path("a.py"), size=10, token_est=2))
+
+        assert manager.nodes_by_type() is not index
+        assert manager.nodes_by_type()["file"] == ["a.py"]
+
+    def test_typing_lazy_external_node_refreshes_index(self) -> None:
+        """add_external_module() on a lazily created node updates the index."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("a.py"), size=10, token_est=2))
+        manager.add_dependency("a.py", "external::os")
+        assert "external_module" not in manager.nodes_by_type()
+
+        manager.add_external_module("os")
+
+        assert manager.nodes_by_type()["external_module"] == ["external::os"]
+
+
+class TestVersion:
+    """Tests for the structure version counter."""
+
+    def test_structural_changes_bump_version(self, tmp_path: Path) -> None:
+        """Every node/edge-changing method increments version."""
+        manager = GraphManager()
+        manager.save(tmp_path / "graph.json")
+        versions = [manager.version]
+
+        manager.add_file(FileEntry(Path("src/a.py"), size=10, token_est=2))
+        versions.append(manager.version)
+        manager.add_node("src/a.py", CodeNode("function", "f", 1, 2))
+        versions.append(manager.version)
+        manager.add_external_module("os")
+        versions.append(manager.version)
+        manager.add_dependency("src/a.py", "external::os")
+        versions.append(manager.version)
+        manager.build_hierarchy("P")
+        versions.append(manager.version)
+        manager.add_package("lib")
+        versions.append(manager.version)
+        manager.remove_node("lib")
+        versions.append(manager.version)
+        manager.remove_file("src/a.py")
+        versions.append(manager.version)
+        manager.load(tmp_path / "graph.json")
+        versions.append(manager.version)
+
+        assert versions == sorted(set(versions))
+
+    def test_attribute_updates_keep_version(self) -> None:
+        """Re-adding an existing external module or setting attributes does not count."""
+        manager = GraphManager()
+        manager.add_external_module("os")
+        before = manager.version
+
+        manager.add_external_module("os")
+        manager.graph.nodes["external::os"]["summary"] = "Operating system"
+
+        assert manager.version == before
+
+    def test_mark_modified_bumps_version(self) -> None:
+        """mark_modified() records direct attribute changes."""
+        manager = GraphManager()
+        manager.add_external_module("os")
+        before = manager.version
+
+        manager.graph.nodes["external::os"]["summary"] = "Operating system"
+        manager.mark_modified()
+
+        assert manager.version > before
+
+
+class TestBulkOperations:
+    """Tests for add_files_bulk() and add_dependencies_bulk()."""
+
+    def test_add_files_bulk_matches_add_file(self) -> None:
+        """Bulk-added file nodes equal those added one by one."""
+        entries = [
+            FileEntry(Path("src/a.py"), size=10, token_est=2),
+            FileEntry(Path("src/b.py"), size=20, token_est=5),
+        ]
+        single = GraphManager()
+        for entry in entries:
+            single.add_file(entry)
+        bulk = GraphManager()
+
+        bulk.add_files_bulk(iter(entries))
+
+        assert dict(bulk.graph.nodes(data=True)) == dict(single.graph.nodes(data=True))
+        assert bulk.version == 1
+
+    def test_add_dependencies_bulk_matches_add_dependency(self) -> None:
+        """Bulk IMPORTS edges and lazy targets equal the single-call result."""
+        pairs = [("src/a.py", "src/b.py"), ("src/a.py", "external::os")]
+        single = GraphManager()
+        bulk = GraphManager()
+        for manager in (single, bulk):
+            manager.add_file(FileEntry(Path("src/a.py"), size=10, token_est=2))
+        for source, target in pairs:
+            single.add_dependency(source, target)
+
+        bulk.add_dependencies_bulk(iter(pairs))
+
+        assert dict(bulk.graph.nodes(data=True)) == dict(single.graph.nodes(data=True))
+        assert list(bulk.graph.edges(data=True)) == list(single.graph.edges(data=True))
+
+    def test_add_dependencies_bulk_validates_before_adding(self) -> None:
+        """An unknown source rejects the whole batch."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/a.py"), size=10, token_est=2))
+        before = manager.version
+
+        with pytest.raises(ValueError, match="src/missing.py"):
+            manager.add_dependencies_bulk(
+                [("src/a.py", "src/b.py"), ("src/missing.py", "src/a.py")]
+            )
+
+        assert manager.graph_stats == {"nodes": 1, "edges": 0}
+        assert manager.version == before
+
+    def test_add_nodes_bulk_matches_add_node(self) -> None:
+        """Bulk code nodes and CONTAINS edges equal the single-call result."""
+        code_nodes = [CodeNode("function", "main", 1, 10), CodeNode("class", "App", 12, 40)]
+        single = GraphManager()
+        bulk = GraphManager()
+        for manager in (single, bulk):
+            manager.add_file(FileEntry(Path("src/app.py"), size=10, token_est=2))
+        for node in code_nodes:
+            single.add_node("src/app.py", node)
+
+        bulk.add_nodes_bulk("src/app.py", iter(code_nodes))
+
+        assert dict(bulk.graph.nodes(data=True)) == dict(single.graph.nodes(data=True))
+        assert list(bulk.graph.edges(data=True)) == list(single.graph.edges(data=True))
+
+    def test_add_nodes_bulk_validates_parent(self) -> None:
+        """The parent must exist and be a file node, as in add_node()."""
+        manager = GraphManager()
+        manager.add_external_module("os")
+        code_nodes = [CodeNode("function", "main", 1, 10)]
+
+        with pytest.raises(ValueError, match="does not exist"):
+            manager.add_nodes_bulk("src/missing.py", code_nodes)
+        with pytest.raises(ValueError, match="is not a file node"):
+            manager.add_nodes_bulk("external::os", code_nodes)
+
+    def test_empty_batches_keep_version(self) -> None:
+        """Empty inputs change nothing."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/app.py"), size=10, token_est=2))
+        before = manager.version
+
+        manager.add_files_bulk([])
+        manager.add_nodes_bulk("src/app.py", [])
+        manager.add_dependencies_bulk([])
+
+        assert manager.version == before
+
 
 class TestRemoveOperations:
     """Test suite for node removal operations."""
@@ -1071,6 +1561,20 @@ class TestRemoveOperations:
         with pytest.raises(ValueError, match="not found"):
             manager.remove_file("nonexistent.py")
 
+    def test_remove_file_missing_ok_returns_false(self) -> None:
+        """remove_file(missing_ok=True) returns False instead of raising."""
+        manager = GraphManager()
+
+        assert manager.remove_file("nonexistent.py", missing_ok=True) is False
+
+    def test_remove_file_returns_true_when_removed(self) -> None:
+        """remove_file() reports a successful removal."""
+        manager = GraphManager()
+        manager.add_file(FileEntry(Path("src/test.py"), size=100, token_est=25))
+
+        assert manager.remove_file("src/test.py", missing_ok=True) is True
+        assert "src/test.py" not in manager.graph.nodes
+
 
 class TestBuildMetadata:
     """Tests for build_metadata property."""
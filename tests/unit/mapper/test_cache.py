@@ -0,0 +1,128 @@
+"""Unit tests for mapper.cache module."""
+
+import threading
+from pathlib import Path
+
+from codemap.mapper.cache import ParseCache, parser_version
+from codemap.mapper.models import CodeNode
+
+
+class TestParseCache:
+    """Test suite for ParseCache class."""
+
+    def test_miss_returns_none(self):
+        """Unknown (path, digest) pairs are a cache miss."""
+        with ParseCache() as cache:
+            assert cache.get("src/main.py", ParseCache.digest("x = 1")) is None
+
+    def test_put_then_get_roundtrips_nodes(self):
+        """Stored CodeNodes are returned unchanged."""
+        nodes = [
+            CodeNode("import", "os", 1, 1),
+            CodeNode("function", "main", 3, 5),
+        ]
+        with ParseCache() as cache:
+            digest = ParseCache.digest("import os\n")
+            cache.put("src/main.py", digest, nodes)
+
+            assert cache.get("src/main.py", digest) == nodes
+
+    def test_keeps_multiple_versions_per_path(self):
+        """Different content digests of one path are stored side by side."""
+        old = [CodeNode("function", "old", 1, 2)]
+        new = [CodeNode("function", "new", 1, 2)]
+        with ParseCache() as cache:
+            cache.put("a.py", ParseCache.digest("old"), old)
+            cache.put("a.py", ParseCache.digest("new"), new)
+
+            assert cache.get("a.py", ParseCache.digest("old")) == old
+            assert cache.get("a.py", ParseCache.digest("new")) == new
+            assert cache.get("b.py", ParseCache.digest("old")) is None
+
+    def test_empty_node_list_is_a_hit(self):
+        """Files without extractable elements are cached as empty lists."""
+        with ParseCache() as cache:
+            cache.put("empty.py", "d", [])
+
+            assert cache.get("empty.py", "d") == []
+
+    def test_persists_to_disk(self, tmp_path: Path):
+        """Entries survive reopening the database file."""
+        db_path = tmp_path / "parse_cache.sqlite"
+        nodes = [CodeNode("class", "Foo", 1, 10)]
+
+        with ParseCache(db_path) as cache:
+            cache.put("foo.py", "abc", nodes)
+
+        with ParseCache(db_path) as cache:
+            assert cache.get("foo.py", "abc") == nodes
+
+    def test_usable_from_other_threads(self):
+        """One instance can be shared with worker threads."""
+        nodes = [CodeNode("function", "f", 1, 1)]
+        results: list[list[CodeNode] | None] = []
+
+        with ParseCache() as cache:
+            cache.put("f.py", "d", nodes)
+            worker = threading.Thread(target=lambda: results.append(cache.get("f.py", "d")))
+            worker.start()
+            worker.join()
+
+        assert results == [nodes]
+
+    def test_version_bump_misses_cache(self, tmp_path: Path):
+        """Entries written for another parser version are discarded on open."""
+        db_path = tmp_path / "parse_cache.sqlite"
+        nodes = [CodeNode("class", "Foo", 1, 10)]
+        with ParseCache(db_path, version="v1") as cache:
+            cache.put("foo.py", "abc", nodes)
+
+        with ParseCache(db_path, version="v2") as cache:
+            result = cache.get("foo.py", "abc")
+        with ParseCache(db_path, version="v1") as cache:
+            reopened = cache.get("foo.py", "abc")
+
+        assert result is None
+        assert reopened is None
+
+    def test_same_version_keeps_entries(self, tmp_path: Path):
+        """Reopening with the default version keeps the stored entries."""
+        db_path = tmp_path / "parse_cache.sqlite"
+        nodes = [CodeNode("function", "f", 1, 1)]
+        with ParseCache(db_path) as cache:
+            cache.put("f.py", "d", nodes)
+
+        with ParseCache(db_path, version=parser_version()) as cache:
+            assert cache.get("f.py", "d") == nodes
+
+    def test_parser_version_tracks_query_files(self):
+        """The default version is a stable digest over the query files."""
+        assert parser_version() == parser_version()
+        assert len(parser_version()) == 64
+
+    def test_prune_drops_paths_not_live(self):
+        """prune() deletes entries of paths missing from live_paths."""
+        with ParseCache() as cache:
+            cache.put("kept.py", "d", [])
+            cache.put("gone.py", "d", [])
+
+            deleted = cache.prune(["kept.py"])
+
+            assert deleted == 1
+            assert cache.get("kept.py", "d") == []
+            assert cache.get("gone.py", "d") is None
+
+    def test_prune_keeps_latest_digests_per_path(self):
+        """prune() keeps only the most recently stored digests of each path."""
+        with ParseCache() as cache:
+            for digest in ["d1", "d2", "d3"]:
+                cache.put("a.py", digest, [])
+            cache.put("b.py", "d1", [])
+
+            deleted = cache.prune(["a.py", "b.py"], keep=2)
+
+            assert deleted == 1
+            assert cache.get("a.py", "d1") is None
+            assert cache.get("a.py", "d2") == []
+            assert cache.get("a.py", "d3") == []
+            assert cache.get("b.py", "d1") == []
@@ -437,3 +437,80 @@ class TestParseFile:
         assert len(nodes) == 1
         assert nodes[0].type == "import"
         assert nodes[0].name == "os"
+
+
+class TestIncrementalReparse:
+    """Test suite for tree reuse in parse_file() with tree_cache_size > 0."""
+
+    VERSIONS = [
+        "import os\ndef a():\n    pass\n",
+        "import os\nimport sys\ndef a():\n    pass\nclass B:\n    def c(self): pass\n",
+        "class B:\n    def c(self): pass\n",
+        "class B:\n    def c(self): pass\n",
+        "def ä(): pass\ndef b(): pass\n",
+        "def b(): pass\n",
+        "",
+        "x = 1\n",
+    ]
+
+    def test_incremental_results_match_full_parse(self) -> None:
+        """Reparsing edited versions yields the same nodes as a fresh parse."""
+        incremental = ParserEngine(tree_cache_size=4)
+        fresh = ParserEngine()
+        path = Path("module.py")
+
+        for code in self.VERSIONS:
+            assert incremental.parse_file(path, code) == fresh.parse_file(path, code)
+
+    def test_previous_tree_is_passed_to_parser(self) -> None:
+        """The second parse of a path reuses the cached tree."""
+        engine = ParserEngine(tree_cache_size=4)
+        path = Path("module.py")
+        engine.parse_file(path, "def a(): pass\n")
+
+        with patch.object(engine, "_parse_source", wraps=engine._parse_source) as spy:
+            nodes = engine.parse_file(path, "def a(): pass\ndef b(): pass\n")
+
+        assert spy.call_args.args[2] is not None
+        assert [n.name for n in nodes] == ["a", "b"]
+
+    def test_tree_cache_is_bounded_lru(self) -> None:
+        """Least recently parsed paths are evicted beyond tree_cache_size."""
+        engine = ParserEngine(tree_cache_size=2)
+        for name in ("a.py", "b.py", "c.py"):
+            engine.parse_file(Path(name), "x = 1\n")
+
+        assert list(engine._tree_cache) == [Path("b.py"), Path("c.py")]
+
+    def test_discard_tree_drops_cached_tree(self) -> None:
+        """discard_tree() removes a path and ignores unknown paths."""
+        engine = ParserEngine(tree_cache_size=2)
+        engine.parse_file(Path("a.py"), "x = 1\n")
+
+        engine.discard_tree(Path("a.py"))
+        engine.discard_tree(Path("missing.py"))
+
+        assert not engine._tree_cache
+
+    def test_tree_cache_disabled_by_default(self) -> None:
+        """Without tree_cache_size no trees are retained."""
+        engine = ParserEngine()
+        engine.parse_file(Path("a.py"), "x = 1\n")
+
+        assert not engine._tree_cache
+
+    def test_shrinking_tree_cache_evicts_oldest(self) -> None:
+        """Lowering tree_cache_size drops the least recently parsed trees."""
+        engine = ParserEngine(tree_cache_size=3)
+        for name in ("a.py", "b.py", "c.py"):
+            engine.parse_file(Path(name), "x = 1\n")
+
+        engine.tree_cache_size = 1
+
+        assert engine.tree_cache_size == 1
+        assert list(engine._tree_cache) == [Path("c.py")]
+
+    def test_negative_tree_cache_size_raises(self) -> None:
+        """A negative size is rejected."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            ParserEngine(tree_cache_size=-1)
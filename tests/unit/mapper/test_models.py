@@ -24,6 +24,12 @@ class TestCodeNode:
         with pytest.raises(FrozenInstanceError):
             node.name = "bar"
 
+    def test_codenode_uses_slots(self):
+        """Test CodeNode stores fields in slots instead of a per-instance dict."""
+        node = CodeNode(type="function", name="foo", start_line=1, end_line=3)
+        assert CodeNode.__slots__ == ("type", "name", "start_line", "end_line")
+        assert not hasattr(node, "__dict__")
+
     def test_codenode_equality(self):
         """Test CodeNode equality comparison."""
         node1 = CodeNode(type="function", name="foo", start_line=1, end_line=3)
@@ -54,6 +54,12 @@ class TestFileEntry:
         with pytest.raises(FrozenInstanceError):
             entry.size = 200
 
+    def test_file_entry_uses_slots(self):
+        """Test FileEntry stores fields in slots instead of a per-instance dict."""
+        entry = FileEntry(path=Path("/test.py"), size=100, token_est=28)
+        assert FileEntry.__slots__ == ("path", "size", "token_est")
+        assert not hasattr(entry, "__dict__")
+
     def test_file_entry_all_attributes_accessible(self):
         """Test all FileEntry attributes are accessible."""
         path = Path("/project/data/config.json")